@@ -0,0 +1,45 @@
+"""player stats table and game rating snapshots
+
+Revision ID: 3f1c2b7d9a41
+Revises: 16aa059486e8
+Create Date: 2026-10-17 10:30:00.000000
+
+Backfill after upgrading with ``python -m src.cli rebuild-player-stats``.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c2b7d9a41'
+down_revision: Union[str, Sequence[str], None] = '16aa059486e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('games', sa.Column('white_rating', sa.Integer(), nullable=True))
+    op.add_column('games', sa.Column('black_rating', sa.Integer(), nullable=True))
+    op.create_table('player_stats',
+    sa.Column('player_id', sa.UUID(), nullable=False),
+    sa.Column('tournament_id', sa.UUID(), nullable=False),
+    sa.Column('games_played', sa.Integer(), nullable=False),
+    sa.Column('wins', sa.Integer(), nullable=False),
+    sa.Column('losses', sa.Integer(), nullable=False),
+    sa.Column('draws', sa.Integer(), nullable=False),
+    sa.Column('opponent_rating_sum', sa.BigInteger(), nullable=False),
+    sa.Column('opponent_rating_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['player_id'], ['players.player_id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['tournament_id'], ['tournaments.tournament_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('player_id', 'tournament_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('player_stats')
+    op.drop_column('games', 'black_rating')
+    op.drop_column('games', 'white_rating')
@@ -0,0 +1,48 @@
+"""indexes for the hot foreign keys and played_at
+
+Revision ID: 8b4e6d2f1c07
+Revises: 3f1c2b7d9a41
+Create Date: 2026-10-17 11:00:00.000000
+
+Built CONCURRENTLY so existing tables stay writable while they build.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b4e6d2f1c07'
+down_revision: Union[str, Sequence[str], None] = '3f1c2b7d9a41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('ix_games_player_white_id_played_at', 'games', ['player_white_id', 'played_at']),
+    ('ix_games_player_black_id_played_at', 'games', ['player_black_id', 'played_at']),
+    ('ix_games_tournament_id_played_at', 'games', ['tournament_id', 'played_at']),
+    ('ix_games_played_at', 'games', ['played_at']),
+    ('ix_violations_player_id', 'violations', ['player_id']),
+    ('ix_violations_game_id', 'violations', ['game_id']),
+    ('ix_mentors_mentor_id', 'mentors', ['mentor_id']),
+    ('ix_game_player_player_id', 'game_player', ['player_id']),
+    ('ix_player_stats_tournament_id', 'player_stats', ['tournament_id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns, postgresql_concurrently=True, if_not_exists=True
+            )
+    op.execute(sa.text('ANALYZE games, violations, mentors, game_player, player_stats'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,63 @@
+"""write counters behind the list ETags
+
+Revision ID: a3c7e5f9d1b4
+Revises: f1a7d3e9c5b2
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c7e5f9d1b4'
+down_revision: Union[str, Sequence[str], None] = 'f1a7d3e9c5b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Table -> resources whose ETag changes when it is written
+TRIGGERS = {
+    'tournaments': ('tournaments',),
+    'players': ('players', 'leaderboard'),
+    'player_stats': ('leaderboard',),
+    'skill_level': ('leaderboard',),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('resource_versions',
+    sa.Column('resource', sa.String(), nullable=False),
+    sa.Column('backend_pid', sa.Integer(), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('resource', 'backend_pid')
+    )
+    op.execute("""
+    CREATE OR REPLACE FUNCTION bump_resource_versions() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        INSERT INTO resource_versions (resource, backend_pid, version)
+        SELECT resource, pg_backend_pid(), 1 FROM unnest(TG_ARGV) AS resource
+        ON CONFLICT (resource, backend_pid)
+        DO UPDATE SET version = resource_versions.version + 1;
+        RETURN NULL;
+    END
+    $$
+    """)
+    for table, resources in TRIGGERS.items():
+        arguments = ', '.join(f"'{resource}'" for resource in resources)
+        op.execute(
+            f"CREATE TRIGGER {table}_bump_resource_versions "
+            f"AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table} "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION bump_resource_versions({arguments})"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TRIGGERS:
+        op.execute(f"DROP TRIGGER {table}_bump_resource_versions ON {table}")
+    op.execute("DROP FUNCTION bump_resource_versions()")
+    op.drop_table('resource_versions')
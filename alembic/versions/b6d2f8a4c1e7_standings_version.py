@@ -0,0 +1,39 @@
+"""write counter behind the cached standings
+
+Revision ID: b6d2f8a4c1e7
+Revises: a3c7e5f9d1b4
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6d2f8a4c1e7'
+down_revision: Union[str, Sequence[str], None] = 'a3c7e5f9d1b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _trigger(table: str, resources: tuple[str, ...]) -> str:
+    arguments = ', '.join(f"'{resource}'" for resource in resources)
+    return (
+        f"CREATE OR REPLACE TRIGGER {table}_bump_resource_versions "
+        f"AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table} "
+        f"FOR EACH STATEMENT EXECUTE FUNCTION bump_resource_versions({arguments})"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(_trigger('games', ('standings',)))
+    op.execute(_trigger('players', ('players', 'leaderboard', 'standings')))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(_trigger('players', ('players', 'leaderboard')))
+    op.execute("DROP TRIGGER games_bump_resource_versions ON games")
+    op.execute("DELETE FROM resource_versions WHERE resource = 'standings'")
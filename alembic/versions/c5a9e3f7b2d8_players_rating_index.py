@@ -0,0 +1,35 @@
+"""index players by rating for the leaderboard
+
+Revision ID: c5a9e3f7b2d8
+Revises: 8b4e6d2f1c07
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5a9e3f7b2d8'
+down_revision: Union[str, Sequence[str], None] = '8b4e6d2f1c07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_players_rating_player_id', 'players', ['rating', 'player_id'],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_players_rating_player_id', table_name='players',
+            postgresql_concurrently=True, if_exists=True,
+        )
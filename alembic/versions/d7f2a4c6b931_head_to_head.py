@@ -0,0 +1,42 @@
+"""head to head totals per pair of players
+
+Revision ID: d7f2a4c6b931
+Revises: c5a9e3f7b2d8
+Create Date: 2026-10-17 14:00:00.000000
+
+Backfill after upgrading with ``python -m src.cli rebuild-player-stats``.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7f2a4c6b931'
+down_revision: Union[str, Sequence[str], None] = 'c5a9e3f7b2d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('head_to_head',
+    sa.Column('player_low_id', sa.UUID(), nullable=False),
+    sa.Column('player_high_id', sa.UUID(), nullable=False),
+    sa.Column('games_played', sa.Integer(), nullable=False),
+    sa.Column('low_wins', sa.Integer(), nullable=False),
+    sa.Column('high_wins', sa.Integer(), nullable=False),
+    sa.Column('draws', sa.Integer(), nullable=False),
+    sa.CheckConstraint('player_low_id < player_high_id', name='ck_head_to_head_pair_order'),
+    sa.ForeignKeyConstraint(['player_low_id'], ['players.player_id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['player_high_id'], ['players.player_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('player_low_id', 'player_high_id')
+    )
+    op.create_index('ix_head_to_head_player_high_id', 'head_to_head', ['player_high_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_head_to_head_player_high_id', table_name='head_to_head')
+    op.drop_table('head_to_head')
@@ -0,0 +1,38 @@
+"""round number on games
+
+Revision ID: e4b8c1d5a2f6
+Revises: d7f2a4c6b931
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b8c1d5a2f6'
+down_revision: Union[str, Sequence[str], None] = 'd7f2a4c6b931'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('games', sa.Column('round_number', sa.Integer(), nullable=True))
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_games_tournament_id_round_number', 'games', ['tournament_id', 'round_number'],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_games_tournament_id_round_number', table_name='games',
+            postgresql_concurrently=True, if_exists=True,
+        )
+    op.drop_column('games', 'round_number')
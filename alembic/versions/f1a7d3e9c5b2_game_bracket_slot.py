@@ -0,0 +1,48 @@
+"""knockout bracket slot on games
+
+Revision ID: f1a7d3e9c5b2
+Revises: e4b8c1d5a2f6
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1a7d3e9c5b2'
+down_revision: Union[str, Sequence[str], None] = 'e4b8c1d5a2f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('games', sa.Column('slot', sa.Integer(), nullable=True))
+    with op.get_context().autocommit_block():
+        # The unique index also serves the (tournament_id, round_number) lookups
+        op.create_index(
+            'ix_games_tournament_id_round_number_slot', 'games',
+            ['tournament_id', 'round_number', 'slot'], unique=True,
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_games_tournament_id_round_number', table_name='games',
+            postgresql_concurrently=True, if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_games_tournament_id_round_number', 'games', ['tournament_id', 'round_number'],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_games_tournament_id_round_number_slot', table_name='games',
+            postgresql_concurrently=True, if_exists=True,
+        )
+    op.drop_column('games', 'slot')
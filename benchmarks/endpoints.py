@@ -0,0 +1,411 @@
+"""Latency, throughput and memory of every router, driven through the ASGI app.
+
+    python -m benchmarks.endpoints run --games 1000 100000 1000000 --output baseline.json
+    python -m benchmarks.endpoints compare baseline.json current.json --threshold 0.15
+
+``run`` seeds one schema per dataset size (``<schema>_<games>``) with the
+generator of ``benchmarks.query_plans``, points the app's session
+dependencies at it and sends ``--requests`` requests per case from
+``--concurrency`` clients over an in-process ASGI transport, so the
+numbers cover routing, validation, services, queries and serialization
+but no network. Each case records p50/p95/p99 latency, throughput, errors
+and the peak resident memory seen while it ran.
+
+Caches are emptied before each dataset but not between requests, so the
+cached endpoints report their steady state, as production would see it.
+With DB_ASYNC=true the async twins of the routers are the ones measured.
+List endpoints that can page are requested one page at a time; the
+unpaged lists grow with the dataset and are covered by
+``benchmarks.json_responses``.
+
+``compare`` matches cases by dataset and name and exits with status 1
+when a latency percentile or the peak memory grows, or the throughput
+drops, by more than ``--threshold``.
+"""
+import argparse
+import asyncio
+import json
+import platform
+import resource
+import statistics
+import sys
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from datetime import date
+from uuid import UUID
+
+import httpx
+from sqlalchemy import Engine, text
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.query_plans import bench_engine, pick_sample, seed
+from src.db.dependencies import get_async_db, get_db
+from src.main import app
+from src.services.cache import CACHES
+from src.settings import settings
+
+# Latency differences below this are noise, whatever the ratio
+MIN_REGRESSION_MS = 0.5
+
+
+@dataclass
+class Sample:
+    """Ids and values the cases request, picked from the seeded data."""
+
+    player_id: UUID
+    opponent_id: UUID
+    tournament_id: UUID
+    mentor_id: UUID
+    played_date: date
+    game_id: UUID
+    violation_id: UUID
+    last_name: str
+    rating: int
+
+
+@dataclass
+class Case:
+    method: str
+    # Formatted with the Sample's fields
+    path: str
+    params: Callable[[Sample], dict] = lambda k: {}
+    body: Callable[[Sample], dict] | None = None
+    label: str = ""
+
+    @property
+    def name(self) -> str:
+        return f"{self.method} {self.path}{self.label}"
+
+
+CASES = [
+    # Games
+    Case("GET", "/games/all", lambda k: {"limit": 100}, label="?limit=100"),
+    Case("GET", "/games/id", lambda k: {"game_id": k.game_id}),
+    Case("GET", "/games/date", lambda k: {"SearchDate": k.played_date}),
+    Case("GET", "/games/tournament", lambda k: {"tournament_id": k.tournament_id}),
+    Case("GET", "/games/export", lambda k: {"player_id": k.player_id}, label="?player_id"),
+    Case("GET", "/games/head-to-head", lambda k: {"player1_id": k.player_id, "player2_id": k.opponent_id}),
+    Case(
+        "POST",
+        "/games/head-to-head/batch",
+        body=lambda k: {"player_ids": [str(k.player_id), str(k.opponent_id), str(k.mentor_id)]},
+    ),
+    # Tournaments
+    Case("GET", "/tournaments"),
+    Case("GET", "/tournaments/{tournament_id}"),
+    Case("GET", "/tournaments/participants/{tournament_id}"),
+    Case("GET", "/tournaments/standings/{tournament_id}"),
+    # Skill levels
+    Case("GET", "/skill-levels"),
+    Case("GET", "/skill-levels/lookup", lambda k: {"player_id": k.player_id}),
+    Case(
+        "POST",
+        "/skill-levels/classify",
+        body=lambda k: {"player_ids": [str(k.player_id), str(k.opponent_id)], "ratings": [900, 1500, 2300]},
+    ),
+    # Players
+    Case("GET", "/players/search/all", lambda k: {"limit": 100}, label="?limit=100"),
+    Case("GET", "/players/search/by-id", lambda k: {"player_id": k.player_id}),
+    Case("GET", "/players/search/by-last-name", lambda k: {"last_name": k.last_name}),
+    Case(
+        "GET",
+        "/players/search/by-rating-range",
+        lambda k: {"rating_lower": k.rating, "rating_upper": k.rating + 10},
+    ),
+    # A write that leaves the data as it was: same rating, caches invalidated every time
+    Case("PATCH", "/players/update/rating-by-id", lambda k: {"player_id": k.player_id, "rating": k.rating}),
+    # Mentorships
+    Case("GET", "/mentorships/search/by-mentor-id", lambda k: {"mentor_id": k.mentor_id}),
+    Case("GET", "/mentorships/search/by-player-id", lambda k: {"player_id": k.player_id}),
+    # Violations
+    Case("GET", "/violations/all", lambda k: {"limit": 100}, label="?limit=100"),
+    Case("GET", "/violations/by-id", lambda k: {"violation_id": k.violation_id}),
+    Case("GET", "/violations/by-player", lambda k: {"player_id": k.player_id}),
+    # Relations
+    Case("GET", "/relations/player-summary-by-id", lambda k: {"player_id": k.player_id}),
+    Case("GET", "/relations/top-players", lambda k: {"limit": 50}, label="?limit=50"),
+    Case("GET", "/relations/player-match-history/{player_id}", lambda k: {"limit": 50}, label="?limit=50"),
+    # Game players
+    Case("GET", "/game-players", lambda k: {"limit": 100}, label="?limit=100"),
+    # Operational endpoints
+    Case("GET", "/database/pool-stats"),
+    Case("GET", "/cache/stats"),
+    Case("GET", "/metrics"),
+]
+
+
+def pick_endpoint_sample(engine: Engine) -> Sample:
+    base = pick_sample(engine)
+    with engine.connect() as conn:
+        game_id = conn.execute(
+            text(
+                "SELECT game_id FROM games WHERE player_white_id = :p OR player_black_id = :p "
+                "ORDER BY game_id LIMIT 1"
+            ),
+            {"p": base.player_id},
+        ).scalar_one()
+        violation_id = conn.execute(
+            text("SELECT violation_id FROM violations ORDER BY violation_id LIMIT 1")
+        ).scalar_one()
+        last_name, rating = conn.execute(
+            text("SELECT last_name, rating FROM players WHERE player_id = :p"), {"p": base.player_id}
+        ).one()
+    return Sample(**asdict(base), game_id=game_id, violation_id=violation_id, last_name=last_name, rating=rating)
+
+
+def _rss_bytes() -> int | None:
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        return None
+
+
+def _max_rss_bytes() -> int:
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+@dataclass
+class RssSampler:
+    """Highest resident set size seen while the ``with`` block runs."""
+
+    interval: float = 0.005
+    peak: int = 0
+    _stop: threading.Event = field(default_factory=threading.Event)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, _rss_bytes() or 0)
+
+    def __enter__(self):
+        self.peak = _rss_bytes() or 0
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        # Without /proc the process-wide high-water mark is the best available
+        self.peak = max(self.peak, _rss_bytes() or 0) or _max_rss_bytes()
+
+
+def _percentile(sorted_ms: list[float], fraction: float) -> float:
+    if len(sorted_ms) == 1:
+        return sorted_ms[0]
+    return statistics.quantiles(sorted_ms, n=100, method="inclusive")[round(fraction * 100) - 1]
+
+
+async def run_case(client: httpx.AsyncClient, case: Case, sample: Sample, requests: int, concurrency: int, warmup: int) -> dict:
+    path = case.path.format(**asdict(sample))
+    params = {key: str(value) for key, value in case.params(sample).items()}
+    body = case.body(sample) if case.body else None
+
+    async def send() -> tuple[float, int]:
+        started = time.perf_counter()
+        response = await client.request(case.method, path, params=params, json=body)
+        return (time.perf_counter() - started) * 1000, response.status_code
+
+    for _ in range(warmup):
+        await send()
+
+    timings: list[float] = []
+    errors: dict[str, int] = {}
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            elapsed_ms, status = await send()
+            timings.append(elapsed_ms)
+            if status >= 400:
+                errors[str(status)] = errors.get(str(status), 0) + 1
+
+    with RssSampler() as rss:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        wall = time.perf_counter() - started
+
+    timings.sort()
+    return {
+        "requests": len(timings),
+        "errors": errors,
+        "p50_ms": round(_percentile(timings, 0.50), 3),
+        "p95_ms": round(_percentile(timings, 0.95), 3),
+        "p99_ms": round(_percentile(timings, 0.99), 3),
+        "max_ms": round(timings[-1], 3),
+        "throughput_rps": round(len(timings) / wall, 1),
+        "peak_rss_mb": round(rss.peak / 2**20, 1),
+    }
+
+
+def _use_schema(engine: Engine, async_engine: AsyncEngine) -> None:
+    factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    async_factory = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+    def bench_db():
+        with factory() as db:
+            yield db
+
+    async def bench_async_db():
+        async with async_factory() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = bench_db
+    app.dependency_overrides[get_async_db] = bench_async_db
+    for cache in CACHES:
+        cache.invalidate()
+
+
+async def run_dataset(args, games: int) -> dict:
+    schema = f"{args.schema}_{games}"
+    engine = bench_engine(args.database_url, schema)
+    if not args.reuse:
+        started = time.perf_counter()
+        sizes = {
+            "games": games,
+            "players": max(100, games // 50),
+            "tournaments": max(4, games // 2500),
+            "seed": args.seed,
+        }
+        seed(engine, schema, sizes)
+        print(f"Seeded {games} games into {schema} in {time.perf_counter() - started:.1f}s")
+    async_engine = create_async_engine(
+        args.database_url,
+        connect_args={"options": f"-csearch_path={schema}"},
+        pool_size=args.concurrency,
+    )
+    sample = pick_endpoint_sample(engine)
+    _use_schema(engine, async_engine)
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            for case in CASES:
+                if args.only and not any(part in case.name for part in args.only):
+                    continue
+                result = await run_case(client, case, sample, args.requests, args.concurrency, args.warmup)
+                results[case.name] = result
+                failed = f"  errors {result['errors']}" if result["errors"] else ""
+                print(
+                    f"{games:>8} {case.name:<58} {result['p50_ms']:>8.2f} {result['p95_ms']:>8.2f}"
+                    f" {result['p99_ms']:>8.2f} {result['throughput_rps']:>8.1f} {result['peak_rss_mb']:>8.1f}{failed}"
+                )
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_async_db, None)
+        await async_engine.dispose()
+        engine.dispose()
+    return results
+
+
+async def run(args) -> None:
+    report = {
+        "parameters": vars(args) | {"database_url": None, "func": None},
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "db_async": settings.DB_ASYNC,
+            "fast_json_lists": settings.FAST_JSON_LISTS,
+        },
+        "datasets": {},
+    }
+    print(f"{'games':>8} {'case':<58} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'req/s':>8} {'rss MB':>8}")
+    for games in args.games:
+        report["datasets"][str(games)] = await run_dataset(args, games)
+    report["peak_rss_mb"] = round(_max_rss_bytes() / 2**20, 1)
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(report, fh, indent=2)
+        print(f"Report written to {args.output}")
+
+
+def regressions(baseline: dict, current: dict, threshold: float) -> tuple[list[str], list[str]]:
+    """Lines describing each regression, and the cases only one of the runs has."""
+    found, unmatched = [], []
+    for dataset in sorted(baseline["datasets"].keys() | current["datasets"].keys(), key=int):
+        before_cases = baseline["datasets"].get(dataset, {})
+        after_cases = current["datasets"].get(dataset, {})
+        for name in sorted(before_cases.keys() | after_cases.keys()):
+            before, after = before_cases.get(name), after_cases.get(name)
+            if before is None or after is None:
+                unmatched.append(f"{dataset:>8} {name}: only in the {'current' if before is None else 'baseline'} run")
+                continue
+            for metric in ("p50_ms", "p95_ms", "p99_ms"):
+                if (
+                    after[metric] > before[metric] * (1 + threshold)
+                    and after[metric] - before[metric] >= MIN_REGRESSION_MS
+                ):
+                    found.append(f"{dataset:>8} {name}: {metric} {before[metric]:.2f} -> {after[metric]:.2f}")
+            if after["throughput_rps"] < before["throughput_rps"] / (1 + threshold):
+                found.append(
+                    f"{dataset:>8} {name}: throughput_rps {before['throughput_rps']:.1f} -> {after['throughput_rps']:.1f}"
+                )
+            if after["peak_rss_mb"] > before["peak_rss_mb"] * (1 + threshold):
+                found.append(f"{dataset:>8} {name}: peak_rss_mb {before['peak_rss_mb']:.1f} -> {after['peak_rss_mb']:.1f}")
+            if sum(after["errors"].values()) > sum(before["errors"].values()):
+                found.append(f"{dataset:>8} {name}: errors {before['errors']} -> {after['errors']}")
+    return found, unmatched
+
+
+def compare(args) -> None:
+    with open(args.baseline) as fh:
+        baseline = json.load(fh)
+    with open(args.current) as fh:
+        current = json.load(fh)
+    found, unmatched = regressions(baseline, current, args.threshold)
+    for line in unmatched:
+        print(line)
+    if not found:
+        print(f"No regressions beyond {args.threshold:.0%}")
+        return
+    print(f"{len(found)} regression(s) beyond {args.threshold:.0%}:")
+    for line in found:
+        print(line)
+    sys.exit(1)
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.endpoints")
+    commands = parser.add_subparsers(required=True)
+
+    run_parser = commands.add_parser("run", help="Benchmark every case and write a JSON report")
+    run_parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    run_parser.add_argument("--schema", default="bench_endpoints", help="Prefix of the per-size schemas")
+    run_parser.add_argument("--games", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    run_parser.add_argument("--seed", type=float, default=0.42, help="setseed() value, -1..1")
+    run_parser.add_argument("--requests", type=_positive_int, default=200, help="Measured requests per case")
+    run_parser.add_argument("--warmup", type=int, default=5)
+    run_parser.add_argument("--concurrency", type=_positive_int, default=4)
+    run_parser.add_argument("--only", nargs="+", help="Run the cases whose name contains any of these")
+    run_parser.add_argument("--reuse", action="store_true", help="Keep the already seeded schemas")
+    run_parser.add_argument("--output", help="Write the report as JSON")
+    run_parser.set_defaults(func=lambda args: asyncio.run(run(args)))
+
+    compare_parser = commands.add_parser("compare", help="Flag regressions between two reports")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10, help="Allowed relative change")
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
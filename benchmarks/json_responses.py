@@ -0,0 +1,160 @@
+"""Large list responses: response-model validation + json vs rows + orjson.
+
+    python -m benchmarks.json_responses --rows 10000 100000 --output json_responses.json
+
+Reads from the schema seeded by ``benchmarks.query_plans`` (``--schema``,
+default ``bench``). For each size it fetches that many games and players
+once as ORM objects and once as column rows, then serves them through
+``/games/all`` and ``/players/search/all`` with FAST_JSON_LISTS off and on.
+The service is replaced by one returning the prefetched data as a single
+page, whatever the endpoint's page size, so the response timings cover
+only validation and encoding; the fetch timings
+are reported next to them. Both paths must produce the same JSON.
+"""
+import argparse
+import json
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import orjson
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Query, Session, sessionmaker
+
+from benchmarks.query_plans import bench_engine
+from src.api.game_endpoints import get_game_service
+from src.api.player_endpoints import get_player_service
+from src.db.dependencies import get_db
+from src.domain.game import Game
+from src.domain.player import Player
+from src.main import app
+from src.repositories.game_repository import GameRepository
+from src.repositories.player_repository import PlayerRepository
+from src.settings import settings
+
+
+@dataclass
+class Resource:
+    path: str
+    dependency: Callable
+    objects: Callable[[Session], Query]
+    rows: Callable[[Session], Query]
+    # Service page methods the endpoint calls on each path
+    objects_method: str
+    rows_method: str
+
+
+RESOURCES = {
+    "games": Resource(
+        "/games/all",
+        get_game_service,
+        lambda session: session.query(Game).order_by(Game.game_id),
+        lambda session: session.query(*GameRepository._GAME_READ_COLUMNS).order_by(Game.game_id),
+        "get_games_page",
+        "get_game_rows_page",
+    ),
+    "players": Resource(
+        "/players/search/all",
+        get_player_service,
+        lambda session: session.query(Player).order_by(Player.player_id),
+        lambda session: session.query(*PlayerRepository._PLAYER_READ_COLUMNS).order_by(Player.player_id),
+        "get_page",
+        "get_rows_page",
+    ),
+}
+
+
+class _Prefetched:
+    """Stands in for the service, handing out the same lists as one page every call."""
+
+    def __init__(self, resource: Resource, objects: list, rows: list):
+        setattr(self, resource.objects_method, lambda limit, cursor=None: (objects, None))
+        setattr(self, resource.rows_method, lambda limit, cursor=None: (rows, None))
+
+
+def _median_ms(action: Callable[[], object], repeat: int) -> tuple[float, object]:
+    timings, result = [], None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = action()
+        timings.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(timings), 3), result
+
+
+def _fetch(factory: sessionmaker, query: Callable[[Session], Query], size: int) -> list:
+    # A fresh session per run so the identity map doesn't serve later runs
+    with factory() as session:
+        return query(session).limit(size).all()
+
+
+def run_case(factory: sessionmaker, client: TestClient, resource: Resource, size: int, repeat: int) -> dict:
+    fetch_objects_ms, objects = _median_ms(lambda: _fetch(factory, resource.objects, size), repeat)
+    fetch_rows_ms, rows = _median_ms(lambda: _fetch(factory, resource.rows, size), repeat)
+    app.dependency_overrides[resource.dependency] = lambda: _Prefetched(resource, objects, rows)
+    try:
+        settings.FAST_JSON_LISTS = False
+        model_ms, model_body = _median_ms(lambda: client.get(resource.path).content, repeat)
+        settings.FAST_JSON_LISTS = True
+        fast_ms, fast_body = _median_ms(lambda: client.get(resource.path).content, repeat)
+    finally:
+        settings.FAST_JSON_LISTS = False
+        app.dependency_overrides.pop(resource.dependency, None)
+    if orjson.loads(model_body) != orjson.loads(fast_body):
+        raise AssertionError(f"{resource.path}: the two paths returned different JSON")
+    return {
+        "rows": len(rows),
+        "fetch_objects_ms": fetch_objects_ms,
+        "fetch_rows_ms": fetch_rows_ms,
+        "response_model_ms": model_ms,
+        "fast_json_ms": fast_ms,
+        "identical_bytes": model_body == fast_body,
+        "body_bytes": len(fast_body),
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.json_responses")
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument("--schema", default="bench")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--resources", nargs="+", choices=RESOURCES, default=list(RESOURCES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="Write the report as JSON")
+    args = parser.parse_args(argv)
+
+    engine = bench_engine(args.database_url, args.schema)
+    factory = sessionmaker(bind=engine)
+    client = TestClient(app)
+
+    # The ETag check of /players/search/all reads its counter from the bench schema
+    def bench_db():
+        with factory() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = bench_db
+
+    report = []
+    print(f"{'case':<22} {'rows':>8} {'fetch orm':>10} {'fetch rows':>10} {'model ms':>10} {'fast ms':>10} {'speedup':>8}")
+    for name in args.resources:
+        for size in args.rows:
+            case = run_case(factory, client, RESOURCES[name], size, args.repeat)
+            report.append({"resource": name, "requested_rows": size} | case)
+            total_model = case["fetch_objects_ms"] + case["response_model_ms"]
+            total_fast = case["fetch_rows_ms"] + case["fast_json_ms"]
+            print(
+                f"{name:<22} {case['rows']:>8} {case['fetch_objects_ms']:>10.1f} {case['fetch_rows_ms']:>10.1f}"
+                f" {case['response_model_ms']:>10.1f} {case['fast_json_ms']:>10.1f}"
+                f" {case['response_model_ms'] / max(case['fast_json_ms'], 1e-9):>7.1f}x"
+                f"  (end to end {total_model / max(total_fast, 1e-9):.1f}x)"
+            )
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump({"parameters": vars(args) | {"database_url": None}, "cases": report}, fh, indent=2)
+        print(f"Report written to {args.output}")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+"""Repository query latency and plans with and without the lookup indexes.
+
+    python -m benchmarks.query_plans --games 1000000 --output query_plans.json
+
+Seeds a synthetic dataset into its own schema (``--schema``, default
+``bench``) of the configured database, runs every case once without the
+indexes declared on the models ("before") and once with them ("after"),
+and records the median latency plus ``EXPLAIN (ANALYZE, BUFFERS)`` of
+each statement the repository issued.
+"""
+import argparse
+import json
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date
+from itertools import chain
+from uuid import UUID
+
+from sqlalchemy import Engine, create_engine, event, text
+from sqlalchemy.orm import Session, sessionmaker
+
+import src.domain  # noqa: F401  (registers every table on Base.metadata)
+from src.base import Base
+from src.repositories.game_repository import GameRepository
+from src.repositories.mentorship_repository import MentorshipRepository
+from src.repositories.player_stats import rebuild_player_stats
+from src.repositories.relations_repository import RelationsRepository
+from src.repositories.tournament_repository import TournamentRepository
+from src.repositories.violation_repository import ViolationRepository
+from src.settings import settings
+
+_SEED_STATEMENTS = [
+    "SELECT setseed(:seed)",
+    """
+    INSERT INTO skill_level (title, rating_lower_bound, rating_upper_bound) VALUES
+        ('Beginner', 0, 1199), ('Intermediate', 1200, 1799),
+        ('Advanced', 1800, 2199), ('Master', 2200, 4000)
+    """,
+    """
+    INSERT INTO tournaments (tournament_id, name, start_date, end_date, location)
+    SELECT gen_random_uuid(), 'Bench ' || n, d, d + 3, 'Bench City'
+    FROM generate_series(1, :tournaments) AS n,
+         LATERAL (SELECT DATE '2023-01-01' + (random() * 1000)::int AS d) AS start
+    """,
+    """
+    INSERT INTO players (player_id, first_name, last_name, rating)
+    SELECT gen_random_uuid(), 'Bench', 'Player ' || n, 800 + (random() * 2000)::int
+    FROM generate_series(1, :players) AS n
+    """,
+    """
+    INSERT INTO games (game_id, tournament_id, player_white_id, player_black_id, result, played_at)
+    SELECT
+        gen_random_uuid(),
+        t.ids[1 + floor(random() * :tournaments)::int],
+        p.ids[1 + pick.white],
+        -- any other player: white's index shifted by 1..players-1, wrapped
+        p.ids[1 + (pick.white + 1 + floor(random() * (:players - 1))::int) % :players],
+        CASE WHEN random() < 0.05 THEN NULL
+             ELSE (ARRAY['WHITE_WIN', 'BLACK_WIN', 'DRAW'])[1 + floor(random() * 3)::int]::win_state
+        END,
+        TIMESTAMPTZ '2023-01-01' + random() * INTERVAL '1000 days'
+    FROM (SELECT floor(random() * :players)::int AS white FROM generate_series(1, :games)) AS pick,
+         (SELECT array_agg(player_id) AS ids FROM players) AS p,
+         (SELECT array_agg(tournament_id) AS ids FROM tournaments) AS t
+    """,
+    """
+    INSERT INTO violations (violation_id, player_id, game_id, violation_type, violation_date)
+    SELECT gen_random_uuid(), g.player_white_id, g.game_id, 'Late arrival', g.played_at
+    FROM games AS g TABLESAMPLE BERNOULLI (1)
+    WHERE g.player_white_id IS NOT NULL AND g.played_at IS NOT NULL
+    """,
+    """
+    INSERT INTO mentors (player_id, mentor_id)
+    SELECT p.player_id, m.ids[1 + floor(random() * :players)::int]
+    FROM players AS p, (SELECT array_agg(player_id) AS ids FROM players) AS m
+    WHERE random() < 0.5
+    ON CONFLICT DO NOTHING
+    """,
+]
+
+
+@dataclass
+class Sample:
+    """Ids the cases look up, picked from the seeded data."""
+
+    player_id: UUID
+    opponent_id: UUID
+    tournament_id: UUID
+    mentor_id: UUID
+    played_date: date
+
+
+def _consume_stream(repo: GameRepository, player_id: UUID) -> list:
+    return list(chain.from_iterable(repo.stream_games(player_id=player_id)))
+
+
+CASES: dict[str, Callable[[Session, Sample], object]] = {
+    "games.find_games_by_player_id": lambda s, k: GameRepository(s).find_games_by_player_id(k.player_id),
+    "games.find_games_by_player_white_id": lambda s, k: GameRepository(s).find_games_by_player_white_id(k.player_id),
+    "games.find_games_by_player_black_id": lambda s, k: GameRepository(s).find_games_by_player_black_id(k.player_id),
+    "games.find_games_by_tournament_id": lambda s, k: GameRepository(s).find_games_by_tournament_id(k.tournament_id),
+    "games.find_games_by_played_date": lambda s, k: GameRepository(s).find_games_by_played_date(k.played_date),
+    "games.stream_games(player_id)": lambda s, k: _consume_stream(GameRepository(s), k.player_id),
+    "games.get_rating_inputs": lambda s, k: GameRepository(s).get_rating_inputs({k.player_id, k.opponent_id}),
+    "violations.get_by_player_id": lambda s, k: ViolationRepository(s).get_by_player_id(k.player_id),
+    "mentors.get_by_mentor_id": lambda s, k: MentorshipRepository(s).get_by_mentor_id(k.mentor_id),
+    "relations.get_player_summary_by_id": lambda s, k: RelationsRepository(s).get_player_summary_by_id(k.player_id),
+    "relations.get_player_match_history": lambda s, k: RelationsRepository(s).get_player_match_history(k.player_id),
+    "tournaments.get_participants_by_tournament_id": lambda s, k: TournamentRepository(s).get_participants_by_tournament_id(k.tournament_id),
+}
+
+
+class StatementRecorder:
+    """Collects the SELECTs an engine runs while ``recording`` is set."""
+
+    def __init__(self, engine: Engine):
+        self.recording = False
+        self.statements: list[tuple[str, object]] = []
+        event.listen(engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        if self.recording and statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            self.statements.append((statement, parameters))
+
+
+def bench_engine(database_url: str, schema: str) -> Engine:
+    # Unqualified names (ORM and raw SQL alike) resolve inside the bench schema
+    return create_engine(database_url, connect_args={"options": f"-csearch_path={schema}"})
+
+
+def seed(engine: Engine, schema: str, sizes: dict) -> None:
+    with engine.begin() as conn:
+        conn.execute(text(f'DROP SCHEMA IF EXISTS "{schema}" CASCADE'))
+        conn.execute(text(f'CREATE SCHEMA "{schema}"'))
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        for statement in _SEED_STATEMENTS:
+            session.execute(text(statement), sizes)
+        rebuild_player_stats(session)
+        session.commit()
+    analyze(engine)
+
+
+def analyze(engine: Engine) -> None:
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("ANALYZE"))
+
+
+def set_indexes(engine: Engine, present: bool) -> None:
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                if present:
+                    index.create(conn, checkfirst=True)
+                else:
+                    index.drop(conn, checkfirst=True)
+    analyze(engine)
+
+
+def pick_sample(engine: Engine) -> Sample:
+    with engine.connect() as conn:
+        # Ids taken from an existing decided game, so every case finds rows
+        row = conn.execute(
+            text(
+                "SELECT player_white_id, player_black_id, tournament_id, played_at::date "
+                "FROM games WHERE result IS NOT NULL ORDER BY game_id LIMIT 1"
+            )
+        ).one()
+        mentor_id = conn.execute(
+            text("SELECT mentor_id FROM mentors ORDER BY player_id LIMIT 1")
+        ).scalar_one()
+    return Sample(row[0], row[1], row[2], mentor_id, row[3])
+
+
+def run_case(
+    engine: Engine,
+    factory: sessionmaker,
+    recorder: StatementRecorder,
+    case: Callable[[Session, Sample], object],
+    sample: Sample,
+    repeat: int,
+) -> dict:
+    with factory() as session:
+        case(session, sample)  # warm-up, and the statements to explain
+    timings = []
+    for _ in range(repeat):
+        with factory() as session:
+            started = time.perf_counter()
+            case(session, sample)
+            timings.append((time.perf_counter() - started) * 1000)
+
+    recorder.statements.clear()
+    recorder.recording = True
+    try:
+        with factory() as session:
+            case(session, sample)
+    finally:
+        recorder.recording = False
+
+    plans = []
+    with engine.connect() as conn:
+        for statement, parameters in recorder.statements:
+            plan = conn.exec_driver_sql(
+                "EXPLAIN (ANALYZE, BUFFERS) " + statement, parameters
+            ).scalars().all()
+            plans.append({"statement": statement, "plan": plan})
+        conn.rollback()
+    return {
+        "median_ms": round(statistics.median(timings), 3),
+        "min_ms": round(min(timings), 3),
+        "plans": plans,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.query_plans")
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument("--schema", default="bench")
+    parser.add_argument("--players", type=int, default=10_000)
+    parser.add_argument("--tournaments", type=int, default=200)
+    parser.add_argument("--games", type=int, default=500_000)
+    parser.add_argument("--seed", type=float, default=0.42, help="setseed() value, -1..1")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--reuse", action="store_true", help="Keep the already seeded schema")
+    parser.add_argument("--output", help="Write the full report (with plans) as JSON")
+    args = parser.parse_args(argv)
+
+    engine = bench_engine(args.database_url, args.schema)
+    if not args.reuse:
+        started = time.perf_counter()
+        seed(
+            engine,
+            args.schema,
+            {
+                "players": args.players,
+                "tournaments": args.tournaments,
+                "games": args.games,
+                "seed": args.seed,
+            },
+        )
+        print(f"Seeded {args.games} games in {time.perf_counter() - started:.1f}s")
+
+    factory = sessionmaker(bind=engine)
+    recorder = StatementRecorder(engine)
+    sample = pick_sample(engine)
+
+    report: dict[str, dict] = {name: {} for name in CASES}
+    for phase, with_indexes in (("before", False), ("after", True)):
+        set_indexes(engine, with_indexes)
+        for name, case in CASES.items():
+            report[name][phase] = run_case(engine, factory, recorder, case, sample, args.repeat)
+
+    print(f"{'case':<48} {'before ms':>10} {'after ms':>10} {'speedup':>8}")
+    for name, phases in report.items():
+        before = phases["before"]["median_ms"]
+        after = phases["after"]["median_ms"]
+        print(f"{name:<48} {before:>10.2f} {after:>10.2f} {before / max(after, 1e-9):>7.1f}x")
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump({"parameters": vars(args) | {"database_url": None}, "cases": report}, fh, indent=2)
+        print(f"Report written to {args.output}")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -6,12 +6,20 @@ export class ApiError extends Error {
   }
 }
 
+// List endpoints return one page at a time; the next page's cursor is in this header
+const NEXT_CURSOR_HEADER = "X-Next-Cursor";
+// The API's largest page (MAX_PAGE_SIZE)
+const PAGE_SIZE = 1000;
+
 async function request<T>(path: string, init?: RequestInit): Promise<T> {
   const res = await fetch(`${BASE_URL}${path}`, {
     headers: { "Content-Type": "application/json", ...(init?.headers ?? {}) },
     ...init,
   });
+  return parse<T>(res);
+}
 
+async function parse<T>(res: Response): Promise<T> {
   const text = await res.text();
   const body = text ? (() => { try { return JSON.parse(text); } catch { return text; } })() : null;
 
@@ -22,8 +30,24 @@ async function request<T>(path: string, init?: RequestInit): Promise<T> {
   return body as T;
 }
 
+/** Every item of a paged list endpoint, following the next-page cursor header. */
+export async function fetchAllPages<T>(url: string): Promise<T[]> {
+  const items: T[] = [];
+  let cursor: string | null = null;
+  do {
+    const page = new URL(url, window.location.origin);
+    page.searchParams.set("limit", String(PAGE_SIZE));
+    if (cursor) page.searchParams.set("cursor", cursor);
+    const res = await fetch(page);
+    items.push(...(await parse<T[]>(res)));
+    cursor = res.headers.get(NEXT_CURSOR_HEADER);
+  } while (cursor);
+  return items;
+}
+
 export const api = {
   get: <T>(path: string) => request<T>(path),
+  list: <T>(path: string) => fetchAllPages<T>(`${BASE_URL}${path}`),
   post: <T>(path: string, data?: unknown) =>
     request<T>(path, { method: "POST", body: data ? JSON.stringify(data) : undefined }),
   put: <T>(path: string, data?: unknown) =>
@@ -1,4 +1,5 @@
 // src/api/violations.ts
+import { fetchAllPages } from "./client";
 
 export type ViolationRead = {
   violation_id: string;
@@ -46,7 +47,7 @@ async function http<T>(path: string, init?: RequestInit): Promise<T> {
 
 export const violationsApi = {
   // --- Lists ---
-  list: () => http<ViolationRead[]>("/violations/all"),
+  list: () => fetchAllPages<ViolationRead>(`${API_BASE}/violations/all`),
 
   listByPlayer: (playerId: string) =>
     http<ViolationRead[]>(`/violations/by-player?player_id=${encodeURIComponent(playerId)}`),
@@ -14,7 +14,7 @@ export function useGames() {
     setError(null);
 
     try {
-      const res = await api.get<GameRead[]>("/games/all");
+      const res = await api.list<GameRead>("/games/all");
       setData(res);
     } catch (e: any) {
       setError(e?.message ?? "Failed to load games");
@@ -29,7 +29,7 @@ export function useGames() {
       setError(null);
 
       try {
-        const res = await api.get<GameRead[]>("/games/all");
+        const res = await api.list<GameRead>("/games/all");
         setData(res);
       } catch (e: any) {
         setError(e?.message ?? "Failed to load games");
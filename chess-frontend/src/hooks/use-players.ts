@@ -8,7 +8,7 @@ export function usePlayers() {
   const [error, setError] = useState<string | null>(null);
 
   useEffect(() => {
-    api.get<PlayerRead[]>("/players/search/all")
+    api.list<PlayerRead>("/players/search/all")
       .then(setData)
       .catch((e: any) => setError(e?.message ?? "Failed to load players"))
       .finally(() => setLoading(false));
@@ -1,4 +1,5 @@
 import { useCallback, useEffect, useState } from "react";
+import { fetchAllPages } from "../api/client";
 
 type StandingRow = {
   player_id: string;
@@ -30,15 +31,6 @@ type GameRead = {
 // Prefer env base if you have it, fallback to localhost
 const API_BASE = (import.meta as any)?.env?.VITE_API_BASE_URL ?? "http://localhost:8000";
 
-async function getJson<T>(url: string): Promise<T> {
-  const res = await fetch(url);
-  if (!res.ok) {
-    const text = await res.text().catch(() => "");
-    throw new Error(`${res.status} ${res.statusText}${text ? ` — ${text}` : ""}`);
-  }
-  return res.json() as Promise<T>;
-}
-
 function normResult(v: unknown) {
   return String(v ?? "").trim().toLowerCase();
 }
@@ -72,8 +64,8 @@ export function useStandings() {
 
       // ✅ Updated players endpoint
       const [players, games] = await Promise.all([
-        getJson<PlayerRead[]>(`${API_BASE}/players/search/all`),
-        getJson<GameRead[]>(`${API_BASE}/games/all`),
+        fetchAllPages<PlayerRead>(`${API_BASE}/players/search/all`),
+        fetchAllPages<GameRead>(`${API_BASE}/games/all`),
       ]);
 
       const map = new Map<string, StandingRow>();
@@ -8,7 +8,7 @@ export function useTournaments() {
   const [error, setError] = useState<string | null>(null);
 
   useEffect(() => {
-    api.get<TournamentRead[]>("/tournaments")
+    api.list<TournamentRead>("/tournaments")
       .then((res) => setData(Array.isArray(res) ? res : []))
       .catch((e: any) => setError(e?.message ?? "Failed to load tournaments"))
       .finally(() => setLoading(false));
@@ -3,6 +3,15 @@ import { Link, useParams } from "react-router-dom";
 import { useTournament } from "../../hooks/use-tournament";
 import { useGamesByTournament } from "../../hooks/use-games-by-tournament";
 import { api } from "../../api/client";
+import type { PlayerRead } from "../../types/player";
+
+type KnockoutBracketRead = {
+  tournament_id: string;
+  round_number: number;
+  bracket_size: number;
+  games: number;
+  byes: number;
+};
 
 type TabKey = "overview" | "games";
 
@@ -18,6 +27,11 @@ export default function TournamentDetail() {
 
   const [tab, setTab] = useState<TabKey>("overview");
   const [generating, setGenerating] = useState(false);
+  // Entrant picker: the bracket is seeded from the players ticked here only
+  const [picking, setPicking] = useState(false);
+  const [players, setPlayers] = useState<PlayerRead[] | null>(null);
+  const [playersError, setPlayersError] = useState<string | null>(null);
+  const [entrants, setEntrants] = useState<Set<string>>(new Set());
 
   const games = gamesHook?.data ?? [];
   const gamesLoading = !!gamesHook?.loading;
@@ -28,17 +42,34 @@ export default function TournamentDetail() {
     return String(t?.tournament_id ?? id ?? "");
   }, [tournament.data, id]);
 
+  async function openPicker() {
+    setPicking(true);
+    if (players) return;
+    try {
+      setPlayersError(null);
+      setPlayers(await api.list<PlayerRead>("/players/search/all"));
+    } catch (e: any) {
+      setPlayersError(e?.message ?? "Failed to load players");
+    }
+  }
+
   async function generateBracket() {
     if (!tournamentId) return alert("Missing tournament id.");
+    if (entrants.size < 2) return alert("Pick at least two entrants.");
     const ok = window.confirm(
-      "Generate bracket for this tournament?\n\nThis will create scheduled games (result/played_at empty) based on current players."
+      `Generate a knockout bracket for the ${entrants.size} selected entrants?\n\nThis will create scheduled games (result/played_at empty), seeded by rating, with byes for the top seeds when the field isn't a power of two.`
     );
     if (!ok) return;
 
     try {
       setGenerating(true);
-      const msg = await api.get<string>(`/games/generate-tournament-bracket/${encodeURIComponent(tournamentId)}`);
-      alert(typeof msg === "string" ? msg : "Bracket generated.");
+      const bracket = await api.post<KnockoutBracketRead>(
+        `/games/generate-tournament-bracket/${encodeURIComponent(tournamentId)}`,
+        { player_ids: [...entrants] }
+      );
+      alert(`Generated ${bracket.games} games and ${bracket.byes} byes.`);
+      setPicking(false);
+      setEntrants(new Set());
 
       // Prefer hook refresh if it exists
       if (typeof gamesHook?.refresh === "function") {
@@ -94,7 +125,7 @@ export default function TournamentDetail() {
         {tab === "games" && (
           <button
             disabled={generating || gamesLoading || (games?.length ?? 0) > 0}
-            onClick={generateBracket}
+            onClick={() => (picking ? setPicking(false) : openPicker())}
             style={{
               marginLeft: "auto",
               padding: "10px 12px",
@@ -107,11 +138,22 @@ export default function TournamentDetail() {
             }}
             title={(games?.length ?? 0) > 0 ? "Games already exist for this tournament" : "Generate scheduled games"}
           >
-            {generating ? "Generating..." : "Generate Bracket"}
+            {picking ? "Cancel" : "Generate Bracket"}
           </button>
         )}
       </div>
 
+      {tab === "games" && picking && (
+        <EntrantPicker
+          players={players}
+          error={playersError}
+          selected={entrants}
+          onChange={setEntrants}
+          generating={generating}
+          onGenerate={generateBracket}
+        />
+      )}
+
       <div style={{ marginTop: 14 }}>
         {tab === "games" ? (
           <GamesPanel
@@ -148,6 +190,117 @@ export default function TournamentDetail() {
   );
 }
 
+function EntrantPicker({
+  players,
+  error,
+  selected,
+  onChange,
+  generating,
+  onGenerate,
+}: {
+  players: PlayerRead[] | null;
+  error: string | null;
+  selected: Set<string>;
+  onChange: (selected: Set<string>) => void;
+  generating: boolean;
+  onGenerate: () => void;
+}) {
+  const [filter, setFilter] = useState("");
+
+  const shown = useMemo(() => {
+    const q = filter.trim().toLowerCase();
+    const list = players ?? [];
+    if (!q) return list;
+    return list.filter((p) => `${p.first_name} ${p.last_name}`.toLowerCase().includes(q));
+  }, [players, filter]);
+
+  function toggle(playerId: string) {
+    const next = new Set(selected);
+    if (next.has(playerId)) next.delete(playerId);
+    else next.add(playerId);
+    onChange(next);
+  }
+
+  function selectShown() {
+    onChange(new Set([...selected, ...shown.map((p) => String(p.player_id))]));
+  }
+
+  if (error) return <div style={{ marginTop: 14, color: "salmon" }}>Error loading players: {error}</div>;
+  if (!players) return <div style={{ marginTop: 14 }}>Loading players...</div>;
+
+  return (
+    <div
+      style={{
+        marginTop: 14,
+        borderRadius: 12,
+        border: "1px solid rgba(255,255,255,0.12)",
+        background: "rgba(255,255,255,0.03)",
+        padding: 12,
+        display: "grid",
+        gap: 10,
+      }}
+    >
+      <div style={{ fontWeight: 700 }}>Entrants ({selected.size} selected)</div>
+
+      <div style={{ display: "flex", gap: 8, flexWrap: "wrap" }}>
+        <input
+          value={filter}
+          onChange={(e) => setFilter(e.target.value)}
+          placeholder="Filter by name"
+          style={{
+            flex: 1,
+            minWidth: 180,
+            padding: "8px 10px",
+            borderRadius: 10,
+            border: "1px solid rgba(255,255,255,0.12)",
+            background: "transparent",
+            color: "inherit",
+          }}
+        />
+        <TabButton active={false} onClick={selectShown}>
+          Select shown
+        </TabButton>
+        <TabButton active={false} onClick={() => onChange(new Set())}>
+          Clear
+        </TabButton>
+      </div>
+
+      <div style={{ maxHeight: 280, overflow: "auto", display: "grid", gap: 4 }}>
+        {shown.map((p) => {
+          const playerId = String(p.player_id);
+          return (
+            <label key={playerId} style={{ display: "flex", gap: 8, alignItems: "center", cursor: "pointer" }}>
+              <input type="checkbox" checked={selected.has(playerId)} onChange={() => toggle(playerId)} />
+              <span>
+                {p.first_name} {p.last_name}
+              </span>
+              <span style={{ opacity: 0.6 }}>{p.rating}</span>
+            </label>
+          );
+        })}
+        {!shown.length && <div style={{ opacity: 0.7 }}>No players match.</div>}
+      </div>
+
+      <button
+        disabled={generating || selected.size < 2}
+        onClick={onGenerate}
+        style={{
+          justifySelf: "start",
+          padding: "10px 12px",
+          borderRadius: 10,
+          border: "1px solid rgba(255,255,255,0.12)",
+          background: selected.size < 2 ? "rgba(255,255,255,0.04)" : "rgba(255,255,255,0.10)",
+          color: selected.size < 2 ? "rgba(255,255,255,0.45)" : "rgba(255,255,255,0.92)",
+          cursor: selected.size < 2 ? "not-allowed" : "pointer",
+          fontWeight: 900,
+        }}
+      >
+        {generating ? "Generating..." : `Generate with ${selected.size} entrants`}
+      </button>
+    </div>
+  );
+}
+
 function GamesPanel({
   tournamentId,
   loading,
@@ -165,7 +318,7 @@ function GamesPanel({
   if (!games?.length) {
     return (
       <div style={{ opacity: 0.85 }}>
-        No games found for this tournament yet. Click <b>Generate Bracket</b> to create scheduled games.
+        No games found for this tournament yet. Click <b>Generate Bracket</b> and pick the entrants to create scheduled games.
       </div>
     );
   }
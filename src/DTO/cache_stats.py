@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+
+class CacheStatsRead(BaseModel):
+    name: str
+    ttl_seconds: float
+    entries: int
+    hits: int
+    misses: int
+    invalidations: int
+    hit_ratio: float
@@ -19,6 +19,94 @@ class GameRead(GameCreate):
 
     result: Optional[WinState] = None
     played_at: Optional[datetime] = None
+    # Set by the pairing generators only, never by clients
+    round_number: Optional[int] = None
+    slot: Optional[int] = None
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class GameBulkItemError(BaseModel):
+    index: int
+    detail: str
+
+
+class GameBulkResult(BaseModel):
+    inserted: int
+    game_ids: list[UUID]
+    errors: list[GameBulkItemError]
+
+
+class HeadToHeadPair(BaseModel):
+    player1_id: UUID
+    player2_id: UUID
+
+
+class HeadToHeadBatchRequest(BaseModel):
+    pairs: list[HeadToHeadPair] = []
+    # Every pair among these players that has met
+    player_ids: list[UUID] = []
+
+
+class HeadToHeadRead(BaseModel):
+    player1_id: UUID
+    player2_id: UUID
+    games_played: int
+    wins: int
+    losses: int
+    draws: int
+
+
+class HeadToHeadBatchResult(BaseModel):
+    pairs: list[HeadToHeadRead]
+    matrix: list[HeadToHeadRead]
+
+
+class SwissRoundRequest(BaseModel):
+    # Required for the first round; later rounds default to everyone already paired
+    player_ids: Optional[list[UUID]] = None
+
+
+class SwissBoardRead(BaseModel):
+    board: int
+    game_id: UUID
+    player_white_id: UUID
+    player_black_id: UUID
+
+
+class SwissRoundRead(BaseModel):
+    tournament_id: UUID
+    round_number: int
+    boards: list[SwissBoardRead]
+    bye_player_id: Optional[UUID] = None
+
+
+class KnockoutBracketRequest(BaseModel):
+    player_ids: list[UUID]
+
+
+class KnockoutBracketRead(BaseModel):
+    tournament_id: UUID
+    round_number: int
+    bracket_size: int
+    games: int
+    byes: int
+
+
+class KnockoutRoundRead(BaseModel):
+    tournament_id: UUID
+    round_number: int
+    games: int
+
+
+class RoundRobinRequest(BaseModel):
+    # In pairing-number order
+    player_ids: list[UUID]
+    double: bool = False
+
+
+class RoundRobinRead(BaseModel):
+    tournament_id: UUID
+    rounds: int
+    games: int
@@ -1,4 +1,5 @@
-from typing import Optional
+from datetime import datetime
+from typing import Literal, Optional
 
 from pydantic import BaseModel
 from uuid import UUID
@@ -13,4 +14,24 @@ class PlayerMatchHistoryRead(BaseModel):
     match_history: Optional[list[GameRead]] = None
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class MatchHistoryEntryRead(BaseModel):
+    """One game from the player's side, with the opponent resolved."""
+
+    game_id: UUID
+    tournament_id: UUID
+    # None for games recorded without a date; those are listed last
+    played_at: Optional[datetime] = None
+    color: Literal["WHITE", "BLACK"]
+    # WIN/LOSS/DRAW for the player, None while undecided
+    outcome: Optional[Literal["WIN", "LOSS", "DRAW"]] = None
+    opponent_id: Optional[UUID] = None
+    opponent_first_name: Optional[str] = None
+    opponent_last_name: Optional[str] = None
+    # The opponent's rating when the game was recorded
+    opponent_rating: Optional[int] = None
+
+    class Config:
+        from_attributes = True
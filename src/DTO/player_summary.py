@@ -1,9 +1,11 @@
+from typing import Optional
+
 from pydantic import BaseModel
 
 class PlayerSummary(BaseModel):
     first_name: str
     last_name: str
     rating: int
-    title: str
+    title: Optional[str] = None
     total_games: int
     win_rate: float
\ No newline at end of file
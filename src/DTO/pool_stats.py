@@ -0,0 +1,29 @@
+from pydantic import BaseModel
+
+
+class LatencySummaryRead(BaseModel):
+    count: int
+    avg: float
+    max: float
+
+
+class HistogramBucketRead(BaseModel):
+    le: str
+    count: int
+
+
+class PoolStatsRead(BaseModel):
+    engine: str
+    pool_size: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    timeout_seconds: float
+    checkouts: int
+    checkins: int
+    connects: int
+    invalidations: int
+    timeouts: int
+    checkout_latency_ms: LatencySummaryRead
+    hold_time_ms: LatencySummaryRead
+    wait_time_histogram_ms: list[HistogramBucketRead]
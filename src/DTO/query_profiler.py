@@ -0,0 +1,27 @@
+from pydantic import BaseModel, Field
+
+
+class NPlusOneFindingRead(BaseModel):
+    method: str
+    route: str
+    statement: str
+    executions: int
+    total_ms: float
+    request_statements: int
+    at: float
+
+
+class QueryProfilerRead(BaseModel):
+    enabled: bool
+    slow_query_ms: float
+    n_plus_one_threshold: int
+    requests_profiled: int
+    slow_statements: int
+    n_plus_one_requests: int
+    recent_findings: list[NPlusOneFindingRead]
+
+
+class QueryProfilerUpdate(BaseModel):
+    enabled: bool | None = None
+    slow_query_ms: float | None = Field(default=None, ge=0)
+    n_plus_one_threshold: int | None = Field(default=None, ge=2)
@@ -1,3 +1,4 @@
+from uuid import UUID
 from typing import Optional
 from pydantic import BaseModel, Field
 
@@ -23,3 +24,25 @@ class SkillLevelUpdate(BaseModel):
     title: Optional[str] = Field(None, min_length=1, max_length=50)
     rating_lower_bound: Optional[int] = Field(None, ge=0)
     rating_upper_bound: Optional[int] = Field(None, ge=0)
+
+
+class SkillLevelClassifyRequest(BaseModel):
+    player_ids: list[UUID] = []
+    ratings: list[int] = []
+
+
+class PlayerSkillLevelRead(BaseModel):
+    player_id: UUID
+    rating: int
+    title: Optional[str] = None
+
+
+class RatingSkillLevelRead(BaseModel):
+    rating: int
+    title: Optional[str] = None
+
+
+class SkillLevelClassifyResult(BaseModel):
+    players: list[PlayerSkillLevelRead]
+    ratings: list[RatingSkillLevelRead]
+    unknown_player_ids: list[UUID]
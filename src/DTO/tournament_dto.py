@@ -47,6 +47,22 @@ class TournamentParticipantRead(BaseModel):
     class Config:
         from_attributes = True
 
+class TournamentStandingRead(BaseModel):
+    rank: int
+    player_id: UUID
+    first_name: str
+    last_name: str
+    rating: Optional[int] = None
+    games_played: int
+    wins: int
+    draws: int
+    losses: int
+    points: float
+    buchholz: float
+    buchholz_cut1: float
+    sonneborn_berger: float
+    direct_encounter: float
+
 class TournamentUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=255)
     start_date: Optional[date] = None
@@ -0,0 +1,142 @@
+import inspect
+from collections.abc import Callable, Collection
+from functools import cache
+from typing import Any
+
+from fastapi import APIRouter, Depends
+from fastapi.params import Depends as DependsParam
+from fastapi.routing import APIRoute
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.db.dependencies import get_async_db, get_db
+
+# Name of the AsyncSession parameter added to every twin endpoint
+SESSION_PARAMETER = "async_session"
+
+# APIRoute settings a twin copies from the route it mirrors
+_ROUTE_OPTIONS = (
+    "response_model",
+    "status_code",
+    "tags",
+    "summary",
+    "description",
+    "response_description",
+    "responses",
+    "deprecated",
+    "methods",
+    "response_model_include",
+    "response_model_exclude",
+    "response_model_by_alias",
+    "response_model_exclude_unset",
+    "response_model_exclude_defaults",
+    "response_model_exclude_none",
+    "response_class",
+    "name",
+    "openapi_extra",
+)
+
+
+def _dependency_of(parameter: inspect.Parameter) -> Callable | None:
+    if not isinstance(parameter.default, DependsParam):
+        return None
+    # Depends() with no argument depends on the annotated class
+    return parameter.default.dependency or parameter.annotation
+
+
+@cache
+def _needs_session(dependency: Callable) -> bool:
+    if dependency is get_db:
+        return True
+    return any(
+        _needs_session(sub)
+        for sub in map(_dependency_of, inspect.signature(dependency).parameters.values())
+        if sub is not None
+    )
+
+
+def _build(dependency: Callable, session: Session) -> Any:
+    """Call a get_db-based dependency chain with ``session`` standing in for get_db."""
+    if dependency is get_db:
+        return session
+    arguments = {}
+    for name, parameter in inspect.signature(dependency).parameters.items():
+        sub = _dependency_of(parameter)
+        if sub is None:
+            raise TypeError(f"{dependency.__name__}({name}) can only be resolved by FastAPI")
+        arguments[name] = _build(sub, session)
+    return dependency(**arguments)
+
+
+def _twin(endpoint: Callable) -> Callable:
+    """Async stand-in for a get_db-based endpoint or route dependency."""
+    signature = inspect.signature(endpoint)
+    rebuilt = {
+        name: dependency
+        for name, dependency in (
+            (name, _dependency_of(parameter)) for name, parameter in signature.parameters.items()
+        )
+        if dependency is not None and _needs_session(dependency)
+    }
+
+    async def twin(**kwargs):
+        session: AsyncSession = kwargs.pop(SESSION_PARAMETER)
+
+        def call(sync_session: Session):
+            # The dependencies share the one session, as FastAPI caches get_db per request
+            services = {name: _build(dependency, sync_session) for name, dependency in rebuilt.items()}
+            return endpoint(**kwargs, **services)
+
+        return await session.run_sync(call)
+
+    parameters = [
+        parameter.replace(kind=inspect.Parameter.KEYWORD_ONLY)
+        for name, parameter in signature.parameters.items()
+        if name not in rebuilt
+    ]
+    parameters.append(
+        inspect.Parameter(
+            SESSION_PARAMETER,
+            inspect.Parameter.KEYWORD_ONLY,
+            default=Depends(get_async_db),
+            annotation=AsyncSession,
+        )
+    )
+    twin.__signature__ = signature.replace(parameters=parameters, return_annotation=inspect.Signature.empty)
+    twin.__name__ = f"{endpoint.__name__}_async"
+    twin.__doc__ = endpoint.__doc__
+    return twin
+
+
+def _twin_dependency(dependency: DependsParam) -> DependsParam:
+    if not _needs_session(dependency.dependency):
+        return dependency
+    return Depends(_twin(dependency.dependency), use_cache=dependency.use_cache)
+
+
+def async_twin(router: APIRouter, skip: Collection[Callable] = ()) -> APIRouter:
+    """Mirror ``router`` onto the AsyncSession stack.
+
+    Every twin runs the sync handler itself inside ``AsyncSession.run_sync``,
+    with the dependencies built on get_db (repositories, services) rebuilt
+    on the sync session behind the AsyncSession. Handlers are written once
+    and the twin does the handler's I/O in a single hop on the event loop.
+    Route-level dependencies built on get_db, such as the ETag check, run
+    before the handler and get a hop of their own on the same AsyncSession,
+    so no request of a twin touches the sync pool. Handlers whose response
+    is produced after they return, such as a stream read from the session,
+    can't run there and go in ``skip``. Twins are left out of the OpenAPI
+    schema, which already has the routes.
+    """
+    twins = APIRouter()
+    for route in router.routes:
+        if not isinstance(route, APIRoute) or route.endpoint in skip:
+            continue
+        twins.add_api_route(
+            route.path,
+            _twin(route.endpoint),
+            include_in_schema=False,
+            dependencies=[_twin_dependency(dependency) for dependency in route.dependencies],
+            **{option: getattr(route, option) for option in _ROUTE_OPTIONS},
+        )
+    return twins
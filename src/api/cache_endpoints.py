@@ -0,0 +1,12 @@
+from fastapi import APIRouter
+
+from src.DTO.cache_stats import CacheStatsRead
+from src.services.cache import cache_statistics
+
+router = APIRouter(prefix="/cache", tags=["Cache"])
+
+
+# Hit/miss counters per in-process cache (per worker)
+@router.get("/stats", response_model=list[CacheStatsRead])
+def get_cache_stats():
+    return cache_statistics()
@@ -0,0 +1,52 @@
+from fastapi import Depends, Request, Response
+from sqlalchemy.orm import Session
+
+from src.db.dependencies import get_db
+from src.services.cache import ResourceVersion
+
+ETAG_HEADER = "ETag"
+
+
+class NotModified(Exception):
+    """Raised by a conditional GET whose ``If-None-Match`` still matches."""
+
+    def __init__(self, etag: str):
+        super().__init__(etag)
+        self.etag = etag
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    # If-None-Match compares weakly, so a W/ prefix added by a proxy still matches
+    return "*" in candidates or etag in (tag.removeprefix("W/") for tag in candidates)
+
+
+def conditional_get(version: ResourceVersion):
+    """Route dependency that tags a list with ``version`` and answers 304 when unchanged.
+
+    Declared in the route's ``dependencies`` it runs before the service is
+    built, so an unchanged poll costs one counter read (see ResourceVersion)
+    instead of the list query. The counter is read before the list, so a tag never claims data
+    newer than the body it comes with.
+    """
+
+    def dependency(
+        request: Request, response: Response, db: Session = Depends(get_db)
+    ) -> None:
+        etag = version.etag(db)
+        if etag is None:
+            return
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise NotModified(etag)
+        response.headers[ETAG_HEADER] = etag
+        response.headers["Cache-Control"] = "no-cache"
+
+    return dependency
+
+
+def not_modified_response(exc: NotModified) -> Response:
+    return Response(
+        status_code=304, headers={ETAG_HEADER: exc.etag, "Cache-Control": "no-cache"}
+    )
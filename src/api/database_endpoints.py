@@ -0,0 +1,33 @@
+from fastapi import APIRouter
+
+from src.db.database import pool_statistics
+from src.db.query_profiler import query_profiler
+from src.DTO.pool_stats import PoolStatsRead
+from src.DTO.query_profiler import QueryProfilerRead, QueryProfilerUpdate
+from src.settings import settings
+
+router = APIRouter(prefix="/database", tags=["Database"])
+
+
+# Live pool sizing data; wait-time buckets are cumulative (Prometheus "le")
+@router.get("/pool-stats", response_model=list[PoolStatsRead])
+def get_pool_stats():
+    return pool_statistics()
+
+
+# SQL profiler settings, counters and recent N+1 findings (per worker)
+@router.get("/profiler", response_model=QueryProfilerRead)
+def get_profiler():
+    return query_profiler.snapshot()
+
+
+# Switch or tune the profiler without a restart; applies to the worker that serves the call
+@router.put("/profiler", response_model=QueryProfilerRead)
+def update_profiler(update: QueryProfilerUpdate):
+    if update.enabled is not None:
+        settings.SQL_PROFILER = update.enabled
+    if update.slow_query_ms is not None:
+        settings.SQL_SLOW_QUERY_MS = update.slow_query_ms
+    if update.n_plus_one_threshold is not None:
+        settings.SQL_N_PLUS_ONE_THRESHOLD = update.n_plus_one_threshold
+    return query_profiler.snapshot()
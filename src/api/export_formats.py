@@ -0,0 +1,49 @@
+import csv
+import io
+import json
+import uuid
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import date, datetime
+from enum import Enum
+
+from sqlalchemy import Row
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _plain(value):
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def ndjson_chunks(batches: Iterable[Sequence[Row]]) -> Iterator[str]:
+    """One JSON object per line, one chunk per fetched batch."""
+    for batch in batches:
+        yield "".join(
+            json.dumps({key: _plain(value) for key, value in row._mapping.items()}) + "\n"
+            for row in batch
+        )
+
+
+def csv_chunks(columns: Sequence[str], batches: Iterable[Sequence[Row]]) -> Iterator[str]:
+    """A header line followed by one chunk of CSV rows per fetched batch."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    yield buffer.getvalue()
+    for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(
+            ["" if row._mapping[c] is None else _plain(row._mapping[c]) for c in columns]
+            for row in batch
+        )
+        yield buffer.getvalue()
@@ -1,13 +1,34 @@
 from datetime import datetime, date
-from fastapi import APIRouter, Depends, Query
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Literal, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
+from src.api.async_twins import async_twin
+from src.api.export_formats import MEDIA_TYPES, csv_chunks, ndjson_chunks
+from src.api.fast_json import rows_response
+from src.api.pagination import PageParams, paged
 from src.domain.game import Game, WinState
 from src.db.dependencies import get_db
-from src.DTO.game import GameCreate, GameRead
+from src.domain.exceptions import ValidationError
+from src.DTO.game import (
+    GameBulkResult,
+    GameCreate,
+    GameRead,
+    HeadToHeadBatchRequest,
+    HeadToHeadBatchResult,
+    KnockoutBracketRead,
+    KnockoutBracketRequest,
+    KnockoutRoundRead,
+    RoundRobinRead,
+    RoundRobinRequest,
+    SwissRoundRead,
+    SwissRoundRequest,
+)
 from src.repositories.game_repository import GameRepository
 from src.services.game_service import GameService
+from src.settings import settings
 
 from src.repositories.player_repository import PlayerRepository
 from src.services.player_service import PlayerService
@@ -40,18 +61,56 @@ def get_player_service(
 def add_game(
     payload: GameCreate,
     game_svc: GameService = Depends(get_game_service),
-    player_svc: PlayerService = Depends(get_player_service),
 ):
     game = Game(**payload.model_dump())
-    
-    player_svc.update_players_on_game_insert(game)
-    return game_svc.add_game(game)
+    return game_svc.add_game_with_ratings(game)
+
+
+@router.post("/bulk", response_model=GameBulkResult)
+def add_games_bulk(
+    payload: list[GameCreate],
+    atomic: bool = False,
+    svc: GameService = Depends(get_game_service),
+):
+    return svc.add_games_bulk(payload, atomic)
 
 
 # -- Game Get Endpoints (Read)
 @router.get("/all", response_model=list[GameRead])
-def get_all_games(svc: GameService = Depends(get_game_service)):
-    return svc.get_all_games()
+def get_all_games(
+    response: Response,
+    page: PageParams = Depends(),
+    svc: GameService = Depends(get_game_service),
+):
+    if settings.FAST_JSON_LISTS:
+        return rows_response(response, paged(response, svc.get_game_rows_page(page.size, page.cursor)))
+    return paged(response, svc.get_games_page(page.size, page.cursor))
+
+
+@router.get("/export")
+def export_games(
+    format: Literal["ndjson", "csv"] = "ndjson",
+    tournament_id: Optional[UUID] = None,
+    player_id: Optional[UUID] = None,
+    played_from: Optional[datetime] = None,
+    played_to: Optional[datetime] = None,
+    svc: GameService = Depends(get_game_service),
+):
+    # Rows are streamed from a server-side cursor as they arrive, so memory
+    # stays flat no matter how many games match.
+    batches = svc.export_games(tournament_id, player_id, played_from, played_to)
+    if format == "csv":
+        chunks = csv_chunks(
+            ["game_id", "tournament_id", "player_white_id", "player_black_id", "result", "played_at"],
+            batches,
+        )
+    else:
+        chunks = ndjson_chunks(batches)
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="games.{format}"'},
+    )
 
 
 @router.get("/id", response_model=GameRead)
@@ -128,20 +187,77 @@ def record_game(
 # -- Head-to-Head stats Endpoints--
 @router.get("/head-to-head", response_model=dict)
 def head_to_head_stats(
-    player1_id: int = Query(...),
-    player2_id: int = Query(...),
+    player1_id: UUID = Query(...),
+    player2_id: UUID = Query(...),
     service: GameService = Depends(get_game_service),
 ):
     return service.get_head_to_head_stats(
         str(player1_id), str(player2_id)
     )
 
+@router.post("/head-to-head/batch", response_model=HeadToHeadBatchResult)
+def head_to_head_batch(
+    payload: HeadToHeadBatchRequest,
+    service: GameService = Depends(get_game_service),
+):
+    return service.get_head_to_head_batch(
+        [(pair.player1_id, pair.player2_id) for pair in payload.pairs], payload.player_ids
+    )
+
 # -- Generate brackets
-@router.get("/generate-tournament-bracket/{tournament_id}", response_model=str)
+def _bracket_message(bracket: dict) -> str:
+    return (
+        f"Generated {bracket['games']} games and {bracket['byes']} byes "
+        f"for tournament {bracket['tournament_id']}"
+    )
+
+# Deprecated: entrants as repeated ?player_ids=...; POST the same path instead.
+# Old callers that name no entrants get a 400 saying so, not a bare 422
+@router.get("/generate-tournament-bracket/{tournament_id}", response_model=str, deprecated=True)
 def generate_match_bracket(
-    tournament_id: str, svc: GameService = Depends(get_game_service)
+    tournament_id: UUID,
+    player_ids: Optional[list[UUID]] = Query(None),
+    svc: GameService = Depends(get_game_service),
+):
+    if not player_ids:
+        raise ValidationError(
+            "Brackets are no longer seeded from every player: name the entrants by POSTing "
+            f'{{"player_ids": [...]}} to /games/generate-tournament-bracket/{tournament_id}'
+        )
+    return _bracket_message(svc.generate_match_bracket(tournament_id, player_ids))
+
+@router.post("/generate-tournament-bracket/{tournament_id}", response_model=KnockoutBracketRead)
+def generate_seeded_bracket(
+    tournament_id: UUID,
+    payload: KnockoutBracketRequest,
+    svc: GameService = Depends(get_game_service),
 ):
-    try:
-        return svc.generate_match_bracket(tournament_id)
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail=str(exc))
+    return svc.generate_match_bracket(tournament_id, payload.player_ids)
+
+# Normally automatic: the result that completes a round creates the next one
+@router.post("/knockout-round/{tournament_id}", response_model=KnockoutRoundRead)
+def advance_knockout_round(
+    tournament_id: UUID, svc: GameService = Depends(get_game_service)
+):
+    return svc.advance_knockout_round(tournament_id)
+
+@router.post("/round-robin/{tournament_id}", response_model=RoundRobinRead)
+def generate_round_robin(
+    tournament_id: UUID,
+    payload: RoundRobinRequest,
+    svc: GameService = Depends(get_game_service),
+):
+    return svc.generate_round_robin(tournament_id, payload.player_ids, payload.double)
+
+@router.post("/swiss-round/{tournament_id}", response_model=SwissRoundRead)
+def generate_swiss_round(
+    tournament_id: UUID,
+    payload: SwissRoundRequest | None = None,
+    svc: GameService = Depends(get_game_service),
+):
+    return svc.generate_swiss_round(tournament_id, payload.player_ids if payload else None)
+
+
+# Served from the AsyncSession stack when settings.DB_ASYNC is on. The export
+# streams from its session after the handler returns, so it stays on the sync stack.
+async_router = async_twin(router, skip={export_games})
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
+from src.api.async_twins import async_twin
 from src.domain.mentorship import Mentorship
 from src.db.dependencies import get_db
 from src.DTO.mentorship import MentorshipCreate, MentorshipRead
@@ -86,3 +87,7 @@ def delete_by_player_and_mentor_id_mentorships(
     svc: MentorshipService = Depends(get_mentorship_service),
 ):
     return svc.delete_by_player_and_mentor_id(player_id, mentor_id)
+
+
+# Served from the AsyncSession stack when settings.DB_ASYNC is on
+async_router = async_twin(router)
@@ -0,0 +1,14 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from src.api.request_metrics import request_metrics
+
+router = APIRouter(tags=["Metrics"])
+
+PROMETHEUS_TEXT = "text/plain; version=0.0.4; charset=utf-8"
+
+
+# Request counts and latency/DB histograms per route template (per worker)
+@router.get("/metrics", response_class=PlainTextResponse)
+def get_metrics():
+    return PlainTextResponse(request_metrics.render(), media_type=PROMETHEUS_TEXT)
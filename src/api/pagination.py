@@ -0,0 +1,39 @@
+from typing import Optional
+
+from fastapi import Query, Response
+
+from src.repositories.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+
+# List bodies stay plain JSON arrays; the cursor for the next page travels in this header
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class PageParams:
+    """``limit``/``cursor`` query parameters shared by the list endpoints.
+
+    Without ``limit`` a page holds DEFAULT_PAGE_SIZE items, so no request
+    serializes a whole table; clients follow the next-cursor header for more.
+    """
+
+    def __init__(
+        self,
+        limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+        cursor: Optional[str] = Query(None, description=f"Value of the {NEXT_CURSOR_HEADER} header of the previous page"),
+    ):
+        self.limit = limit
+        self.cursor = cursor
+
+    @property
+    def requested(self) -> bool:
+        return self.limit is not None or self.cursor is not None
+
+    @property
+    def size(self) -> int:
+        return self.limit or DEFAULT_PAGE_SIZE
+
+
+def paged(response: Response, page: tuple[list, str | None]) -> list:
+    items, next_cursor = page
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return items
@@ -1,11 +1,17 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.orm import Session
 
+from src.api.async_twins import async_twin
+from src.api.conditional import conditional_get
+from src.api.fast_json import rows_response
+from src.api.pagination import PageParams, paged
 from src.domain.player import Player
 from src.db.dependencies import get_db
 from src.DTO.player import PlayerCreate, PlayerRead
 from src.repositories.player_repository import PlayerRepository
+from src.services.cache import players_version
 from src.services.player_service import PlayerService
+from src.settings import settings
 
 router = APIRouter(prefix="/players", tags=["Player"])
 
@@ -41,9 +47,19 @@ def replace_player(
 
 
 # -- Player Get Endpoints (Read) --
-@router.get("/search/all", response_model=list[PlayerRead])
-def get_all_players(svc: PlayerService = Depends(get_player_service)):
-    return svc.get_all()
+@router.get(
+    "/search/all",
+    response_model=list[PlayerRead],
+    dependencies=[Depends(conditional_get(players_version))],
+)
+def get_all_players(
+    response: Response,
+    page: PageParams = Depends(),
+    svc: PlayerService = Depends(get_player_service),
+):
+    if settings.FAST_JSON_LISTS:
+        return rows_response(response, paged(response, svc.get_rows_page(page.size, page.cursor)))
+    return paged(response, svc.get_page(page.size, page.cursor))
 
 
 @router.get("/search/by-first-name", response_model=list[PlayerRead])
@@ -129,3 +145,7 @@ def delete_by_id_players(
     player_id: str, svc: PlayerService = Depends(get_player_service)
 ):
     return svc.delete_by_id(player_id)
+
+
+# Served from the AsyncSession stack when settings.DB_ASYNC is on
+async_router = async_twin(router)
@@ -1,11 +1,20 @@
-from fastapi import APIRouter, Depends
+from functools import partial
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.orm import Session
 
-from src.DTO.player_match_history import PlayerMatchHistoryRead
+from src.api.async_twins import async_twin
+from src.api.conditional import conditional_get
+from src.api.pagination import PageParams, paged
+from src.DTO.player_match_history import MatchHistoryEntryRead, PlayerMatchHistoryRead
 from src.db.dependencies import get_db
 from src.DTO.player_summary import PlayerSummary
 from src.DTO.top_players_stats import PlayerTopStatsResponseRead
 from src.repositories.relations_repository import RelationsRepository
+from src.repositories.skill_level_repository import SkillLevelRepository
+from src.services.cache import leaderboard_version
 from src.services.relations_service import RelationsService
 
 router = APIRouter(prefix="/relations", tags=["Relations"])
@@ -18,7 +27,11 @@ def get_relations_repository(db: Session = Depends(get_db)) -> RelationsReposito
 def get_relations_service(
     repo: RelationsRepository = Depends(get_relations_repository),
 ) -> RelationsService:
-    return RelationsService(repo)
+    return RelationsService(
+        repo,
+        SkillLevelRepository(repo.session),
+        version=partial(leaderboard_version.current, repo.session),
+    )
 
 
 @router.get("/player-summary-by-id", response_model=PlayerSummary)
@@ -27,12 +40,41 @@ def get_player_summary_by_id(
 ):
     return svc.get_player_summary_by_id(player_id)
 
-@router.get("/top-players", response_model=list[PlayerTopStatsResponseRead])
-def get_top_players(svc: RelationsService = Depends(get_relations_service)):
-    return svc.get_top_players()
+# Highest rated first; limit/cursor/offset/skill_level select one page
+@router.get(
+    "/top-players",
+    response_model=list[PlayerTopStatsResponseRead],
+    dependencies=[Depends(conditional_get(leaderboard_version))],
+)
+def get_top_players(
+    response: Response,
+    page: PageParams = Depends(),
+    offset: int = Query(0, ge=0),
+    skill_level: Optional[str] = None,
+    svc: RelationsService = Depends(get_relations_service),
+):
+    if not page.requested and not offset and skill_level is None:
+        return svc.get_top_players()
+    return paged(
+        response, svc.get_top_players_page(page.size, page.cursor, offset, skill_level)
+    )
 
 @router.get("/player-match-history", response_model=PlayerMatchHistoryRead)
 def get_player_match_history(
     player_id: str, svc: RelationsService = Depends(get_relations_service)
 ):
-    return svc.get_player_match_history(player_id)
\ No newline at end of file
+    return svc.get_player_match_history(player_id)
+
+# Newest first, one page per request; the next page's cursor is in X-Next-Cursor
+@router.get("/player-match-history/{player_id}", response_model=list[MatchHistoryEntryRead])
+def get_player_match_history_page(
+    player_id: UUID,
+    response: Response,
+    page: PageParams = Depends(),
+    svc: RelationsService = Depends(get_relations_service),
+):
+    return paged(response, svc.get_player_match_history_page(player_id, page.size, page.cursor))
+
+
+# Served from the AsyncSession stack when settings.DB_ASYNC is on
+async_router = async_twin(router)
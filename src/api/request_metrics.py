@@ -0,0 +1,157 @@
+import threading
+import time
+from bisect import bisect_left
+
+from src.db.query_metrics import QueryStats, current_query_stats
+from src.db.query_profiler import query_profiler
+
+# Upper bounds of the histogram buckets; the last bucket is +Inf
+LATENCY_BUCKETS_SECONDS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+# Requests no route matched share one label instead of one per raw path
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class _Histogram:
+    __slots__ = ("bounds", "buckets", "count", "total")
+
+    def __init__(self, bounds: tuple):
+        self.bounds = bounds
+        self.buckets = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        self.buckets[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+
+class _RouteSeries:
+    """Everything recorded for one (method, route template)."""
+
+    __slots__ = ("statuses", "latency", "db_time", "queries")
+
+    def __init__(self):
+        self.statuses: dict[int, int] = {}
+        self.latency = _Histogram(LATENCY_BUCKETS_SECONDS)
+        self.db_time = _Histogram(LATENCY_BUCKETS_SECONDS)
+        self.queries = _Histogram(QUERY_COUNT_BUCKETS)
+
+
+class RequestMetrics:
+    """Per-route request counters and histograms, rendered in Prometheus text format.
+
+    One lock-protected update per request: a few bisects and increments.
+    Each worker process holds its own copy, so a scrape sees one worker.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._series: dict[tuple[str, str], _RouteSeries] = {}
+        self.in_flight = 0
+
+    def started(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+
+    def finished(
+        self, method: str, route: str, status: int, elapsed_seconds: float, queries: QueryStats
+    ) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            series = self._series.get((method, route))
+            if series is None:
+                series = self._series[(method, route)] = _RouteSeries()
+            series.statuses[status] = series.statuses.get(status, 0) + 1
+            series.latency.observe(elapsed_seconds)
+            series.db_time.observe(queries.total_seconds)
+            series.queries.observe(queries.count)
+
+    def render(self) -> str:
+        with self._lock:
+            series = sorted(self._series.items())
+            lines = [
+                "# HELP http_requests_in_flight Requests being served right now.",
+                "# TYPE http_requests_in_flight gauge",
+                f"http_requests_in_flight {self.in_flight}",
+                "# HELP http_requests_total Requests served, by route template and status code.",
+                "# TYPE http_requests_total counter",
+            ]
+            for (method, route), route_series in series:
+                for status, count in sorted(route_series.statuses.items()):
+                    lines.append(
+                        f'http_requests_total{{{_labels(method, route)},status="{status}"}} {count}'
+                    )
+            for name, attribute, help_text in (
+                ("http_request_duration_seconds", "latency", "Time to serve a request."),
+                ("http_request_db_seconds", "db_time", "Database time spent on a request."),
+                ("http_request_db_queries", "queries", "Statements executed for a request."),
+            ):
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} histogram")
+                for (method, route), route_series in series:
+                    lines.extend(_histogram_lines(name, _labels(method, route), getattr(route_series, attribute)))
+        return "\n".join(lines) + "\n"
+
+
+def _labels(method: str, route: str) -> str:
+    route = route.replace("\\", "\\\\").replace('"', '\\"')
+    return f'method="{method}",route="{route}"'
+
+
+def _histogram_lines(name: str, labels: str, histogram: _Histogram) -> list[str]:
+    lines = []
+    cumulative = 0
+    for bound, count in zip((*histogram.bounds, None), histogram.buckets):
+        cumulative += count
+        le = "+Inf" if bound is None else repr(bound)
+        lines.append(f'{name}_bucket{{{labels},le="{le}"}} {cumulative}')
+    lines.append(f"{name}_sum{{{labels}}} {histogram.total!r}")
+    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+    return lines
+
+
+request_metrics = RequestMetrics()
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware feeding ``request_metrics``.
+
+    The route template is read from ``scope["route"]`` after the router has
+    matched it, so ``/players/{player_id}`` stays one series however many
+    players are requested. Statement counts and database time come from
+    the QueryStats the SQLAlchemy listeners fill for this request, which
+    the query profiler also analyses when SQL_PROFILER is on.
+    """
+
+    def __init__(self, app, metrics: RequestMetrics = request_metrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        queries = query_profiler.stats_for(scope)
+        token = current_query_stats.set(queries)
+        self.metrics.started()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            current_query_stats.reset(token)
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            self.metrics.finished(scope["method"], route, status, elapsed, queries)
+            query_profiler.finish(scope["method"], route, queries)
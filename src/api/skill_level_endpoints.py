@@ -2,8 +2,15 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
 
+from src.api.async_twins import async_twin
 from src.db.dependencies import get_db
-from src.DTO.skill_level_dto import SkillLevelCreate, SkillLevelRead, SkillLevelUpdate
+from src.DTO.skill_level_dto import (
+    SkillLevelClassifyRequest,
+    SkillLevelClassifyResult,
+    SkillLevelCreate,
+    SkillLevelRead,
+    SkillLevelUpdate,
+)
 from src.repositories.skill_level_repository import SkillLevelRepository
 from src.services.skill_level_service import SkillLevelService
 
@@ -24,6 +31,22 @@ def get_skill_level_service(
 def get_all_skill_levels(svc: SkillLevelService = Depends(get_skill_level_service)):
     return svc.get_all_skill_levels()
 
+#GET skill level by player id (Business Model); declared before /{title} so it isn't shadowed
+@router.get("/lookup", response_model=dict)
+def lookup_skill_level(
+    player_id: str,
+    service: SkillLevelService = Depends(get_skill_level_service)
+):
+    return service.lookup_skill_level(player_id)
+
+#POST classify many players and/or ratings in one call
+@router.post("/classify", response_model=SkillLevelClassifyResult)
+def classify_skill_levels(
+    payload: SkillLevelClassifyRequest,
+    svc: SkillLevelService = Depends(get_skill_level_service),
+):
+    return svc.classify(payload.player_ids, payload.ratings)
+
 #endpoint 2 - GET skill level by title
 @router.get("/{title}", response_model=SkillLevelRead)
 def get_skill_level_by_title(
@@ -55,10 +78,6 @@ def delete_skill_level(
     svc.delete_skill_level(title)
     return
 
-#GET skill level by player id (Business Model)
-@router.get("/lookup", response_model=dict)
-def lookup_skill_level(
-    player_id: str,
-    service: SkillLevelService = Depends(get_skill_level_service)
-):
-    return service.lookup_skill_level(player_id)
+
+# Served from the AsyncSession stack when settings.DB_ASYNC is on
+async_router = async_twin(router)
@@ -1,15 +1,21 @@
+from functools import partial
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
+from src.api.async_twins import async_twin
+from src.api.conditional import conditional_get
+from src.api.pagination import PageParams, paged
 from src.db.dependencies import get_db
 from src.DTO.tournament_dto import (
     TournamentCreate,
     TournamentRead,
     TournamentUpdate,
     TournamentParticipantRead,
+    TournamentStandingRead,
 )
 from src.repositories.tournament_repository import TournamentRepository
+from src.services.cache import standings_version, tournaments_version
 from src.services.tournament_service import TournamentService
 
 router = APIRouter(prefix="/tournaments", tags=["Tournaments"])
@@ -21,15 +27,21 @@ def get_tournament_service(
     db: Session = Depends(get_db),
     repo: TournamentRepository = Depends(get_tournament_repository),
 ) -> TournamentService:
-    return TournamentService(db, repo)
+    return TournamentService(db, repo, version=partial(standings_version.current, db))
 
 
 #endpoint 1 - GET all tournaments
-@router.get("", response_model=list[TournamentRead])
+@router.get(
+    "",
+    response_model=list[TournamentRead],
+    dependencies=[Depends(conditional_get(tournaments_version))],
+)
 def get_all_tournaments(
+    response: Response,
+    page: PageParams = Depends(),
     svc: TournamentService = Depends(get_tournament_service),
 ):
-    return svc.get_all_tournaments()
+    return paged(response, svc.get_tournaments_page(page.size, page.cursor))
 
 #endpoint 2 - GET tournament by id
 @router.get("/{tournament_id}", response_model=TournamentRead)
@@ -75,3 +87,18 @@ def get_participants(
          message = str(exc)
          status_code = 400 if message.startswith("Invalid") else 404
          raise HTTPException(status_code=status_code, detail=message)
+
+
+@router.get("/standings/{tournament_id}", response_model=list[TournamentStandingRead])
+def get_standings(
+    tournament_id: UUID,
+    svc: TournamentService = Depends(get_tournament_service)
+):
+    try:
+        return svc.get_standings(tournament_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+
+
+# Served from the AsyncSession stack when settings.DB_ASYNC is on
+async_router = async_twin(router)
@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 from typing import List
 from uuid import UUID
 
+from src.api.async_twins import async_twin
+from src.api.pagination import PageParams, paged
 from src.db.dependencies import get_db
 from src.DTO.violation import ViolationCreate, ViolationRead, ViolationUpdate
 from src.repositories.violation_repository import ViolationRepository
@@ -31,8 +33,12 @@ def get_player_service(
 
 
 @router.get("/all", response_model=List[ViolationRead])
-def get_all_violations(service: ViolationService = Depends(get_violation_service)):
-    return service.get_all()
+def get_all_violations(
+    response: Response,
+    page: PageParams = Depends(),
+    service: ViolationService = Depends(get_violation_service),
+):
+    return paged(response, service.get_page(page.size, page.cursor))
 
 
 @router.post("/add", response_model=ViolationRead, status_code=status.HTTP_201_CREATED)
@@ -95,3 +101,7 @@ def delete_violation(
         return {"message": "Violation deleted successfully"}
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+
+
+# Served from the AsyncSession stack when settings.DB_ASYNC is on
+async_router = async_twin(router)
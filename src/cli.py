@@ -0,0 +1,57 @@
+"""Maintenance commands, e.g. ``python -m src.cli recompute-ratings``."""
+import argparse
+import json
+
+from src.db.database import SessionLocal
+from src.repositories.player_repository import PlayerRepository
+from src.repositories.relations_repository import RelationsRepository
+from src.services.cache import ResourceVersion
+from src.services.player_service import PlayerService
+from src.services.relations_service import RelationsService
+from src.services.rating_engine import get_rating_engine
+
+
+def recompute_ratings(args: argparse.Namespace) -> dict:
+    with SessionLocal() as session:
+        service = PlayerService(PlayerRepository(session), get_rating_engine(args.engine))
+        return service.recompute_ratings(args.initial_rating)
+
+
+def rebuild_player_stats(args: argparse.Namespace) -> dict:
+    with SessionLocal() as session:
+        return {"rows": RelationsService(RelationsRepository(session)).rebuild_player_stats()}
+
+
+def compact_resource_versions(args: argparse.Namespace) -> dict:
+    with SessionLocal() as session:
+        return {"rows": ResourceVersion.compact(session)}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m src.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    recompute = commands.add_parser(
+        "recompute-ratings", help="Rebuild every rating by replaying all games in order"
+    )
+    recompute.add_argument("--initial-rating", type=int, default=1500)
+    recompute.add_argument("--engine", help="Rating engine (defaults to RATING_ENGINE)")
+    recompute.set_defaults(handler=recompute_ratings)
+
+    rebuild = commands.add_parser(
+        "rebuild-player-stats", help="Backfill player_stats and head_to_head from all games"
+    )
+    rebuild.set_defaults(handler=rebuild_player_stats)
+
+    compact = commands.add_parser(
+        "compact-resource-versions",
+        help="Fold the ETag counter rows of finished database backends together",
+    )
+    compact.set_defaults(handler=compact_resource_versions)
+
+    args = parser.parse_args(argv)
+    print(json.dumps(args.handler(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,30 @@
+from functools import cache
+
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
+from src.db.pool_metrics import (
+    TimedAsyncAdaptedQueuePool,
+    TimedQueuePool,
+    instrument_engine,
+)
+from src.db.query_metrics import instrument_queries
 from src.settings import settings
 
+pool_options = dict(
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+)
+
 engine = create_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
+    poolclass=TimedQueuePool,
+    **pool_options,
 )
 
 SessionLocal = sessionmaker(
@@ -13,3 +32,40 @@ SessionLocal = sessionmaker(
     autoflush=False,
     autocommit=False,
 )
+
+pool_metrics = {"sync": instrument_engine(engine, "sync")}
+
+instrument_queries(engine)
+
+
+# Built on first use, so with DB_ASYNC off no second pool is ever opened
+@cache
+def get_async_engine() -> AsyncEngine:
+    # postgresql+psycopg:// resolves to the psycopg3 async dialect here
+    async_engine = create_async_engine(
+        settings.DATABASE_URL,
+        echo=settings.DEBUG,
+        poolclass=TimedAsyncAdaptedQueuePool,
+        **pool_options,
+    )
+    pool_metrics["async"] = instrument_engine(async_engine.sync_engine, "async")
+    instrument_queries(async_engine.sync_engine)
+    return async_engine
+
+
+@cache
+def get_async_sessionmaker() -> async_sessionmaker:
+    # Objects are returned to the event loop after commit, where an expired
+    # attribute can't be refreshed lazily, so keep them loaded.
+    return async_sessionmaker(
+        bind=get_async_engine(),
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+def pool_statistics() -> list[dict]:
+    statistics = [pool_metrics["sync"].snapshot(engine.pool)]
+    if "async" in pool_metrics:
+        statistics.append(pool_metrics["async"].snapshot(get_async_engine().sync_engine.pool))
+    return statistics
@@ -1,5 +1,8 @@
+from collections.abc import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from src.db.database import SessionLocal
+from src.db.database import SessionLocal, get_async_sessionmaker
 
 
 def get_db() -> Session:
@@ -8,3 +11,8 @@ def get_db() -> Session:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    async with get_async_sessionmaker()() as db:
+        yield db
@@ -0,0 +1,151 @@
+import threading
+import time
+from bisect import bisect_left
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# Upper bounds (ms) of the wait-time histogram buckets; the last bucket is +Inf
+WAIT_BUCKETS_MS = (0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class PoolMetrics:
+    """Counters and latency distributions for one connection pool.
+
+    Checkout/checkin/connect/invalidate counts and connection hold times come
+    from SQLAlchemy pool events; the time a caller spends waiting for a
+    connection is measured around ``Pool.connect`` by the timed pool classes.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checkins = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.wait_bucket_counts = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self.wait_count = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+        self.hold_count = 0
+        self.hold_total_ms = 0.0
+        self.hold_max_ms = 0.0
+
+    def observe_wait(self, elapsed_ms: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.wait_bucket_counts[bisect_left(WAIT_BUCKETS_MS, elapsed_ms)] += 1
+            self.wait_count += 1
+            self.wait_total_ms += elapsed_ms
+            self.wait_max_ms = max(self.wait_max_ms, elapsed_ms)
+            if timed_out:
+                self.timeouts += 1
+
+    # -- Pool event listeners --
+    def on_connect(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        connection_record.info["checked_out_at"] = time.perf_counter()
+        with self._lock:
+            self.checkouts += 1
+
+    def on_checkin(self, dbapi_connection, connection_record) -> None:
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        with self._lock:
+            self.checkins += 1
+            if checked_out_at is not None:
+                held_ms = (time.perf_counter() - checked_out_at) * 1000
+                self.hold_count += 1
+                self.hold_total_ms += held_ms
+                self.hold_max_ms = max(self.hold_max_ms, held_ms)
+
+    def on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def snapshot(self, pool: QueuePool) -> dict:
+        with self._lock:
+            cumulative = 0
+            histogram = []
+            for bound, bucket_count in zip(
+                (*WAIT_BUCKETS_MS, None), self.wait_bucket_counts
+            ):
+                cumulative += bucket_count
+                histogram.append(
+                    {"le": "+Inf" if bound is None else str(bound), "count": cumulative}
+                )
+            return {
+                "engine": self.name,
+                "pool_size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+                "timeout_seconds": pool.timeout(),
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "checkout_latency_ms": _summary(
+                    self.wait_count, self.wait_total_ms, self.wait_max_ms
+                ),
+                "hold_time_ms": _summary(
+                    self.hold_count, self.hold_total_ms, self.hold_max_ms
+                ),
+                "wait_time_histogram_ms": histogram,
+            }
+
+
+def _summary(count: int, total_ms: float, max_ms: float) -> dict:
+    return {
+        "count": count,
+        "avg": total_ms / count if count else 0.0,
+        "max": max_ms,
+    }
+
+
+class _TimedPoolMixin:
+    metrics: PoolMetrics | None = None
+
+    def connect(self):
+        if self.metrics is None:
+            return super().connect()
+        started = time.perf_counter()
+        timed_out = False
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            self.metrics.observe_wait((time.perf_counter() - started) * 1000, timed_out)
+
+    def recreate(self):
+        # engine.dispose() swaps in a fresh pool; keep feeding the same metrics
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def instrument_engine(engine: Engine, name: str) -> PoolMetrics:
+    """Attach a PoolMetrics collector to ``engine``'s (timed) pool."""
+    metrics = PoolMetrics(name)
+    engine.pool.metrics = metrics
+    event.listen(engine, "connect", metrics.on_connect)
+    event.listen(engine, "checkout", metrics.on_checkout)
+    event.listen(engine, "checkin", metrics.on_checkin)
+    event.listen(engine, "invalidate", metrics.on_invalidate)
+    return metrics
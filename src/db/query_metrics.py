@@ -0,0 +1,41 @@
+import time
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryStats:
+    """Statements executed and time spent in the database on behalf of one request."""
+
+    __slots__ = ("count", "total_seconds")
+
+    def __init__(self):
+        self.count = 0
+        self.total_seconds = 0.0
+
+    def observe(self, statement: str, elapsed_seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += elapsed_seconds
+
+
+# Set by the request middleware; sync endpoints run in a threadpool worker
+# with a copy of the context, which still points at the same QueryStats
+current_query_stats: ContextVar[QueryStats | None] = ContextVar("current_query_stats", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    # Kept on the execution context, which is dropped with a failed statement
+    context._query_started_at = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.observe(statement, time.perf_counter() - context._query_started_at)
+
+
+def instrument_queries(engine: Engine) -> None:
+    """Count statements and their execution time into the current request's QueryStats."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,152 @@
+import logging
+import re
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+
+from src.db.query_metrics import QueryStats
+from src.settings import settings
+
+logger = logging.getLogger(__name__)
+# Dedicated logger so slow statements can be routed to their own file (SQL_SLOW_QUERY_LOG)
+slow_query_log = logging.getLogger("src.db.slow_queries")
+
+# Findings kept for GET /database/profiler
+RECENT_FINDINGS = 50
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = r"(?:%\(\w+\)s|%s|\$\?|\?)"
+# An expanded IN list renders one placeholder per value
+_PLACEHOLDER_LIST = re.compile(rf"\(\s*(?:{_PLACEHOLDER}\s*,\s*)*{_PLACEHOLDER}\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> str:
+    """Shape of a statement: literals replaced by ``?``, placeholder lists collapsed.
+
+    Bound parameter values never appear in the statement text, and inline
+    literals are redacted here, so a fingerprint is safe to log. Statements
+    come out of SQLAlchemy's compiled cache, so the same few strings repeat
+    and the cache keeps this off the per-request cost.
+    """
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _PLACEHOLDER_LIST.sub("(...)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+def _route(scope: dict) -> str:
+    # The template, never the raw path, which can carry ids
+    return getattr(scope.get("route"), "path", "-")
+
+
+class ProfiledQueryStats(QueryStats):
+    """QueryStats that also counts each distinct statement and logs slow ones."""
+
+    __slots__ = ("statements", "slow_seconds", "slow_count", "scope")
+
+    def __init__(self, scope: dict, slow_seconds: float):
+        super().__init__()
+        # statement text -> [executions, seconds]
+        self.statements: dict[str, list] = {}
+        self.slow_seconds = slow_seconds
+        self.slow_count = 0
+        self.scope = scope
+
+    def observe(self, statement: str, elapsed_seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += elapsed_seconds
+        entry = self.statements.get(statement)
+        if entry is None:
+            self.statements[statement] = [1, elapsed_seconds]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed_seconds
+        if elapsed_seconds >= self.slow_seconds:
+            self.slow_count += 1
+            slow_query_log.warning(
+                "%.1f ms on %s %s: %s",
+                elapsed_seconds * 1000,
+                self.scope.get("method"),
+                _route(self.scope),
+                fingerprint(statement),
+            )
+
+
+class QueryProfiler:
+    """Per-request statement profiling, switched on and tuned through settings.
+
+    While SQL_PROFILER is off a request gets a plain QueryStats and nothing
+    beyond the /metrics counters is recorded. While on, every statement is
+    counted by its text, slow ones go to the slow-query log as they finish,
+    and at the end of the request any fingerprint executed at least
+    SQL_N_PLUS_ONE_THRESHOLD times is reported as a probable N+1.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests_profiled = 0
+        self.slow_statements = 0
+        self.n_plus_one_requests = 0
+        self.recent: deque[dict] = deque(maxlen=RECENT_FINDINGS)
+
+    def stats_for(self, scope: dict) -> QueryStats:
+        if not settings.SQL_PROFILER:
+            return QueryStats()
+        return ProfiledQueryStats(scope, settings.SQL_SLOW_QUERY_MS / 1000)
+
+    def finish(self, method: str, route: str, stats: QueryStats) -> None:
+        if not isinstance(stats, ProfiledQueryStats):
+            return
+        # Grouped by shape: IN lists of different lengths are distinct texts
+        repeated: dict[str, list] = {}
+        for statement, (count, seconds) in stats.statements.items():
+            entry = repeated.setdefault(fingerprint(statement), [0, 0.0])
+            entry[0] += count
+            entry[1] += seconds
+        findings = [
+            {
+                "method": method,
+                "route": route,
+                "statement": shape,
+                "executions": count,
+                "total_ms": round(seconds * 1000, 3),
+                "request_statements": stats.count,
+                "at": time.time(),
+            }
+            for shape, (count, seconds) in repeated.items()
+            if count >= settings.SQL_N_PLUS_ONE_THRESHOLD
+        ]
+        for finding in findings:
+            logger.warning(
+                "Probable N+1 on %s %s: %d of %d statements were %s",
+                method,
+                route,
+                finding["executions"],
+                stats.count,
+                finding["statement"],
+            )
+        with self._lock:
+            self.requests_profiled += 1
+            self.slow_statements += stats.slow_count
+            if findings:
+                self.n_plus_one_requests += 1
+                self.recent.extend(findings)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "enabled": settings.SQL_PROFILER,
+                "slow_query_ms": settings.SQL_SLOW_QUERY_MS,
+                "n_plus_one_threshold": settings.SQL_N_PLUS_ONE_THRESHOLD,
+                "requests_profiled": self.requests_profiled,
+                "slow_statements": self.slow_statements,
+                "n_plus_one_requests": self.n_plus_one_requests,
+                "recent_findings": list(self.recent),
+            }
+
+
+query_profiler = QueryProfiler()
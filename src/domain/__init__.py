@@ -5,6 +5,9 @@ from .tournament import Tournament
 from .mentorship import Mentorship
 from .violation import Violation
 from .game_player import GamePlayer
+from .player_stats import PlayerStats
+from .head_to_head import HeadToHead
+from .resource_version import ResourceVersionCounter
 
 __all__ = [
     "Game",
@@ -13,5 +16,8 @@ __all__ = [
     "Tournament",
     "Mentorship",
     "Violation",
-    "GamePlayer"
+    "GamePlayer",
+    "PlayerStats",
+    "HeadToHead",
+    "ResourceVersionCounter",
 ]
\ No newline at end of file
@@ -1,6 +1,6 @@
 import uuid
 from enum import Enum as PyEnum
-from sqlalchemy import Column, String, Integer, Float, Boolean, Enum, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, String, Integer, Float, Boolean, Enum, TIMESTAMP, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from src.base import Base
 
@@ -26,3 +26,27 @@ class Game(Base):
     player_black_id = Column(UUID(as_uuid=True), ForeignKey('players.player_id'), nullable=True)
     result = Column(Enum(WinState, name="win_state"), nullable=True)
     played_at = Column(TIMESTAMP(timezone=True), nullable=True)
+    # Both players' ratings when the game was recorded (feeds player_stats)
+    white_rating = Column(Integer, nullable=True)
+    black_rating = Column(Integer, nullable=True)
+    # Round of a paired event (Swiss, knockout, round-robin); NULL for ad-hoc games
+    round_number = Column(Integer, nullable=True)
+    # Knockout bracket position within the round: slot s's winner plays in
+    # slot s // 2 of the next round. NULL outside knockout brackets
+    slot = Column(Integer, nullable=True)
+
+    # Per-player and per-tournament lookups, newest/oldest first by date
+    __table_args__ = (
+        Index("ix_games_player_white_id_played_at", "player_white_id", "played_at"),
+        Index("ix_games_player_black_id_played_at", "player_black_id", "played_at"),
+        Index("ix_games_tournament_id_played_at", "tournament_id", "played_at"),
+        Index("ix_games_played_at", "played_at"),
+        # Unique per bracket slot; NULL slots (non-knockout games) never collide
+        Index(
+            "ix_games_tournament_id_round_number_slot",
+            "tournament_id",
+            "round_number",
+            "slot",
+            unique=True,
+        ),
+    )
@@ -1,5 +1,5 @@
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
 from src.base import Base
 
 
@@ -10,3 +10,5 @@ class GamePlayer(Base):
     player_id = Column(UUID(as_uuid=True), ForeignKey("players.player_id"), primary_key=True)
     color = Column(String(10), nullable=False)
     result = Column(String(10), nullable=False)
+
+    __table_args__ = (Index("ix_game_player_player_id", "player_id"),)
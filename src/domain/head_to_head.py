@@ -0,0 +1,32 @@
+from sqlalchemy import CheckConstraint, Column, ForeignKey, Index, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from src.base import Base
+
+
+class HeadToHead(Base):
+    """Game totals between two players, kept in step with ``games``.
+
+    Each unordered pair is stored once, with the lower UUID as
+    ``player_low_id``; wins are counted from both sides. Maintained in the
+    same transaction as every games write (see
+    ``src.repositories.player_stats``).
+    """
+
+    __tablename__ = "head_to_head"
+
+    player_low_id = Column(
+        UUID(as_uuid=True), ForeignKey("players.player_id", ondelete="CASCADE"), primary_key=True
+    )
+    player_high_id = Column(
+        UUID(as_uuid=True), ForeignKey("players.player_id", ondelete="CASCADE"), primary_key=True
+    )
+
+    games_played = Column(Integer, nullable=False, default=0)
+    low_wins = Column(Integer, nullable=False, default=0)
+    high_wins = Column(Integer, nullable=False, default=0)
+    draws = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        CheckConstraint("player_low_id < player_high_id", name="ck_head_to_head_pair_order"),
+        Index("ix_head_to_head_player_high_id", "player_high_id"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey
+from sqlalchemy import Column, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from src.base import Base
 
@@ -13,6 +13,9 @@ class Mentorship(Base):
         UUID(as_uuid=True), ForeignKey("players.player_id"), primary_key=True
     )
 
+    # The primary key already covers lookups by player_id
+    __table_args__ = (Index("ix_mentors_mentor_id", "mentor_id"),)
+
     def set_mentorship(self, player_id, mentor_id):
         self.player_id = player_id
         self.mentor_id = mentor_id
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Integer
+from sqlalchemy import Column, String, Integer, Index
 from sqlalchemy.dialects.postgresql import UUID
 from src.base import Base
 
@@ -15,6 +15,9 @@ class Player(Base):
     last_name = Column(String, nullable=False)
     rating = Column(Integer, nullable=False)
 
+    # Leaderboard order (rating DESC, player_id DESC) and rating-range lookups
+    __table_args__ = (Index("ix_players_rating_player_id", "rating", "player_id"),)
+
     def set_first_name(self, new_name: str):
         self.first_name = new_name
 
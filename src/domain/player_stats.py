@@ -0,0 +1,33 @@
+from sqlalchemy import BigInteger, Column, ForeignKey, Index, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from src.base import Base
+
+
+class PlayerStats(Base):
+    """Per-player, per-tournament game totals, kept in step with ``games``.
+
+    Every write to ``games`` adjusts these rows in the same transaction
+    (see ``src.repositories.player_stats``); overall totals are the sum
+    over a player's tournaments.
+    """
+
+    __tablename__ = "player_stats"
+
+    player_id = Column(
+        UUID(as_uuid=True), ForeignKey("players.player_id", ondelete="CASCADE"), primary_key=True
+    )
+    tournament_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("tournaments.tournament_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    games_played = Column(Integer, nullable=False, default=0)
+    wins = Column(Integer, nullable=False, default=0)
+    losses = Column(Integer, nullable=False, default=0)
+    draws = Column(Integer, nullable=False, default=0)
+    # Opponents' ratings when each game was recorded, and how many were summed
+    opponent_rating_sum = Column(BigInteger, nullable=False, default=0)
+    opponent_rating_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (Index("ix_player_stats_tournament_id", "tournament_id"),)
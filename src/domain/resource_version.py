@@ -0,0 +1,68 @@
+from sqlalchemy import DDL, BigInteger, Column, Integer, String, event
+from src.base import Base
+
+# Resources whose lists are served with ETags, by the tables they are read from
+RESOURCE_TABLES = {
+    "tournaments": ("tournaments",),
+    "players": ("players",),
+    "leaderboard": ("players", "player_stats", "skill_level"),
+    "standings": ("games", "players"),
+}
+
+BUMP_FUNCTION = """
+CREATE OR REPLACE FUNCTION bump_resource_versions() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO resource_versions (resource, backend_pid, version)
+    SELECT resource, pg_backend_pid(), 1 FROM unnest(TG_ARGV) AS resource
+    ON CONFLICT (resource, backend_pid)
+    DO UPDATE SET version = resource_versions.version + 1;
+    RETURN NULL;
+END
+$$
+"""
+
+
+def bump_triggers() -> dict[str, str]:
+    """CREATE TRIGGER statement per table, bumping every resource read from it."""
+    resources: dict[str, list[str]] = {}
+    for resource, tables in RESOURCE_TABLES.items():
+        for table in tables:
+            resources.setdefault(table, []).append(resource)
+    return {
+        table: (
+            f"CREATE OR REPLACE TRIGGER {table}_bump_resource_versions "
+            f"AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION bump_resource_versions("
+            + ", ".join(f"'{name}'" for name in names)
+            + ")"
+        )
+        for table, names in resources.items()
+    }
+
+
+class ResourceVersionCounter(Base):
+    """Write counters behind the list ETags, kept by triggers on the source tables.
+
+    Every statement that writes one of a resource's tables adds 1 to the
+    writing backend's row in the same transaction, so the sum over a
+    resource's rows moves exactly when a write to it commits, whichever
+    process made it. Each backend only touches its own row, so concurrent
+    writers never wait on each other here.
+    """
+
+    __tablename__ = "resource_versions"
+
+    resource = Column(String, primary_key=True)
+    backend_pid = Column(Integer, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+
+
+# create_all (tests, benchmark schemas) gets the triggers the migration adds
+event.listen(
+    Base.metadata, "after_create", DDL(BUMP_FUNCTION).execute_if(dialect="postgresql")
+)
+for _statement in bump_triggers().values():
+    event.listen(
+        Base.metadata, "after_create", DDL(_statement).execute_if(dialect="postgresql")
+    )
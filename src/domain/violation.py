@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, ForeignKey, TIMESTAMP
+from sqlalchemy import Column, String, ForeignKey, Index, TIMESTAMP
 from sqlalchemy.dialects.postgresql import UUID
 from src.base import Base
 
@@ -29,6 +29,11 @@ class Violation(Base):
     violation_date = Column(TIMESTAMP(timezone=True), nullable=False)
     consequence = Column(String, nullable=True)
 
+    __table_args__ = (
+        Index("ix_violations_player_id", "player_id"),
+        Index("ix_violations_game_id", "game_id"),
+    )
+
     def set_violation_type(self, new_type: str):
         self.violation_type = new_type
 
@@ -1,6 +1,8 @@
 import logging
 import sys
 
+from src.settings import settings
+
 def setup_logging():
     logging.basicConfig(
         level=logging.INFO,  # change to DEBUG if you want more noise
@@ -8,4 +10,11 @@ def setup_logging():
         handlers=[
             logging.StreamHandler(sys.stdout),
         ],
-    )
\ No newline at end of file
+    )
+
+    if settings.SQL_SLOW_QUERY_LOG:
+        handler = logging.FileHandler(settings.SQL_SLOW_QUERY_LOG)
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        slow_queries = logging.getLogger("src.db.slow_queries")
+        slow_queries.addHandler(handler)
+        slow_queries.propagate = False
@@ -1,4 +1,4 @@
-from fastapi import Depends, FastAPI, Request, HTTPException
+from fastapi import Depends, FastAPI, Request, HTTPException, Response
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
@@ -11,18 +11,46 @@ from src.domain.exceptions import (
     AppError,
 )
 from src.logging_config import setup_logging
+from src.api.conditional import ETAG_HEADER, NotModified, not_modified_response
+from src.api.pagination import NEXT_CURSOR_HEADER, PageParams, paged
+from src.api.request_metrics import MetricsMiddleware
+from src.settings import settings
 
 # DB
 from src.db.dependencies import get_db
 
 # Routers
-from src.api.player_endpoints import router as player_router
-from src.api.game_endpoints import router as game_router
-from src.api.mentorship_endpoints import router as mentorship_router
-from src.api.tournament_endpoints import router as tournament_router
-from src.api.skill_level_endpoints import router as skill_level_router
-from src.api.violation_endpoints import router as violation_router
-from src.api.relations_endpoints import router as relations_router
+from src.api.player_endpoints import (
+    router as player_router,
+    async_router as player_async_router,
+)
+from src.api.game_endpoints import (
+    router as game_router,
+    async_router as game_async_router,
+)
+from src.api.mentorship_endpoints import (
+    router as mentorship_router,
+    async_router as mentorship_async_router,
+)
+from src.api.tournament_endpoints import (
+    router as tournament_router,
+    async_router as tournament_async_router,
+)
+from src.api.skill_level_endpoints import (
+    router as skill_level_router,
+    async_router as skill_level_async_router,
+)
+from src.api.violation_endpoints import (
+    router as violation_router,
+    async_router as violation_async_router,
+)
+from src.api.relations_endpoints import (
+    router as relations_router,
+    async_router as relations_async_router,
+)
+from src.api.database_endpoints import router as database_router
+from src.api.cache_endpoints import router as cache_router
+from src.api.metrics_endpoints import router as metrics_router
 
 # Game_player Dependencies
 from src.services.game_player_service import GamePlayerService
@@ -39,13 +67,27 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, ETAG_HEADER],
 )
+# Outermost, so the recorded latency includes every other middleware
+app.add_middleware(MetricsMiddleware)
 
 setup_logging()
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
 # -- Routers --
+# With DB_ASYNC on, the async twins are registered first so they win the
+# match for every path they mirror; anything else falls through to the sync routers.
+if settings.DB_ASYNC:
+    app.include_router(game_async_router)
+    app.include_router(tournament_async_router)
+    app.include_router(skill_level_async_router)
+    app.include_router(player_async_router)
+    app.include_router(mentorship_async_router)
+    app.include_router(violation_async_router)
+    app.include_router(relations_async_router)
+
 app.include_router(game_router)
 app.include_router(tournament_router)
 app.include_router(skill_level_router)
@@ -53,11 +95,19 @@ app.include_router(player_router)
 app.include_router(mentorship_router)
 app.include_router(violation_router)
 app.include_router(relations_router)
+app.include_router(database_router)
+app.include_router(cache_router)
+app.include_router(metrics_router)
 
 
 #
 # Global Exception Handlers
 #
+@app.exception_handler(NotModified)
+async def not_modified_handler(request: Request, exc: NotModified):
+    return not_modified_response(exc)
+
+
 @app.exception_handler(NotFoundError)
 async def not_found_handler(request: Request, exc: NotFoundError):
     logger.warning(f"NotFoundError: {exc}")
@@ -106,8 +156,12 @@ def create_game_player(dto: GamePlayerCreate, db: Session = Depends(get_db)):
 
 
 @app.get("/game-players", response_model=list[GamePlayerResponse])
-def get_all_game_players(db: Session = Depends(get_db)):
-    return game_player_service.get_all_game_players(db)
+def get_all_game_players(
+    response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)
+):
+    return paged(
+        response, game_player_service.get_game_players_page(db, page.size, page.cursor)
+    )
 
 
 @app.delete("/game-players/{game_id}/{player_id}")
@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
 from src.domain.game_player import GamePlayer
+from src.repositories.pagination import keyset_page
 
 class GamePlayerRepository:
 
@@ -12,6 +13,11 @@ class GamePlayerRepository:
     def get_all(self, db: Session):
         return db.query(GamePlayer).all()
 
+    def get_page(self, db: Session, limit: int, cursor: str | None = None):
+        return keyset_page(
+            db.query(GamePlayer), [GamePlayer.game_id, GamePlayer.player_id], limit, cursor
+        )
+
     def get_by_ids(self, db: Session, game_id: int, player_id: int):
         return db.query(GamePlayer).filter(
             GamePlayer.game_id == game_id,
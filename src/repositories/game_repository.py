@@ -1,12 +1,34 @@
-import math
-from datetime import datetime, date
-import random
-from sqlalchemy import func, or_, text
+import uuid
+from collections.abc import Iterator, Sequence
+from datetime import datetime, date, time, timedelta, timezone
+from uuid import UUID
+from sqlalchemy import (
+    ARRAY,
+    Integer,
+    Row,
+    any_,
+    case,
+    column,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    text,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from src.domain.exceptions import ValidationError
 from src.repositories.game_repository_protocol import GameRepositoryProtocol
+from src.repositories.pagination import keyset_page
+from src.repositories.player_stats import count_games, uncount_games
 from src.domain.game import Game, WinState
 from src.domain.player import Player
+from src.domain.tournament import Tournament
 
 
 class GameRepository(GameRepositoryProtocol):
@@ -15,9 +37,265 @@ class GameRepository(GameRepositoryProtocol):
 
     def add_game(self, game: Game) -> str:
         self.session.add(game)
+        self.session.flush()
+        count_games(self.session, [game.game_id])
         self.session.commit()
         return f"Added game_id: {game.game_id}"
 
+    def record_game_with_ratings(
+        self, game: Game, white_change: int, black_change: int
+    ) -> dict[UUID, int]:
+        """Insert ``game`` and apply both rating changes in one statement.
+
+        Runs as a single round trip:
+        WITH new_game AS (INSERT INTO games ...)
+        UPDATE players SET rating = rating + CASE player_id ... END RETURNING ...
+        The increment happens under the row lock, so concurrent results for
+        the same player can't overwrite each other. The game's player_stats
+        rows follow in the same transaction. Returns the new ratings.
+        """
+        if game.game_id is None:
+            game.game_id = uuid.uuid4()
+        new_game = (
+            insert(Game)
+            .values(
+                {
+                    **{c.key: getattr(game, c.key) for c in Game.__table__.columns},
+                    # Ratings before this game: the CTE reads the pre-update rows
+                    "white_rating": select(Player.rating)
+                    .where(Player.player_id == game.player_white_id)
+                    .scalar_subquery(),
+                    "black_rating": select(Player.rating)
+                    .where(Player.player_id == game.player_black_id)
+                    .scalar_subquery(),
+                }
+            )
+            .returning(Game.game_id)
+            .cte("new_game")
+        )
+        statement = (
+            update(Player)
+            .where(Player.player_id.in_([game.player_white_id, game.player_black_id]))
+            .values(
+                rating=Player.rating
+                + case(
+                    (Player.player_id == game.player_white_id, white_change),
+                    else_=black_change,
+                )
+            )
+            .returning(Player.player_id, Player.rating)
+            .add_cte(new_game)
+        )
+        try:
+            rows = self.session.execute(statement).all()
+            if len(rows) != 2:
+                raise ValidationError("Could not record game: player not found.")
+            count_games(self.session, [game.game_id])
+            self.session.commit()
+        except IntegrityError as exc:
+            self.session.rollback()
+            raise ValidationError("Could not record game: unknown tournament or player.") from exc
+        except Exception:
+            self.session.rollback()
+            raise
+        return {player_id: rating for player_id, rating in rows}
+
+    def add_games_bulk(self, rows: list[dict], rating_changes: dict[UUID, int]) -> int:
+        """Insert many games and apply their rating changes in one transaction.
+
+        The games go out as multi-row INSERTs, are counted into player_stats
+        with the ratings from before the batch, and every rating change is
+        applied by a single UPDATE ... FROM (VALUES ...) statement.
+        """
+        try:
+            if rows:
+                self.session.execute(insert(Game), rows)
+                count_games(self.session, [row["game_id"] for row in rows])
+            if rating_changes:
+                changes = values(
+                    column("player_id", PG_UUID(as_uuid=True)),
+                    column("change", Integer),
+                    name="rating_changes",
+                ).data(list(rating_changes.items()))
+                self.session.execute(
+                    update(Player)
+                    .where(Player.player_id == changes.c.player_id)
+                    .values(rating=Player.rating + changes.c.change)
+                )
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        return len(rows)
+
+    def add_scheduled_games(
+        self,
+        tournament_id: UUID,
+        round_numbers: Sequence[int],
+        white_ids: Sequence[UUID | None],
+        black_ids: Sequence[UUID | None],
+        results: Sequence[WinState | None],
+        slots: Sequence[int | None] | None = None,
+    ) -> list[UUID]:
+        """Insert a tournament's paired games with one INSERT ... SELECT FROM unnest(...).
+
+        The arrays are parallel, one element per game; returns the ids of
+        the games inserted, in input order. A game whose bracket slot is
+        already taken is skipped, so a knockout round is only created once
+        however many callers race to advance it. Rating snapshots are taken
+        in the same statement, as updating fresh rows would re-run their
+        foreign key checks. No ratings change, and byes (a win with one
+        player missing) are kept out of player_stats.
+        """
+        game_ids = [uuid.uuid4() for _ in round_numbers]
+        if not game_ids:
+            return []
+        try:
+            inserted = set(
+                self.session.scalars(
+                    text(
+                        "INSERT INTO games (game_id, tournament_id, round_number, slot, "
+                        "player_white_id, player_black_id, result, white_rating, black_rating) "
+                        "SELECT new.game_id, :tournament_id, new.round_number, new.slot, "
+                        "new.white_id, new.black_id, new.result, white.rating, black.rating "
+                        "FROM unnest(CAST(:game_ids AS uuid[]), CAST(:round_numbers AS integer[]), "
+                        "CAST(:slots AS integer[]), CAST(:white_ids AS uuid[]), "
+                        "CAST(:black_ids AS uuid[]), CAST(:results AS win_state[])) "
+                        "AS new(game_id, round_number, slot, white_id, black_id, result) "
+                        "LEFT JOIN players AS white ON white.player_id = new.white_id "
+                        "LEFT JOIN players AS black ON black.player_id = new.black_id "
+                        "ON CONFLICT DO NOTHING "
+                        "RETURNING game_id"
+                    ),
+                    {
+                        "tournament_id": tournament_id,
+                        "game_ids": game_ids,
+                        "round_numbers": [int(number) for number in round_numbers],
+                        "slots": [None] * len(game_ids) if slots is None else list(slots),
+                        "white_ids": list(white_ids),
+                        "black_ids": list(black_ids),
+                        "results": [None if result is None else result.value for result in results],
+                    },
+                )
+            )
+            count_games(self.session, inserted)
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        return [game_id for game_id in game_ids if game_id in inserted]
+
+    def find_existing_tournament_ids(self, tournament_ids: set[UUID]) -> set[UUID]:
+        if not tournament_ids:
+            return set()
+        return set(
+            self.session.scalars(
+                select(Tournament.tournament_id).where(
+                    Tournament.tournament_id.in_(tournament_ids)
+                )
+            )
+        )
+
+    def lock_tournament(self, tournament_id: UUID) -> bool:
+        """Lock the tournament row until the transaction ends; False if there is none.
+
+        Pairing reads a tournament's games and then inserts the next ones.
+        Holding this lock across both serialises concurrent callers, so a
+        round can't be paired twice from the same history.
+        """
+        return (
+            self.session.scalar(
+                select(Tournament.tournament_id)
+                .where(Tournament.tournament_id == tournament_id)
+                .with_for_update()
+            )
+            is not None
+        )
+
+    def get_rating_inputs(
+        self, player_ids: set[UUID], for_update: bool = False
+    ) -> dict[UUID, tuple[int, int]]:
+        """Current rating and rated-game count for each existing player.
+
+        With ``for_update`` the player rows stay locked (in id order, so
+        concurrent callers can't deadlock) until the transaction ends, which
+        keeps the ratings stable until the changes computed from them are
+        written.
+        """
+        if not player_ids:
+            return {}
+        rated = Game.result.is_not(None)
+        white_games = (
+            select(func.count())
+            .where(Game.player_white_id == Player.player_id, rated)
+            .scalar_subquery()
+        )
+        black_games = (
+            select(func.count())
+            .where(Game.player_black_id == Player.player_id, rated)
+            .scalar_subquery()
+        )
+        statement = (
+            select(Player.player_id, Player.rating, white_games + black_games)
+            .where(Player.player_id.in_(player_ids))
+            .order_by(Player.player_id)
+        )
+        if for_update:
+            statement = statement.with_for_update(of=Player)
+        return {
+            player_id: (rating, games)
+            for player_id, rating, games in self.session.execute(statement)
+        }
+
+    def get_player_ratings(self, player_ids: set[UUID] | None = None) -> dict[UUID, int]:
+        """Current rating of each existing player (every player for ``None``), without loading the rows."""
+        statement = select(Player.player_id, Player.rating)
+        if player_ids is not None:
+            if not player_ids:
+                return {}
+            # One array parameter rather than an IN list of up to 64k binds
+            statement = statement.where(
+                Player.player_id == any_(literal(list(player_ids), ARRAY(PG_UUID(as_uuid=True))))
+            )
+        return {player_id: rating for player_id, rating in self.session.execute(statement)}
+
+    def tournament_has_games(self, tournament_id: UUID) -> bool:
+        return self.session.scalar(
+            select(select(Game.game_id).where(Game.tournament_id == tournament_id).exists())
+        )
+
+    def get_tournament_pairing_history(self, tournament_id: UUID) -> list[Row]:
+        """Both players, result and round of every game in the tournament, in round order."""
+        return self.session.execute(
+            select(Game.player_white_id, Game.player_black_id, Game.result, Game.round_number)
+            .where(Game.tournament_id == tournament_id)
+            .order_by(Game.round_number.asc().nulls_first(), Game.played_at, Game.game_id)
+        ).all()
+
+    def get_bracket_round(self, tournament_id: UUID, round_number: int | None = None) -> list[Row]:
+        """One knockout round (the latest when ``round_number`` is None), by slot.
+
+        Reads only that round's rows, through the (tournament_id,
+        round_number, slot) index.
+        """
+        if round_number is None:
+            round_number = (
+                select(func.max(Game.round_number))
+                .where(Game.tournament_id == tournament_id, Game.slot.is_not(None))
+                .scalar_subquery()
+            )
+        return self.session.execute(
+            select(
+                Game.round_number, Game.slot, Game.player_white_id, Game.player_black_id, Game.result
+            )
+            .where(
+                Game.tournament_id == tournament_id,
+                Game.round_number == round_number,
+                Game.slot.is_not(None),
+            )
+            .order_by(Game.slot)
+        ).all()
+
     def find_game_by_id(self, game_id: str) -> Game:
         game = self.session.get(Game, game_id)
         self.session.commit()
@@ -27,10 +305,68 @@ class GameRepository(GameRepositoryProtocol):
     def get_all_games(self) -> list[Game]:
         return self.session.query(Game).all()
 
+    def get_games_page(self, limit: int, cursor: str | None = None) -> tuple[list[Game], str | None]:
+        return keyset_page(self.session.query(Game), [Game.game_id], limit, cursor)
+
+    # GameRead's fields in its order, for the rows the fast JSON path serializes as is
+    _GAME_READ_COLUMNS = (
+        Game.tournament_id,
+        Game.result,
+        Game.played_at,
+        Game.player_white_id,
+        Game.player_black_id,
+        Game.game_id,
+        Game.round_number,
+        Game.slot,
+    )
+
+    def get_game_rows_page(self, limit: int, cursor: str | None = None) -> tuple[list[Row], str | None]:
+        return keyset_page(self.session.query(*self._GAME_READ_COLUMNS), [Game.game_id], limit, cursor)
+
+    def stream_games(
+        self,
+        tournament_id: str | None = None,
+        player_id: str | None = None,
+        played_from: datetime | None = None,
+        played_to: datetime | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Sequence[Row]]:
+        """Yield matching games as batches of plain rows.
+
+        yield_per makes psycopg use a server-side cursor, so only one batch
+        is held in memory at a time regardless of how many games match.
+        """
+        query = select(
+            Game.game_id,
+            Game.tournament_id,
+            Game.player_white_id,
+            Game.player_black_id,
+            Game.result,
+            Game.played_at,
+        )
+        if tournament_id is not None:
+            query = query.where(Game.tournament_id == tournament_id)
+        if player_id is not None:
+            query = query.where(
+                or_(Game.player_white_id == player_id, Game.player_black_id == player_id)
+            )
+        if played_from is not None:
+            query = query.where(Game.played_at >= played_from)
+        if played_to is not None:
+            query = query.where(Game.played_at < played_to)
+
+        result = self.session.execute(query.execution_options(yield_per=batch_size))
+        try:
+            yield from result.partitions()
+        finally:
+            result.close()
+
     def find_games_by_played_date(self, played_date: date) -> list[Game]:
+        # A half-open range rather than date(played_at) so ix_games_played_at applies
+        day_start = datetime.combine(played_date, time.min)
         return (
             self.session.query(Game)
-            .filter(func.date(Game.played_at) == played_date)
+            .filter(Game.played_at >= day_start, Game.played_at < day_start + timedelta(days=1))
             .all()
         )
 
@@ -57,7 +393,13 @@ class GameRepository(GameRepositoryProtocol):
         game = self.session.get(Game, game_id)
         if not game:
             return None
+        uncount_games(self.session, [game.game_id])
         game.result = result
+        if game.played_at is None:
+            # Scheduled games are inserted undated; deciding one dates it
+            game.played_at = datetime.now(timezone.utc)
+        self.session.flush()
+        count_games(self.session, [game.game_id])
         self.session.commit()
         self.session.refresh(game)
         return game
@@ -66,7 +408,10 @@ class GameRepository(GameRepositoryProtocol):
         game = self.session.get(Game, game_id)
         if not game:
             return None
+        uncount_games(self.session, [game.game_id])
         game.tournament_id = new_tournament_id
+        self.session.flush()
+        count_games(self.session, [game.game_id])
         self.session.commit()
         self.session.refresh(game)
         return game
@@ -84,7 +429,12 @@ class GameRepository(GameRepositoryProtocol):
         game = self.session.get(Game, game_id)
         if not game:
             return None
+        uncount_games(self.session, [game.game_id])
         game.player_white_id = new_player_white_id
+        # Black's opponent changed; snapshot the new white player's rating
+        game.white_rating = None
+        self.session.flush()
+        count_games(self.session, [game.game_id])
         self.session.commit()
         self.session.refresh(game)
         return game
@@ -93,7 +443,12 @@ class GameRepository(GameRepositoryProtocol):
         game = self.session.get(Game, game_id)
         if not game:
             return None
+        uncount_games(self.session, [game.game_id])
         game.player_black_id = new_player_black_id
+        # White's opponent changed; snapshot the new black player's rating
+        game.black_rating = None
+        self.session.flush()
+        count_games(self.session, [game.game_id])
         self.session.commit()
         self.session.refresh(game)
         return game
@@ -102,57 +457,52 @@ class GameRepository(GameRepositoryProtocol):
         game = self.session.get(Game, game_id)
         if not game:
             return None
+        uncount_games(self.session, [game.game_id])
         self.session.delete(game)
         self.session.commit()
         return f"Deleted game_id: {game.game_id}"
 
-    #function for head to head stats between two players(Business Model)
-    def get_head_to_head_stats(self, player1_id: str, player2_id: str):
+    #head to head totals for each (player1, player2) pair, seen from player1's side (Business Model)
+    def get_head_to_head(self, pairs: Sequence[tuple[UUID, UUID]]) -> list[Row]:
+        if not pairs:
+            return []
         query = text("""
-        SELECT 
-            SUM(CASE WHEN gp1.result = 'WIN' THEN 1 ELSE 0 END) AS wins,
-            SUM(CASE WHEN gp1.result = 'LOSS' THEN 1 ELSE 0 END) AS losses,
-            SUM(CASE WHEN gp1.result = 'DRAW' THEN 1 ELSE 0 END) AS draws
-        FROM game_player gp1
-        JOIN game_player gp2
-            ON gp1.game_id = gp2.game_id
-        WHERE gp1.player_id = :p1
-          AND gp2.player_id = :p2
+        SELECT
+            req.player1_id,
+            req.player2_id,
+            coalesce(h.games_played, 0) AS games_played,
+            coalesce(CASE WHEN req.player1_id < req.player2_id THEN h.low_wins ELSE h.high_wins END, 0) AS wins,
+            coalesce(CASE WHEN req.player1_id < req.player2_id THEN h.high_wins ELSE h.low_wins END, 0) AS losses,
+            coalesce(h.draws, 0) AS draws
+        FROM unnest(CAST(:player1_ids AS uuid[]), CAST(:player2_ids AS uuid[]))
+            WITH ORDINALITY AS req(player1_id, player2_id, position)
+        LEFT JOIN head_to_head AS h
+            ON h.player_low_id = least(req.player1_id, req.player2_id)
+           AND h.player_high_id = greatest(req.player1_id, req.player2_id)
+        ORDER BY req.position
         """)
-
+        player1_ids, player2_ids = zip(*pairs)
         return self.session.execute(
-            query,
-            {"p1": player1_id, "p2": player2_id}
-        ).fetchone()
-
-    def generate_match_bracket(self, tournament_id: str):
-        # check if there are at least 2^n players and just create an empty games based on the amount
-        players = self.session.query(Player).all()
-        player_count = len(players)
-        if player_count < 2:
-            raise ValueError("At least two players are required before generating a bracket.")
-
-        random.shuffle(players)
-
-        max_power = 2 ** math.floor(math.log2(player_count))
-        bracket_size = max_power
-        selected_players = players[:bracket_size]
-
-        games_created = 0
-        for i in range(0, len(selected_players), 2):
-            white = selected_players[i]
-            black = selected_players[i + 1]
-
-            game = Game(
-                tournament_id=tournament_id,
-                player_white_id=white.player_id,
-                player_black_id=black.player_id,
-                result=None,
-                played_at=None,
-            )
-            self.session.add(game)
-            games_created += 1
+            query, {"player1_ids": list(player1_ids), "player2_ids": list(player2_ids)}
+        ).all()
 
-        self.session.commit()
-        return f"Generated {games_created} games for tournament {tournament_id}"
+    #every pair among player_ids that has met, seen from the lower id's side
+    def get_head_to_head_matrix(self, player_ids: Sequence[UUID]) -> list[Row]:
+        if not player_ids:
+            return []
+        query = text("""
+        SELECT
+            h.player_low_id AS player1_id,
+            h.player_high_id AS player2_id,
+            h.games_played,
+            h.low_wins AS wins,
+            h.high_wins AS losses,
+            h.draws
+        FROM head_to_head AS h
+        WHERE h.player_low_id = ANY(CAST(:player_ids AS uuid[]))
+          AND h.player_high_id = ANY(CAST(:player_ids AS uuid[]))
+          AND h.games_played > 0
+        ORDER BY h.player_low_id, h.player_high_id
+        """)
+        return self.session.execute(query, {"player_ids": list(player_ids)}).all()
 
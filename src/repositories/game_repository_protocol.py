@@ -1,5 +1,9 @@
+from collections.abc import Iterator, Sequence
 from datetime import datetime, date
 from typing import Protocol
+from uuid import UUID
+
+from sqlalchemy import Row
 
 from src.domain.game import Game, WinState
 
@@ -9,11 +13,48 @@ class GameRepositoryProtocol(Protocol):
 
     #C
     def add_game(self, game: Game) -> str: ...
+    def record_game_with_ratings(
+        self, game: Game, white_change: int, black_change: int
+    ) -> dict[UUID, int]: ...
+    def add_games_bulk(self, rows: list[dict], rating_changes: dict[UUID, int]) -> int: ...
+    def add_scheduled_games(
+        self,
+        tournament_id: UUID,
+        round_numbers: Sequence[int],
+        white_ids: Sequence[UUID | None],
+        black_ids: Sequence[UUID | None],
+        results: Sequence[WinState | None],
+        slots: Sequence[int | None] | None = None,
+    ) -> list[UUID]: ...
 
     #R
     def get_all_games(self) -> list[Game]: ...
+    def get_games_page(self, limit: int, cursor: str | None = None) -> tuple[list[Game], str | None]: ...
+    def get_game_rows_page(self, limit: int, cursor: str | None = None) -> tuple[list[Row], str | None]: ...
 
     def find_game_by_id(self, game_id: str) -> Game | None: ...
+    def find_existing_tournament_ids(self, tournament_ids: set[UUID]) -> set[UUID]: ...
+    def lock_tournament(self, tournament_id: UUID) -> bool: ...
+    def get_rating_inputs(
+        self, player_ids: set[UUID], for_update: bool = False
+    ) -> dict[UUID, tuple[int, int]]: ...
+
+    def get_player_ratings(self, player_ids: set[UUID] | None = None) -> dict[UUID, int]: ...
+
+    def tournament_has_games(self, tournament_id: UUID) -> bool: ...
+
+    def get_tournament_pairing_history(self, tournament_id: UUID) -> list[Row]: ...
+
+    def get_bracket_round(self, tournament_id: UUID, round_number: int | None = None) -> list[Row]: ...
+    def stream_games(
+        self,
+        tournament_id: str | None = None,
+        player_id: str | None = None,
+        played_from: datetime | None = None,
+        played_to: datetime | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Sequence[Row]]: ...
+
     def find_games_by_played_date(self, played_date: date) -> list[Game]: ...
     def find_games_by_result(self, result: WinState) -> list[Game]: ...
     def find_games_by_tournament_id(self, tournament_id: str) -> list[Game]: ...
@@ -35,8 +76,9 @@ class GameRepositoryProtocol(Protocol):
     #D
     def delete_game_by_id(self, game_id: str) -> str | None: ...
 
-    def generate_match_bracket(self, tournament_id: str) -> str: ...
 
 
-    #Read-only query for head to head stats between two players(Business Model)
-    def get_head_to_head_stats(self, player1_id: str, player2_id: str): ...
+    #Read-only queries over the head_to_head aggregate(Business Model)
+    def get_head_to_head(self, pairs: Sequence[tuple[UUID, UUID]]) -> list[Row]: ...
+
+    def get_head_to_head_matrix(self, player_ids: Sequence[UUID]) -> list[Row]: ...
@@ -17,10 +17,10 @@ class MentorshipRepository(MentorshipRepositoryProtocol):
         return self.session.query(Mentorship).all()
 
     def get_by_player_id(self, player_id: str) -> list[Mentorship]:
-        return self.session.query(Mentorship).filter(Mentorship.player_id == player_id)
+        return self.session.query(Mentorship).filter(Mentorship.player_id == player_id).all()
 
     def get_by_mentor_id(self, mentor_id: str) -> list[Mentorship]:
-        return self.session.query(Mentorship).filter(Mentorship.mentor_id == mentor_id)
+        return self.session.query(Mentorship).filter(Mentorship.mentor_id == mentor_id).all()
 
     def get_by_player_and_mentor_id(self, player_id: str, mentor_id: str) -> Mentorship:
         return (
@@ -0,0 +1,93 @@
+import base64
+import json
+import uuid
+from datetime import date, datetime
+from typing import Any, Sequence
+
+from sqlalchemy import and_, or_, tuple_
+from sqlalchemy.orm import InstrumentedAttribute, Query
+
+from src.domain.exceptions import ValidationError
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+_DECODERS = {
+    uuid.UUID: uuid.UUID,
+    datetime: datetime.fromisoformat,
+    date: date.fromisoformat,
+}
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Pack the sort-key values of the last row into an opaque cursor."""
+    payload = json.dumps(
+        [
+            None if v is None else v.isoformat() if isinstance(v, (date, datetime)) else str(v)
+            for v in values
+        ]
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: Sequence[InstrumentedAttribute]) -> list[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw_values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(raw_values, list) or len(raw_values) != len(keys):
+            raise ValueError("cursor does not match the sort key")
+        values = []
+        for key, raw in zip(keys, raw_values):
+            python_type = key.type.python_type
+            values.append(None if raw is None else _DECODERS.get(python_type, python_type)(raw))
+        return values
+    except (ValueError, TypeError) as exc:
+        raise ValidationError("Invalid cursor.") from exc
+
+
+def _beyond(keys: Sequence[InstrumentedAttribute], values: Sequence[Any], descending: bool):
+    left = keys[0] if len(keys) == 1 else tuple_(*keys)
+    right = values[0] if len(keys) == 1 else tuple_(*values)
+    return left < right if descending else left > right
+
+
+def keyset_page(
+    query: Query,
+    keys: Sequence[InstrumentedAttribute],
+    limit: int,
+    cursor: str | None = None,
+    descending: bool = False,
+    offset: int = 0,
+    nulls_last: bool = False,
+) -> tuple[list, str | None]:
+    """Return one page of ``query`` ordered by ``keys`` plus the next cursor.
+
+    Rows are fetched with ``WHERE (keys) > (cursor values) ORDER BY keys
+    LIMIT n`` (``<`` and ``DESC`` with ``descending``), so every page is an
+    index range scan no matter how deep it is. ``offset`` skips rows of the
+    first page only; a cursor already says where to resume. The next cursor
+    is ``None`` on the last page.
+
+    With ``nulls_last`` the first key may be NULL: those rows come after all
+    the others, ordered by the remaining keys, which must not be NULL.
+    """
+    if cursor:
+        offset = 0
+        after = decode_cursor(cursor, keys)
+        if not nulls_last:
+            query = query.filter(_beyond(keys, after, descending))
+        elif after[0] is None:
+            query = query.filter(and_(keys[0].is_(None), _beyond(keys[1:], after[1:], descending)))
+        else:
+            query = query.filter(or_(_beyond(keys, after, descending), keys[0].is_(None)))
+
+    order = [key.desc() for key in keys] if descending else list(keys)
+    if nulls_last:
+        order[0] = order[0].nulls_last()
+    rows = query.order_by(*order).offset(offset).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor([getattr(last, key.key) for key in keys])
@@ -0,0 +1,47 @@
+from typing import Any
+
+from sqlalchemy import Subquery, case, literal, select, union_all
+
+from src.domain.game import Game, WinState
+
+
+def player_games(player_id: Any = None) -> Subquery:
+    """One row per player per game, seen from that player's side.
+
+    Columns: game_id, tournament_id, played_at, player_id, opponent_id,
+    opponent_rating (as stamped on the game), color ("WHITE"/"BLACK") and
+    outcome ("WIN"/"LOSS"/"DRAW", NULL while undecided). It is the UNION ALL of a white branch and a black branch,
+    so a ``player_id`` filter becomes two index scans instead of an
+    OR-join over every game; pass it here to have it applied per branch.
+    """
+
+    def side(player_column, opponent_column, opponent_rating, color: str, win: WinState, loss: WinState):
+        query = select(
+            Game.game_id,
+            Game.tournament_id,
+            Game.played_at,
+            player_column.label("player_id"),
+            opponent_column.label("opponent_id"),
+            opponent_rating.label("opponent_rating"),
+            literal(color).label("color"),
+            case(
+                (Game.result == win, "WIN"),
+                (Game.result == loss, "LOSS"),
+                (Game.result == WinState.DRAW, "DRAW"),
+                else_=None,
+            ).label("outcome"),
+        )
+        if player_id is None:
+            return query.where(player_column.is_not(None))
+        return query.where(player_column == player_id)
+
+    return union_all(
+        side(
+            Game.player_white_id, Game.player_black_id, Game.black_rating,
+            "WHITE", WinState.WHITE_WIN, WinState.BLACK_WIN,
+        ),
+        side(
+            Game.player_black_id, Game.player_white_id, Game.white_rating,
+            "BLACK", WinState.BLACK_WIN, WinState.WHITE_WIN,
+        ),
+    ).subquery("player_games")
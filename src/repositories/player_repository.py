@@ -1,5 +1,12 @@
+from collections.abc import Iterator, Sequence
+from uuid import UUID
+
+from sqlalchemy import Row, func, select, text
 from sqlalchemy.orm import Session
+from src.domain.game import Game
 from src.domain.player import Player
+from src.domain.violation import Violation
+from src.repositories.pagination import keyset_page
 from src.repositories.player_repository_protocol import PlayerRepositoryProtocol
 
 
@@ -25,6 +32,55 @@ class PlayerRepository(PlayerRepositoryProtocol):
     def get_all(self) -> list[Player]:
         return self.session.query(Player).all()
 
+    def get_page(
+        self, limit: int, cursor: str | None = None
+    ) -> tuple[list[Player], str | None]:
+        return keyset_page(self.session.query(Player), [Player.player_id], limit, cursor)
+
+    # PlayerRead's fields in its order, for the rows the fast JSON path serializes as is
+    _PLAYER_READ_COLUMNS = (Player.player_id, Player.first_name, Player.last_name, Player.rating)
+
+    def get_rows_page(self, limit: int, cursor: str | None = None) -> tuple[list[Row], str | None]:
+        return keyset_page(
+            self.session.query(*self._PLAYER_READ_COLUMNS), [Player.player_id], limit, cursor
+        )
+
+    def get_all_ids(self) -> list[UUID]:
+        return list(self.session.scalars(select(Player.player_id).order_by(Player.player_id)))
+
+    def stream_rated_games(self, batch_size: int = 10_000) -> Iterator[Sequence[Row]]:
+        """Yield (white_id, black_id, result) of every decided game, oldest first.
+
+        Games without a date are replayed last, each tournament's in round
+        and bracket-slot order; game_id breaks the remaining ties so every
+        recompute sees the same order.
+        """
+        statement = (
+            select(Game.player_white_id, Game.player_black_id, Game.result)
+            .where(
+                Game.result.is_not(None),
+                Game.player_white_id.is_not(None),
+                Game.player_black_id.is_not(None),
+            )
+            .order_by(
+                Game.played_at.asc().nulls_last(),
+                Game.tournament_id,
+                Game.round_number.asc().nulls_last(),
+                Game.slot.asc().nulls_last(),
+                Game.game_id,
+            )
+            .execution_options(yield_per=batch_size)
+        )
+        yield from self.session.execute(statement).partitions()
+
+    def count_violations_by_player(self) -> list[tuple[UUID, int]]:
+        return [
+            (player_id, count)
+            for player_id, count in self.session.execute(
+                select(Violation.player_id, func.count()).group_by(Violation.player_id)
+            )
+        ]
+
     def get_by_first_name(self, first_name: str) -> list[Player]:
         return self.session.query(Player).filter(Player.first_name == first_name).all()
 
@@ -105,6 +161,20 @@ class PlayerRepository(PlayerRepositoryProtocol):
         self.session.refresh(player)
         return player
 
+    def replace_ratings(self, player_ids: list[UUID], ratings: list[int]) -> int:
+        """Overwrite many ratings with one UPDATE ... FROM unnest(...) statement."""
+        result = self.session.execute(
+            text(
+                "UPDATE players SET rating = new.rating "
+                "FROM unnest(CAST(:ids AS uuid[]), CAST(:ratings AS integer[])) "
+                "AS new(player_id, rating) "
+                "WHERE players.player_id = new.player_id"
+            ),
+            {"ids": player_ids, "ratings": ratings},
+        )
+        self.session.commit()
+        return result.rowcount
+
     # -- Delete Operations --
     def delete_by_id(self, player_id: str) -> Player:
         player = self.session.get(Player, player_id)
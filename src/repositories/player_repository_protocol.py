@@ -1,4 +1,9 @@
+from collections.abc import Iterator, Sequence
 from typing import Protocol
+from uuid import UUID
+
+from sqlalchemy import Row
+
 from src.domain.player import Player
 
 
@@ -12,6 +17,18 @@ class PlayerRepositoryProtocol(Protocol):
     # -- Read Operations --
     def get_all(self) -> list[Player]: ...
 
+    def get_page(
+        self, limit: int, cursor: str | None = None
+    ) -> tuple[list[Player], str | None]: ...
+
+    def get_rows_page(self, limit: int, cursor: str | None = None) -> tuple[list[Row], str | None]: ...
+
+    def get_all_ids(self) -> list[UUID]: ...
+
+    def stream_rated_games(self, batch_size: int = 10_000) -> Iterator[Sequence[Row]]: ...
+
+    def count_violations_by_player(self) -> list[tuple[UUID, int]]: ...
+
     def get_by_first_name(self, first_name: str) -> list[Player]: ...
 
     def get_by_last_name(self, last_name: str) -> list[Player]: ...
@@ -41,5 +58,7 @@ class PlayerRepositoryProtocol(Protocol):
         self, player_id: str, rating_increment: int
     ) -> Player: ...
 
+    def replace_ratings(self, player_ids: list[UUID], ratings: list[int]) -> int: ...
+
     # -- Delete Operations --
     def delete_by_id(self, player_id: str) -> Player: ...
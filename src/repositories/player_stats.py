@@ -0,0 +1,129 @@
+from collections.abc import Collection
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+# Snapshot both players' current ratings onto games that don't have them yet
+_STAMP_RATINGS = """
+UPDATE games SET
+    white_rating = coalesce(
+        white_rating, (SELECT rating FROM players WHERE player_id = games.player_white_id)
+    ),
+    black_rating = coalesce(
+        black_rating, (SELECT rating FROM players WHERE player_id = games.player_black_id)
+    )
+WHERE (
+    (white_rating IS NULL AND player_white_id IS NOT NULL)
+    OR (black_rating IS NULL AND player_black_id IS NOT NULL)
+) {games_filter}
+"""
+
+# Fold games into player_stats, one row per (player, tournament) touched;
+# :sign is 1 to count the games and -1 to take them back out. A bye (a
+# result with no opponent) isn't a game played and is left out
+_APPLY_GAMES = """
+INSERT INTO player_stats AS s (
+    player_id, tournament_id, games_played, wins, losses, draws,
+    opponent_rating_sum, opponent_rating_count
+)
+SELECT
+    side.player_id,
+    g.tournament_id,
+    :sign * count(*),
+    :sign * count(*) FILTER (WHERE g.result = side.win),
+    :sign * count(*) FILTER (WHERE g.result = side.loss),
+    :sign * count(*) FILTER (WHERE g.result = 'DRAW'),
+    :sign * coalesce(sum(side.opponent_rating), 0),
+    :sign * count(side.opponent_rating)
+FROM games AS g
+CROSS JOIN LATERAL (
+    VALUES
+        (g.player_white_id, g.black_rating, 'WHITE_WIN'::win_state, 'BLACK_WIN'::win_state),
+        (g.player_black_id, g.white_rating, 'BLACK_WIN'::win_state, 'WHITE_WIN'::win_state)
+) AS side (player_id, opponent_rating, win, loss)
+WHERE side.player_id IS NOT NULL
+    AND NOT (g.result IS NOT NULL AND (g.player_white_id IS NULL OR g.player_black_id IS NULL))
+    {games_filter}
+GROUP BY side.player_id, g.tournament_id
+ON CONFLICT (player_id, tournament_id) DO UPDATE SET
+    games_played = s.games_played + excluded.games_played,
+    wins = s.wins + excluded.wins,
+    losses = s.losses + excluded.losses,
+    draws = s.draws + excluded.draws,
+    opponent_rating_sum = s.opponent_rating_sum + excluded.opponent_rating_sum,
+    opponent_rating_count = s.opponent_rating_count + excluded.opponent_rating_count
+"""
+
+# Fold games into head_to_head, one row per unordered pair of players
+_APPLY_HEAD_TO_HEAD = """
+INSERT INTO head_to_head AS h (
+    player_low_id, player_high_id, games_played, low_wins, high_wins, draws
+)
+SELECT
+    least(g.player_white_id, g.player_black_id),
+    greatest(g.player_white_id, g.player_black_id),
+    :sign * count(*),
+    :sign * count(*) FILTER (
+        WHERE g.result = CASE WHEN g.player_white_id < g.player_black_id
+                              THEN 'WHITE_WIN'::win_state ELSE 'BLACK_WIN'::win_state END
+    ),
+    :sign * count(*) FILTER (
+        WHERE g.result = CASE WHEN g.player_white_id < g.player_black_id
+                              THEN 'BLACK_WIN'::win_state ELSE 'WHITE_WIN'::win_state END
+    ),
+    :sign * count(*) FILTER (WHERE g.result = 'DRAW')
+FROM games AS g
+WHERE g.player_white_id <> g.player_black_id {games_filter}
+GROUP BY 1, 2
+ON CONFLICT (player_low_id, player_high_id) DO UPDATE SET
+    games_played = h.games_played + excluded.games_played,
+    low_wins = h.low_wins + excluded.low_wins,
+    high_wins = h.high_wins + excluded.high_wins,
+    draws = h.draws + excluded.draws
+"""
+
+_ONLY_GAMES = "AND {alias}game_id = ANY(:game_ids)"
+
+
+def count_games(session: Session, game_ids: Collection[UUID]) -> None:
+    """Add freshly written games to player_stats and head_to_head (caller commits).
+
+    Stamps any missing rating snapshots first, so the opponent ratings
+    counted now are exactly the ones taken out again by ``uncount_games``.
+    """
+    if not game_ids:
+        return
+    params = {"game_ids": list(game_ids)}
+    session.execute(
+        text(_STAMP_RATINGS.format(games_filter=_ONLY_GAMES.format(alias=""))), params
+    )
+    for statement in (_APPLY_GAMES, _APPLY_HEAD_TO_HEAD):
+        session.execute(
+            text(statement.format(games_filter=_ONLY_GAMES.format(alias="g."))),
+            {**params, "sign": 1},
+        )
+
+
+def uncount_games(session: Session, game_ids: Collection[UUID]) -> None:
+    """Take games out of the aggregates before they are changed or deleted."""
+    if not game_ids:
+        return
+    for statement in (_APPLY_GAMES, _APPLY_HEAD_TO_HEAD):
+        session.execute(
+            text(statement.format(games_filter=_ONLY_GAMES.format(alias="g."))),
+            {"game_ids": list(game_ids), "sign": -1},
+        )
+
+
+def rebuild_player_stats(session: Session) -> int:
+    """Recompute player_stats and head_to_head from every game.
+
+    Returns the player_stats rows written.
+    """
+    session.execute(text("DELETE FROM player_stats"))
+    session.execute(text("DELETE FROM head_to_head"))
+    session.execute(text(_STAMP_RATINGS.format(games_filter="")))
+    session.execute(text(_APPLY_HEAD_TO_HEAD.format(games_filter="")), {"sign": 1})
+    result = session.execute(text(_APPLY_GAMES.format(games_filter="")), {"sign": 1})
+    return result.rowcount
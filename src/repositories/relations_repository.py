@@ -1,14 +1,20 @@
+from uuid import UUID
+
 from sqlalchemy.orm import Session, aliased
-from sqlalchemy import func, or_, and_, case
+from sqlalchemy import Float, case, cast, func, select, true
 from sqlalchemy.sql.functions import count
 
 from src.DTO.player_match_history import PlayerMatchHistoryRead
 from src.DTO.game import GameRead
 from src.domain.player import Player
-from src.domain.game import Game, WinState
+from src.domain.game import Game
+from src.domain.player_stats import PlayerStats
+from src.domain.exceptions import NotFoundError
 from src.domain.skill_level import SkillLevel
+from src.repositories.pagination import keyset_page
+from src.repositories.player_games import player_games
+from src.repositories.player_stats import rebuild_player_stats
 from src.repositories.relations_repository_protocol import RelationsRepositoryProtocol
-from src.repositories.helpers import player_stats
 
 
 class RelationsRepository(RelationsRepositoryProtocol):
@@ -16,121 +22,116 @@ class RelationsRepository(RelationsRepositoryProtocol):
         self.session = session
 
     def get_player_summary_by_id(self, player_id: str):
+        games = player_games(player_id)
         query = (
             self.session.query(
                 Player.first_name,
                 Player.last_name,
                 Player.rating,
-                SkillLevel.title,
-                count(Game.game_id).label("total_games"),
+                count(games.c.game_id).label("total_games"),
                 (
                     func.sum(
                         case(
-                            # Condition 1: Player was white AND white won
-                            (
-                                and_(
-                                    Player.player_id == Game.player_white_id,
-                                    Game.result == WinState.WHITE_WIN,
-                                ),
-                                1,
-                            ),
-                            # Condition 2: Player was black AND black won
-                            (
-                                and_(
-                                    Player.player_id == Game.player_black_id,
-                                    Game.result == WinState.BLACK_WIN,
-                                ),
-                                1,
-                            ),
-                            # Condition 3: Draw
-                            (Game.result == WinState.DRAW, 0.5),
+                            (games.c.outcome == "WIN", 1),
+                            (games.c.outcome == "DRAW", 0.5),
                             else_=0,
                         )
                     )
                     * 100.0
-                    / func.nullif(count(Game.game_id), 0)
+                    / func.nullif(count(games.c.game_id), 0)
                 ).label("win_rate"),
             )
-            .join(
-                Game,
-                or_(
-                    Player.player_id == Game.player_white_id,
-                    Player.player_id == Game.player_black_id,
-                ),
-            )
-            .join(
-                SkillLevel,
-                and_(
-                    Player.rating >= SkillLevel.rating_lower_bound,
-                    Player.rating <= SkillLevel.rating_upper_bound,
-                ),
-            )
+            .join(games, games.c.player_id == Player.player_id)
             .filter(Player.player_id == player_id)
-            .group_by(
-                Player.player_id, Player.first_name, Player.last_name, SkillLevel.title
-            )
+            .group_by(Player.player_id, Player.first_name, Player.last_name)
         )
 
         return query.first()
 
-    # Returns win/loss ratio, draw percentage, average opponent rating, and the most common opponent
-    def get_top_players(self):
-        wins, losses, draws = player_stats()
-
-        opponent = aliased(Player)
-        opponent_condition = or_(
-            and_(
-                Player.player_id == Game.player_white_id,
-                opponent.player_id == Game.player_black_id,
-            ),
-            and_(
-                Player.player_id == Game.player_black_id,
-                opponent.player_id == Game.player_white_id,
-            ),
+    # One row per player who has played: the page's players are walked in
+    # rating order (ix_players_rating_player_id) and only their player_stats
+    # rows are summed, with every ratio computed in SQL
+    def _top_players_query(self, skill_level: str | None = None):
+        totals = (
+            select(
+                func.sum(PlayerStats.games_played).label("games_played"),
+                func.sum(PlayerStats.wins).label("wins"),
+                func.sum(PlayerStats.losses).label("losses"),
+                func.sum(PlayerStats.draws).label("draws"),
+                func.sum(PlayerStats.opponent_rating_sum).label("opponent_rating_sum"),
+                func.sum(PlayerStats.opponent_rating_count).label("opponent_rating_count"),
+            )
+            .where(PlayerStats.player_id == Player.player_id)
+            .lateral("totals")
         )
+        decided = totals.c.wins + totals.c.losses + totals.c.draws
 
-        result = (
+        query = (
             self.session.query(
-                Player,
-                wins,
-                losses,
-                draws,
-                func.avg(opponent.rating).label("avgOppRating"),
-            )
-            .join(
-                Game,
-                or_(
-                    Player.player_id == Game.player_white_id,
-                    Player.player_id == Game.player_black_id,
-                ),
+                Player.player_id,
+                Player.first_name,
+                Player.last_name,
+                Player.rating,
+                case(
+                    (totals.c.losses > 0, cast(totals.c.wins, Float) / totals.c.losses),
+                    else_=cast(totals.c.wins, Float),
+                ).label("winLoss"),
+                case(
+                    (decided > 0, cast(totals.c.draws, Float) / decided),
+                    else_=0.0,
+                ).label("drawPercent"),
+                (
+                    cast(totals.c.opponent_rating_sum, Float)
+                    / func.nullif(totals.c.opponent_rating_count, 0)
+                ).label("avgOppRating"),
             )
-            .join(opponent, opponent_condition)
-            .group_by(Player.player_id)
-            .order_by(Player.rating.desc())
+            .join(totals, true())
+            .filter(totals.c.games_played > 0)
         )
+        if skill_level is not None:
+            level = self.session.get(SkillLevel, skill_level)
+            if level is None:
+                raise NotFoundError(f"Skill level '{skill_level}' not found.")
+            query = query.filter(
+                Player.rating >= level.rating_lower_bound,
+                Player.rating <= level.rating_upper_bound,
+            )
+        return query
 
-        players: list[Player] = []
-        for player, win_count, loss_count, draw_count, avg_rating in result:
-            total_played = win_count + loss_count + draw_count
-            player.winLoss = (win_count / loss_count) if loss_count else win_count
-            player.drawPercent = (draw_count / total_played) if total_played else 0.0
-            player.avgOppRating = float(avg_rating) if avg_rating is not None else None
-            players.append(player)
+    def get_top_players(self):
+        return self._top_players_query().order_by(Player.rating.desc(), Player.player_id.desc()).all()
+
+    def get_top_players_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        offset: int = 0,
+        skill_level: str | None = None,
+    ):
+        return keyset_page(
+            self._top_players_query(skill_level),
+            [Player.rating, Player.player_id],
+            limit,
+            cursor,
+            descending=True,
+            offset=offset,
+        )
 
-        return players
+    def rebuild_player_stats(self) -> int:
+        rows = rebuild_player_stats(self.session)
+        self.session.commit()
+        return rows
 
-    #SELECT * FROM games JOIN players ON player_id = player_id
+    #SELECT * FROM player_games JOIN games USING (game_id) JOIN players ON player_id = player_id
     def get_player_match_history(self, player_id: str):
+        games = player_games(player_id)
         rows = (
-            self.session.query(
-            Player.player_id, Player.first_name, Player.last_name, Game
-        ).join(Game,
-               or_(
-                   Player.player_id == Game.player_white_id,
-                   Player.player_id == Game.player_black_id,
-               ),
-               ).filter(Player.player_id == player_id).all()
-                )
+            self.session.query(Player.player_id, Player.first_name, Player.last_name, Game)
+            .join(games, games.c.player_id == Player.player_id)
+            .join(Game, Game.game_id == games.c.game_id)
+            .filter(Player.player_id == player_id)
+            .all()
+        )
         if not rows:
             return None
 
@@ -142,4 +143,41 @@ class RelationsRepository(RelationsRepositoryProtocol):
             first_name=first_name,
             last_name=last_name,
             match_history=history,
-        )
\ No newline at end of file
+        )
+
+    # Newest first, one index range scan per color: the player's filter is
+    # applied inside both branches of player_games and the page is cut on
+    # (played_at, game_id). Undated games (scheduled ones, and results
+    # submitted without played_at) follow the dated ones, newest id first,
+    # so the pages list the same games as get_player_match_history.
+    def get_player_match_history_page(
+        self, player_id: UUID, limit: int, cursor: str | None = None
+    ) -> tuple[list, str | None]:
+        games = player_games(player_id)
+        opponent = aliased(Player)
+        query = (
+            self.session.query(
+                games.c.game_id,
+                games.c.tournament_id,
+                games.c.played_at,
+                games.c.color,
+                games.c.outcome,
+                games.c.opponent_id,
+                opponent.first_name.label("opponent_first_name"),
+                opponent.last_name.label("opponent_last_name"),
+                games.c.opponent_rating,
+            )
+            .select_from(games)
+            .outerjoin(opponent, opponent.player_id == games.c.opponent_id)
+        )
+        rows, next_cursor = keyset_page(
+            query,
+            [games.c.played_at, games.c.game_id],
+            limit,
+            cursor,
+            descending=True,
+            nulls_last=True,
+        )
+        if not rows and self.session.get(Player, player_id) is None:
+            raise NotFoundError(f"Player with id {player_id} not found.")
+        return rows, next_cursor
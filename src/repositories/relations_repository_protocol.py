@@ -1,12 +1,28 @@
 from typing import Protocol
+from uuid import UUID
+
+from sqlalchemy import Row
 
 from src.DTO.player_match_history import PlayerMatchHistoryRead
 from src.domain import Game
-from src.domain.player import Player
 
 class RelationsRepositoryProtocol(Protocol):
     def get_player_summary_by_id(self, player_id: str): ...
 
-    def get_top_players(self) -> list[Player]: ...
+    def get_top_players(self) -> list[Row]: ...
+
+    def get_top_players_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        offset: int = 0,
+        skill_level: str | None = None,
+    ) -> tuple[list[Row], str | None]: ...
+
+    def get_player_match_history(self, player_id: str) -> PlayerMatchHistoryRead: ...
+
+    def get_player_match_history_page(
+        self, player_id: UUID, limit: int, cursor: str | None = None
+    ) -> tuple[list[Row], str | None]: ...
 
-    def get_player_match_history(self, player_id: str) -> PlayerMatchHistoryRead: ...
\ No newline at end of file
+    def rebuild_player_stats(self) -> int: ...
\ No newline at end of file
@@ -1,6 +1,10 @@
+from collections.abc import Collection
+from uuid import UUID
+
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import Row, select
 from sqlalchemy.exc import IntegrityError
+from src.domain.player import Player
 from src.domain.skill_level import SkillLevel
 from src.repositories.skill_level_repository_protocol import SkillLevelRepositoryProtocol
 
@@ -43,21 +47,13 @@ class SkillLevelRepository(SkillLevelRepositoryProtocol):
             self.session.rollback()
             raise Exception("Could not delete skill level due to a database constraint.")
 
-        
-    #Lookup skill level by player id (Business Model)
-    def lookup_skill_level_by_player_id(self, player_id: str):
-        query = text("""
-        SELECT 
-            p.player_id,
-            p.first_name,
-            s.title AS skill_level
-        FROM player p
-        INNER JOIN skill_level s
-            ON p.rating BETWEEN s.rating_lower AND s.rating_upper
-        WHERE p.player_id = :player_id
-        """)
 
+    # Ratings to classify, for each of the given players that exists
+    def get_player_ratings(self, player_ids: Collection[UUID]) -> list[Row]:
+        if not player_ids:
+            return []
         return self.session.execute(
-            query,
-            {"player_id": player_id}
-        ).fetchone()
\ No newline at end of file
+            select(Player.player_id, Player.first_name, Player.rating).where(
+                Player.player_id.in_(player_ids)
+            )
+        ).all()
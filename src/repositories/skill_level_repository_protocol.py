@@ -1,4 +1,9 @@
+from collections.abc import Collection
 from typing import Protocol
+from uuid import UUID
+
+from sqlalchemy import Row
+
 from src.domain.skill_level import SkillLevel
 
 class SkillLevelRepositoryProtocol(Protocol):
@@ -16,6 +21,9 @@ class SkillLevelRepositoryProtocol(Protocol):
     
     def delete_skill_level(self, skill_level_id: int) -> None:
         ...
+
+    def get_player_ratings(self, player_ids: Collection[UUID]) -> list[Row]:
+        ...
         
     #Could add if I have more time
     #def get_skill_levels_by_player_id(self, player_id: int) -> list[SkillLevel]:
@@ -1,10 +1,11 @@
 from uuid import UUID
-from sqlalchemy import or_
+from sqlalchemy import case, func, select
 from sqlalchemy.orm import Session
 from src.domain.tournament import Tournament
 from src.domain.player import Player
-from src.domain.game import Game
-from src.repositories.helpers import player_stats
+from src.domain.player_stats import PlayerStats
+from src.repositories.pagination import keyset_page
+from src.repositories.player_games import player_games
 from src.repositories.tournament_repository_protocol import TournamentRepositoryProtocol
 
 
@@ -14,6 +15,11 @@ class TournamentRepository(TournamentRepositoryProtocol):
         
     def get_all_tournaments(self) -> list[Tournament]:
         return self.session.query(Tournament).all()
+
+    def get_tournaments_page(self, limit: int, cursor: str | None = None) -> tuple[list[Tournament], str | None]:
+        return keyset_page(
+            self.session.query(Tournament), [Tournament.tournament_id], limit, cursor
+        )
     
     def get_tournament_by_id(self, tournament_id: str) -> Tournament | None:
         return self.session.get(Tournament, tournament_id)
@@ -46,18 +52,15 @@ class TournamentRepository(TournamentRepositoryProtocol):
         self.session.commit()
 
     def get_participants_by_tournament_id(self, tournament_id: str):
-        wins, losses, draws = player_stats()
-
         results = (
             self.session.query(
                 Player,
-                wins,
-                losses,
-                draws
+                PlayerStats.wins,
+                PlayerStats.losses,
+                PlayerStats.draws
             )
-            .join(Game, or_(Game.player_white_id == Player.player_id, Game.player_black_id == Player.player_id))
-            .filter(Game.tournament_id == tournament_id)
-            .group_by(Player.player_id, Player.first_name, Player.last_name, Player.rating)
+            .join(PlayerStats, PlayerStats.player_id == Player.player_id)
+            .filter(PlayerStats.tournament_id == tournament_id, PlayerStats.games_played > 0)
             .all()
         )
 
@@ -75,4 +78,67 @@ class TournamentRepository(TournamentRepositoryProtocol):
             return []
         return self.get_participants_by_tournament_id(tournament.tournament_id)
 
+    def get_tournament_results(self, tournament_id: UUID):
+        """Each player of the tournament with their games as compact arrays.
+
+        Players are numbered from 0 in name order and returned in that
+        order, as rows of (player_id, first_name, last_name, rating,
+        opponents, scores): ``opponents`` holds the opponent's number per
+        game (-1 for a bye) and ``scores`` the half-points the player made
+        in it (-1 while undecided). Numbering in the query keeps a large
+        tournament's result to one row per player instead of two per game.
+        """
+        games = player_games()
+        sides = (
+            select(
+                games.c.player_id,
+                games.c.opponent_id,
+                case(
+                    (games.c.outcome == "WIN", 2),
+                    (games.c.outcome == "DRAW", 1),
+                    (games.c.outcome == "LOSS", 0),
+                    else_=-1,
+                ).label("score"),
+            )
+            .where(games.c.tournament_id == tournament_id)
+            .cte("sides")
+        )
+        entrants = (
+            select(
+                Player.player_id,
+                Player.first_name,
+                Player.last_name,
+                Player.rating,
+                (
+                    func.row_number().over(
+                        order_by=(Player.last_name, Player.first_name, Player.player_id)
+                    ) - 1
+                ).label("number"),
+            )
+            .where(Player.player_id.in_(select(sides.c.player_id)))
+            .cte("entrants")
+        )
+        opponent = entrants.alias("opponent")
+        return self.session.execute(
+            select(
+                entrants.c.player_id,
+                entrants.c.first_name,
+                entrants.c.last_name,
+                entrants.c.rating,
+                func.array_agg(func.coalesce(opponent.c.number, -1)).label("opponents"),
+                func.array_agg(sides.c.score).label("scores"),
+            )
+            .select_from(sides)
+            .join(entrants, entrants.c.player_id == sides.c.player_id)
+            .outerjoin(opponent, opponent.c.player_id == sides.c.opponent_id)
+            .group_by(
+                entrants.c.player_id,
+                entrants.c.first_name,
+                entrants.c.last_name,
+                entrants.c.rating,
+                entrants.c.number,
+            )
+            .order_by(entrants.c.number)
+        ).all()
+
     #more methods might be added...
@@ -6,6 +6,9 @@ from src.domain.tournament import Tournament
 class TournamentRepositoryProtocol(Protocol):
     def get_all_tournaments(self) -> list[Tournament]:
         ...
+
+    def get_tournaments_page(self, limit: int, cursor: str | None = None) -> tuple[list[Tournament], str | None]:
+        ...
         
     def get_tournament_by_id(self, tournament_id: UUID) -> Tournament | None:
         ...
@@ -25,6 +28,8 @@ class TournamentRepositoryProtocol(Protocol):
     def get_participants_by_tournament_id(self, tournament_id: str): ...
 
     def get_participants_by_tournament_name(self, name: str): ...
+
+    def get_tournament_results(self, tournament_id: UUID): ...
     #Might add if I have more time
         
     #def get_tournaments_by_player_id(self, player_id: UUID) -> list[Tournament]:
@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 from uuid import UUID
 
 from src.domain.violation import Violation
+from src.repositories.pagination import keyset_page
 from src.repositories.violation_repository_protocol import ViolationRepositoryProtocol
 
 
@@ -20,6 +21,13 @@ class ViolationRepository(ViolationRepositoryProtocol):
     def get_all(self) -> list[Violation]:
         return self.session.query(Violation).all()
 
+    def get_page(
+        self, limit: int, cursor: str | None = None
+    ) -> tuple[list[Violation], str | None]:
+        return keyset_page(
+            self.session.query(Violation), [Violation.violation_id], limit, cursor
+        )
+
     def get_by_id(self, violation_id: UUID) -> Violation | None:
         return (
             self.session.query(Violation)
@@ -6,6 +6,7 @@ class ViolationRepositoryProtocol(Protocol):
     def add(self, violation: Violation) -> str: ...
 
     def get_all(self) -> list[Violation]: ...
+    def get_page(self, limit: int, cursor: str | None = None) -> tuple[list[Violation], str | None]: ...
     def get_by_id(self, violation_id: str) -> Violation: ...
     def get_by_player_id(self, player_id: str) -> list[Violation]: ...
     def get_by_game_id(self, game_id: str) -> list[Violation]: ...
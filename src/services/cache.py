@@ -0,0 +1,172 @@
+import threading
+import time
+from collections.abc import Callable
+from functools import wraps
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.settings import settings
+
+
+class TTLCache:
+    """Small in-process cache for expensive read models.
+
+    Entries expire after ``ttl_seconds`` and are dropped by ``invalidate``,
+    which the write paths call after they commit. A generation counter keeps
+    a load that raced with an invalidation from storing its stale result.
+    Loads run without holding the lock: on the async stack they execute on
+    the event loop thread, where waiting for another load would deadlock.
+    Each worker process holds its own copy, so ``invalidate`` only reaches
+    writes made in this process; callers that pass a ``version`` read from
+    the database counter also see writes made anywhere else.
+    """
+
+    def __init__(self, name: str, ttl_seconds: float, max_entries: int = 256):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: dict[Any, tuple[float, int | None, Any]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get_or_load(self, key: Any, loader: Callable[[], Any], version: int | None = None) -> Any:
+        """Cached value for ``key``, loaded again when expired or stored at another ``version``.
+
+        ``version`` must be read before calling, so the loaded value is at
+        least as new as the version it is stored under.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic() and entry[1] == version:
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+            generation = self._generation
+        value = loader()
+        with self._lock:
+            if generation == self._generation and self.ttl_seconds > 0:
+                if len(self._entries) >= self.max_entries:
+                    self._evict_expired()
+                if len(self._entries) < self.max_entries:
+                    self._entries[key] = (time.monotonic() + self.ttl_seconds, version, value)
+        return value
+
+    def _evict_expired(self) -> None:
+        now = time.monotonic()
+        for key in [
+            key for key, (expires, _, _) in self._entries.items() if expires <= now
+        ]:
+            del self._entries[key]
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self.invalidations += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": self.name,
+                "ttl_seconds": self.ttl_seconds,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+
+class ResourceVersion:
+    """Change counter for one resource, the source of its strong ETags.
+
+    The counter lives in the database (``resource_versions``): triggers on
+    the tables behind the resource bump it inside every writing
+    transaction, so writes from any worker, the CLI or psql all move it,
+    and only once they commit. Every worker reads the same value, which
+    keeps the tag strong behind a load balancer, and the caches of the
+    resource are keyed on it for the same reason.
+
+    Reading it is a database round trip summing one row per backend that
+    ever wrote the resource. Those rows outlive their backends until
+    ``compact`` (``python -m src.cli compact-resource-versions``) folds
+    them together; with pooled connections there are few of them.
+    """
+
+    _VERSION = text(
+        "SELECT coalesce(sum(version), 0) FROM resource_versions WHERE resource = :resource"
+    )
+
+    # Folds the rows of backends that are gone into backend_pid 0, keeping every sum
+    _COMPACT = text(
+        """
+        WITH gone AS (
+            DELETE FROM resource_versions
+            WHERE backend_pid <> 0
+              AND backend_pid NOT IN (SELECT pid FROM pg_stat_activity)
+            RETURNING resource, version
+        ), folded AS (
+            INSERT INTO resource_versions (resource, backend_pid, version)
+            SELECT resource, 0, sum(version) FROM gone GROUP BY resource ORDER BY resource
+            ON CONFLICT (resource, backend_pid)
+            DO UPDATE SET version = resource_versions.version + excluded.version
+        )
+        SELECT count(*) FROM gone
+        """
+    )
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def current(self, session: Session) -> int:
+        return session.scalar(self._VERSION, {"resource": self.name})
+
+    def etag(self, session: Session) -> str | None:
+        if not settings.ETAGS:
+            return None
+        return f'"{self.name}-{self.current(session)}"'
+
+    @classmethod
+    def compact(cls, session: Session) -> int:
+        """Fold the counter rows of finished backends together; returns the rows folded."""
+        folded = session.execute(cls._COMPACT).scalar_one()
+        session.commit()
+        return folded
+
+
+def invalidates(*caches: TTLCache):
+    """Decorate a service write so the given caches are dropped once it returns."""
+
+    def decorator(method):
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            result = method(*args, **kwargs)
+            for cache in caches:
+                cache.invalidate()
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+leaderboard_cache = TTLCache("leaderboard", settings.LEADERBOARD_CACHE_TTL)
+skill_level_cache = TTLCache("skill_levels", settings.SKILL_LEVEL_CACHE_TTL)
+standings_cache = TTLCache("standings", settings.STANDINGS_CACHE_TTL)
+
+CACHES = [leaderboard_cache, skill_level_cache, standings_cache]
+
+tournaments_version = ResourceVersion("tournaments")
+players_version = ResourceVersion("players")
+leaderboard_version = ResourceVersion("leaderboard")
+standings_version = ResourceVersion("standings")
+
+
+def cache_statistics() -> list[dict]:
+    return [cache.stats() for cache in CACHES]
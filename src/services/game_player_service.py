@@ -15,5 +15,8 @@ class GamePlayerService:
     def get_all_game_players(self, db: Session):
         return self.repo.get_all(db)
 
+    def get_game_players_page(self, db: Session, limit: int, cursor: str | None = None):
+        return self.repo.get_page(db, limit, cursor)
+
     def delete_game_player(self, db: Session, game_id: int, player_id: int):
         return self.repo.delete(db, game_id, player_id)
@@ -1,17 +1,151 @@
+import uuid
+from collections.abc import Iterator, Sequence
+from itertools import chain
+import numpy as np
+from sqlalchemy import Row
 from src.repositories.game_repository_protocol import GameRepositoryProtocol
+from src.domain.exceptions import ConflictError, NotFoundError, ValidationError
 from src.domain.game import Game, WinState
+from src.DTO.game import GameCreate
+from src.services.cache import invalidates, leaderboard_cache, standings_cache
+from src.services.rating_engine import (
+    WHITE_SCORES,
+    RatingEngine,
+    get_rating_engine,
+    rating_changes,
+    replay_games,
+)
+from src.services.knockout_bracket import next_round, seed_first_round
+from src.services.round_robin import berger_schedule
+from src.services.swiss_pairing import SwissField, pair_swiss_round
 from datetime import datetime, date
 
+MAX_BULK_GAMES = 10_000
+MAX_HEAD_TO_HEAD_PAIRS = 10_000
+MAX_HEAD_TO_HEAD_PLAYERS = 500
+MAX_SWISS_PLAYERS = 4096
+MAX_BRACKET_PLAYERS = 65_536
+MAX_ROUND_ROBIN_PLAYERS = 500
+
 
 class GameService:
-    def __init__(self, repo: GameRepositoryProtocol):
+    def __init__(self, repo: GameRepositoryProtocol, rating_engine: RatingEngine | None = None):
         self.repo = repo
+        self.rating_engine = rating_engine or get_rating_engine()
 
+    @invalidates(leaderboard_cache, standings_cache)
     def add_game(self, game: Game) -> str:
         if not isinstance(game, Game):
             raise ValueError(f"Expected type (Game), but received ({type(game)})")
         return self.repo.add_game(game)
 
+    @invalidates(leaderboard_cache, standings_cache)
+    def add_game_with_ratings(self, game: Game) -> str:
+        """Add a game and, if it has a result, both rating changes atomically."""
+        if not isinstance(game, Game):
+            raise ValueError(f"Expected type (Game), but received ({type(game)})")
+        if game.result is None or game.player_white_id is None or game.player_black_id is None:
+            return self.repo.add_game(game)
+        if game.player_white_id == game.player_black_id:
+            raise ValidationError("A player cannot play against themselves.")
+        if self.rating_engine.uses_player_state:
+            # Lock both players until the game and new ratings are committed
+            inputs = self.repo.get_rating_inputs(
+                {game.player_white_id, game.player_black_id}, for_update=True
+            )
+            if len(inputs) != 2:
+                raise ValidationError("Could not record game: player not found.")
+            (white_rating, white_games) = inputs[game.player_white_id]
+            (black_rating, black_games) = inputs[game.player_black_id]
+            white_change, black_change = rating_changes(
+                self.rating_engine, game.result,
+                white_rating, black_rating, white_games, black_games,
+            )
+        else:
+            white_change, black_change = rating_changes(self.rating_engine, game.result)
+        self.repo.record_game_with_ratings(game, white_change, black_change)
+        return f"Added game_id: {game.game_id}"
+
+    @invalidates(leaderboard_cache, standings_cache)
+    def add_games_bulk(self, items: list[GameCreate], atomic: bool = False) -> dict:
+        """Validate and insert a batch of games, reporting bad items by index.
+
+        Invalid items are skipped (or, with ``atomic``, the whole batch is
+        rejected); everything that is inserted, and its rating changes, is
+        written in a single transaction. Decided games are rated in
+        submission order.
+        """
+        if len(items) > MAX_BULK_GAMES:
+            raise ValidationError(f"At most {MAX_BULK_GAMES} games can be added at once.")
+
+        known_tournaments = self.repo.find_existing_tournament_ids(
+            {item.tournament_id for item in items}
+        )
+        rating_inputs = self.repo.get_rating_inputs(
+            {
+                player_id
+                for item in items
+                for player_id in (item.player_white_id, item.player_black_id)
+                if player_id is not None
+            },
+            for_update=self.rating_engine.uses_player_state,
+        )
+
+        rows: list[dict] = []
+        errors: list[dict] = []
+        rated: list[GameCreate] = []
+        for index, item in enumerate(items):
+            problem = self._bulk_item_problem(item, known_tournaments, rating_inputs.keys())
+            if problem:
+                errors.append({"index": index, "detail": problem})
+                continue
+            rows.append({**item.model_dump(), "game_id": uuid.uuid4()})
+            if item.result is not None:
+                rated.append(item)
+
+        if errors and atomic:
+            return {"inserted": 0, "game_ids": [], "errors": errors}
+
+        inserted = self.repo.add_games_bulk(rows, self._bulk_rating_changes(rated, rating_inputs))
+        return {
+            "inserted": inserted,
+            "game_ids": [row["game_id"] for row in rows],
+            "errors": errors,
+        }
+
+    def _bulk_rating_changes(
+        self, rated: list[GameCreate], rating_inputs: dict[uuid.UUID, tuple[int, int]]
+    ) -> dict[uuid.UUID, int]:
+        if not rated:
+            return {}
+        player_ids = list(rating_inputs)
+        index = {player_id: i for i, player_id in enumerate(player_ids)}
+        ratings = np.array([rating_inputs[p][0] for p in player_ids], dtype=np.int64)
+        games = np.array([rating_inputs[p][1] for p in player_ids], dtype=np.int64)
+        new_ratings, _ = replay_games(
+            self.rating_engine,
+            ratings,
+            games,
+            np.array([index[item.player_white_id] for item in rated], dtype=np.int64),
+            np.array([index[item.player_black_id] for item in rated], dtype=np.int64),
+            np.array([WHITE_SCORES[item.result] for item in rated], dtype=np.float64),
+        )
+        deltas = (new_ratings - ratings).tolist()
+        return {player_id: delta for player_id, delta in zip(player_ids, deltas) if delta}
+
+    @staticmethod
+    def _bulk_item_problem(item: GameCreate, known_tournaments: set, known_players: set) -> str | None:
+        if item.tournament_id not in known_tournaments:
+            return f"Tournament {item.tournament_id} not found."
+        for player_id in (item.player_white_id, item.player_black_id):
+            if player_id is not None and player_id not in known_players:
+                return f"Player {player_id} not found."
+        if item.player_white_id is not None and item.player_white_id == item.player_black_id:
+            return "A player cannot play against themselves."
+        if item.result is not None and (item.player_white_id is None or item.player_black_id is None):
+            return "A game with a result needs both players."
+        return None
+
     def find_game_by_id(self, game_id: str) -> Game:
         if not isinstance(game_id, str):
             raise ValueError(f"Expected type (str), but received ({type(game_id)})")
@@ -23,6 +157,23 @@ class GameService:
     def get_all_games(self) -> list[Game]:
         return self.repo.get_all_games()
 
+    def get_games_page(self, limit: int, cursor: str | None = None) -> tuple[list[Game], str | None]:
+        return self.repo.get_games_page(limit, cursor)
+
+    def get_game_rows_page(self, limit: int, cursor: str | None = None) -> tuple[list[Row], str | None]:
+        return self.repo.get_game_rows_page(limit, cursor)
+
+    def export_games(
+        self,
+        tournament_id: str | None = None,
+        player_id: str | None = None,
+        played_from: datetime | None = None,
+        played_to: datetime | None = None,
+    ) -> Iterator[Sequence[Row]]:
+        if played_from is not None and played_to is not None and played_to < played_from:
+            raise ValidationError("played_to cannot be before played_from.")
+        return self.repo.stream_games(tournament_id, player_id, played_from, played_to)
+
     def find_games_by_played_date(self, played_date: date) -> list[Game]:
         if not isinstance(played_date, date):
             raise ValueError(f"Expected type (date), but received ({type(played_date)})")
@@ -53,13 +204,23 @@ class GameService:
             raise ValueError(f"Expected type (str), but received ({type(player_id)})")
         return self.repo.find_games_by_player_id(player_id)
 
+    @invalidates(leaderboard_cache, standings_cache)
     def update_game_result(self, game_id: str, result: WinState) -> Game | None:
         if not isinstance(game_id, str):
             raise ValueError(f"Expected type (str) for game_id, but received ({type(game_id)})")
         if not isinstance(result, WinState):
             raise ValueError(f"Expected type (WinState) for result, but received ({type(result)})")
-        return self.repo.update_game_result(game_id, result)
+        game = self.repo.update_game_result(game_id, result)
+        if game is not None and game.slot is not None:
+            # The result that completes a knockout round creates the next one
+            round_games = self.repo.get_bracket_round(game.tournament_id, game.round_number)
+            if len(round_games) > 1 and all(
+                g.result in (WinState.WHITE_WIN, WinState.BLACK_WIN) for g in round_games
+            ):
+                self._advance_bracket(game.tournament_id, round_games)
+        return game
 
+    @invalidates(standings_cache)
     def update_game_tournament_id(self, game_id: str, new_tournament_id: str) -> Game | None:
         if not isinstance(game_id, str):
             raise ValueError(f"Expected type (str) for game_id, but received ({type(game_id)})")
@@ -74,6 +235,7 @@ class GameService:
             raise ValueError(f"Expected type (datetime) for newDate, but received ({type(newDate)})")
         return self.repo.update_game_played_at(game_id, newDate)
 
+    @invalidates(leaderboard_cache, standings_cache)
     def update_game_player_white_id(self, game_id: str, new_player_white_id: str) -> Game | None:
         if not isinstance(game_id, str):
             raise ValueError(f"Expected type (str) for game_id, but received ({type(game_id)})")
@@ -83,6 +245,7 @@ class GameService:
             )
         return self.repo.update_game_player_white_id(game_id, new_player_white_id)
 
+    @invalidates(leaderboard_cache, standings_cache)
     def update_game_player_black_id(self, game_id: str, new_player_black_id: str) -> Game | None:
         if not isinstance(game_id, str):
             raise ValueError(f"Expected type (str) for game_id, but received ({type(game_id)})")
@@ -92,15 +255,197 @@ class GameService:
             )
         return self.repo.update_game_player_black_id(game_id, new_player_black_id)
 
+    @invalidates(leaderboard_cache, standings_cache)
     def delete_game_by_id(self, game_id: str) -> str:
         if not isinstance(game_id, str):
             raise ValueError(f"Expected type (str), but received ({type(game_id)})")
         return self.repo.delete_game_by_id(game_id)
 
-    def generate_match_bracket(self, tournament_id: str):
-        if not isinstance(tournament_id, str):
-            raise ValueError(f"Expected type (str), but received ({type(tournament_id)})")
-        return self.repo.generate_match_bracket(tournament_id)
+    def _entrant_ratings(self, player_ids: Sequence[uuid.UUID], limit: int) -> list[int]:
+        if len(player_ids) > limit:
+            raise ValidationError(f"At most {limit} entrants can be paired.")
+        ratings = self.repo.get_player_ratings(set(player_ids))
+        missing = [str(player_id) for player_id in player_ids if player_id not in ratings]
+        if missing:
+            raise NotFoundError(f"Players not found: {', '.join(missing)}")
+        return [ratings[player_id] for player_id in player_ids]
+
+    @invalidates(leaderboard_cache, standings_cache)
+    def generate_match_bracket(
+        self, tournament_id: uuid.UUID, player_ids: Sequence[uuid.UUID]
+    ) -> dict:
+        """Seed a knockout bracket of ``player_ids`` by rating and insert its first round.
+
+        The bracket is padded to the next power of two with byes for the
+        top seeds, stored as white wins with no black player.
+        """
+        # Held until the first round is committed, so only one caller finds no games
+        if not self.repo.lock_tournament(tournament_id):
+            raise NotFoundError(f"Tournament {tournament_id} not found.")
+        if self.repo.tournament_has_games(tournament_id):
+            raise ConflictError(f"Tournament {tournament_id} already has games.")
+
+        player_ids = list(dict.fromkeys(player_ids))
+        ratings = self._entrant_ratings(player_ids, MAX_BRACKET_PLAYERS)
+        try:
+            white, black = seed_first_round(ratings)
+        except ValueError as exc:
+            raise ValidationError(str(exc)) from exc
+
+        white_ids = [player_ids[i] for i in white.tolist()]
+        black_ids = [player_ids[i] if i >= 0 else None for i in black.tolist()]
+        results = [WinState.WHITE_WIN if black_id is None else None for black_id in black_ids]
+        game_ids = self.repo.add_scheduled_games(
+            tournament_id,
+            [1] * len(white_ids),
+            white_ids,
+            black_ids,
+            results,
+            slots=list(range(len(white_ids))),
+        )
+        byes = sum(black_id is None for black_id in black_ids)
+        return {
+            "tournament_id": tournament_id,
+            "round_number": 1,
+            "bracket_size": 2 * len(game_ids),
+            "games": len(game_ids) - byes,
+            "byes": byes,
+        }
+
+    def _advance_bracket(self, tournament_id: uuid.UUID, round_games: Sequence[Row]) -> dict | None:
+        """Insert the round after ``round_games``; None if another caller already did."""
+        try:
+            white_ids, black_ids = next_round(
+                [game.player_white_id for game in round_games],
+                [game.player_black_id for game in round_games],
+                [game.result for game in round_games],
+            )
+        except ValueError as exc:
+            raise ConflictError(str(exc)) from exc
+        round_number = round_games[0].round_number + 1
+        game_ids = self.repo.add_scheduled_games(
+            tournament_id,
+            [round_number] * len(white_ids),
+            white_ids,
+            black_ids,
+            [None] * len(white_ids),
+            slots=list(range(len(white_ids))),
+        )
+        if not game_ids:
+            return None
+        return {"tournament_id": tournament_id, "round_number": round_number, "games": len(game_ids)}
+
+    @invalidates(leaderboard_cache, standings_cache)
+    def advance_knockout_round(self, tournament_id: uuid.UUID) -> dict:
+        """Create the next round of the tournament's bracket from its latest round."""
+        round_games = self.repo.get_bracket_round(tournament_id)
+        if not round_games:
+            raise NotFoundError(f"Tournament {tournament_id} has no knockout bracket.")
+        if len(round_games) == 1:
+            raise ConflictError(f"Round {round_games[0].round_number} is the final.")
+        advanced = self._advance_bracket(tournament_id, round_games)
+        if advanced is None:
+            raise ConflictError(f"Round {round_games[0].round_number} has already been advanced.")
+        return advanced
+
+    @invalidates(leaderboard_cache, standings_cache)
+    def generate_round_robin(
+        self, tournament_id: uuid.UUID, player_ids: Sequence[uuid.UUID], double: bool = False
+    ) -> dict:
+        """Schedule every round of an all-play-all from the Berger tables.
+
+        Pairing numbers follow the order of ``player_ids``; with an odd
+        field each player sits out one round per cycle and no game is
+        stored for it.
+        """
+        # Held until the schedule is committed, so only one caller finds no games
+        if not self.repo.lock_tournament(tournament_id):
+            raise NotFoundError(f"Tournament {tournament_id} not found.")
+        if self.repo.tournament_has_games(tournament_id):
+            raise ConflictError(f"Tournament {tournament_id} already has games.")
+        player_ids = list(dict.fromkeys(player_ids))
+        self._entrant_ratings(player_ids, MAX_ROUND_ROBIN_PLAYERS)
+        try:
+            round_numbers, white, black = berger_schedule(len(player_ids), double)
+        except ValueError as exc:
+            raise ValidationError(str(exc)) from exc
+
+        game_ids = self.repo.add_scheduled_games(
+            tournament_id,
+            round_numbers.tolist(),
+            [player_ids[i] for i in white.tolist()],
+            [player_ids[i] for i in black.tolist()],
+            [None] * len(round_numbers),
+        )
+        return {
+            "tournament_id": tournament_id,
+            "rounds": int(round_numbers.max()),
+            "games": len(game_ids),
+        }
+
+    @invalidates(leaderboard_cache, standings_cache)
+    def generate_swiss_round(
+        self, tournament_id: uuid.UUID, player_ids: Sequence[uuid.UUID] | None = None
+    ) -> dict:
+        """Pair and insert the next Swiss round once every earlier game is decided.
+
+        ``player_ids`` names the entrants; after the first round it defaults
+        to everyone already paired in the tournament. Byes are stored as a
+        white win with no black player.
+        """
+        # Held until the new round is committed, so concurrent callers pair one at a time
+        if not self.repo.lock_tournament(tournament_id):
+            raise NotFoundError(f"Tournament {tournament_id} not found.")
+        history = self.repo.get_tournament_pairing_history(tournament_id)
+        if any(game.result is None for game in history):
+            raise ConflictError("Every game of the current round needs a result before pairing the next.")
+
+        if player_ids is None:
+            player_ids = [
+                player_id
+                for player_id in dict.fromkeys(
+                    chain.from_iterable((game.player_white_id, game.player_black_id) for game in history)
+                )
+                if player_id is not None
+            ]
+        player_ids = list(dict.fromkeys(player_ids))
+        if len(player_ids) < 2:
+            raise ValidationError("At least two entrants are required to pair a Swiss round.")
+        field = SwissField.from_games(
+            player_ids,
+            self._entrant_ratings(player_ids, MAX_SWISS_PLAYERS),
+            [(game.player_white_id, game.player_black_id, game.result) for game in history],
+        )
+        try:
+            pairing = pair_swiss_round(field)
+        except ValueError as exc:
+            raise ConflictError(str(exc)) from exc
+
+        round_number = max((game.round_number or 0 for game in history), default=0) + 1
+
+        white_ids = [player_ids[white] for white, _ in pairing.pairs]
+        black_ids = [player_ids[black] for _, black in pairing.pairs]
+        results: list[WinState | None] = [None] * len(pairing.pairs)
+        bye_player_id = None if pairing.bye is None else player_ids[pairing.bye]
+        if bye_player_id is not None:
+            white_ids.append(bye_player_id)
+            black_ids.append(None)
+            results.append(WinState.WHITE_WIN)
+        game_ids = self.repo.add_scheduled_games(
+            tournament_id, [round_number] * len(results), white_ids, black_ids, results
+        )
+
+        return {
+            "tournament_id": tournament_id,
+            "round_number": round_number,
+            "boards": [
+                {"board": board, "game_id": game_id, "player_white_id": white_id, "player_black_id": black_id}
+                for board, (game_id, white_id, black_id) in enumerate(
+                    zip(game_ids[: len(pairing.pairs)], white_ids, black_ids), start=1
+                )
+            ],
+            "bye_player_id": bye_player_id,
+        }
 
     #head to head stats between two players(Business Model)
     def get_head_to_head_stats(self, player1_id: str, player2_id: str) -> dict:
@@ -109,15 +454,25 @@ class GameService:
         if not isinstance(player2_id, str):
             raise ValueError(f"Expected type (str) for player2_id, but received ({type(player2_id)})")
 
-        stats = self.repo.get_head_to_head_stats(player1_id, player2_id)
+        [stats] = self.repo.get_head_to_head([(uuid.UUID(player1_id), uuid.UUID(player2_id))])
 
-        if not stats:
-            return {"wins": 0, "losses": 0, "draws": 0}
+        return {
+            "wins": stats.wins,
+            "losses": stats.losses,
+            "draws": stats.draws
+        }
 
+    def get_head_to_head_batch(
+        self, pairs: Sequence[tuple[uuid.UUID, uuid.UUID]], player_ids: Sequence[uuid.UUID]
+    ) -> dict:
+        """Records for the requested pairs, plus every meeting among ``player_ids``."""
+        if len(pairs) > MAX_HEAD_TO_HEAD_PAIRS:
+            raise ValidationError(f"At most {MAX_HEAD_TO_HEAD_PAIRS} pairs can be requested at once.")
+        if len(player_ids) > MAX_HEAD_TO_HEAD_PLAYERS:
+            raise ValidationError(f"At most {MAX_HEAD_TO_HEAD_PLAYERS} players can be requested at once.")
         return {
-            "wins": stats.wins or 0,
-            "losses": stats.losses or 0,
-            "draws": stats.draws or 0
+            "pairs": [row._asdict() for row in self.repo.get_head_to_head(pairs)],
+            "matrix": [row._asdict() for row in self.repo.get_head_to_head_matrix(list(set(player_ids)))],
         }
 
     #Record a game result(Business Model)
@@ -138,6 +493,11 @@ class GameService:
         if not isinstance(result, WinState):
             raise ValueError("result must be WinState")
 
+        try:
+            white_player_id, black_player_id = uuid.UUID(white_player_id), uuid.UUID(black_player_id)
+        except ValueError:
+            raise ValidationError("Player ids must be UUIDs.")
+
         game = Game(
             tournament_id=tournament_id,
             player_white_id=white_player_id,
@@ -146,7 +506,8 @@ class GameService:
             played_at=datetime.utcnow()
         )
 
-        self.repo.add_game(game)
+        # Rated like any other decided game
+        self.add_game_with_ratings(game)
 
         return game
 
@@ -0,0 +1,64 @@
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+
+from src.domain.game import WinState
+
+
+def seed_order(bracket_size: int) -> np.ndarray:
+    """Seeds (1-based) in bracket position order, e.g. 1 8 4 5 2 7 3 6 for 8.
+
+    Neighbouring positions meet in the first round, so seed s always faces
+    seed ``bracket_size + 1 - s`` and the top two seeds can only meet in
+    the final.
+    """
+    if bracket_size < 1 or bracket_size & (bracket_size - 1):
+        raise ValueError("The bracket size must be a power of two.")
+    order = np.array([1], dtype=np.int64)
+    while len(order) < bracket_size:
+        order = np.stack([order, 2 * len(order) + 1 - order], axis=1).ravel()
+    return order
+
+
+def seed_first_round(ratings: Sequence[int]) -> tuple[np.ndarray, np.ndarray]:
+    """First-round pairings for entrants seeded by rating, highest first.
+
+    Returns the white and black entrant index for each bracket slot, in
+    slot order. The higher seed takes white. When the field isn't a power
+    of two, the top seeds' opponents are missing: ``black`` is -1 for
+    those slots, which are byes.
+    """
+    n = len(ratings)
+    if n < 2:
+        raise ValueError("At least two players are required before generating a bracket.")
+    bracket_size = 1 << (n - 1).bit_length()
+    # Seed k (1-based) is the k-th highest rating; ties keep entry order
+    by_seed = np.argsort(-np.asarray(ratings, dtype=np.int64), kind="stable")
+    positions = seed_order(bracket_size).reshape(-1, 2) - 1
+    white = by_seed[positions[:, 0]]
+    black = np.where(positions[:, 1] < n, by_seed[np.minimum(positions[:, 1], n - 1)], -1)
+    return white, black
+
+
+def next_round(
+    white_ids: Sequence[Any], black_ids: Sequence[Any], results: Sequence[WinState | None]
+) -> tuple[list[Any], list[Any]]:
+    """Pair a finished round's winners for the next round.
+
+    The inputs are one round's games in slot order. The winner of slot s
+    plays in slot s // 2, with white for the even slot's winner. Raises
+    ``ValueError`` when the round is the final or a game isn't won by
+    either player.
+    """
+    if len(results) < 2 or len(results) % 2:
+        raise ValueError("Only a round with an even number of slots can be advanced.")
+    winners = []
+    for slot, (white_id, black_id, result) in enumerate(zip(white_ids, black_ids, results)):
+        if result == WinState.WHITE_WIN:
+            winners.append(white_id)
+        elif result == WinState.BLACK_WIN:
+            winners.append(black_id)
+        else:
+            raise ValueError(f"Slot {slot} has no winner yet.")
+    return winners[0::2], winners[1::2]
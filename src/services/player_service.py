@@ -1,18 +1,34 @@
+import time
+
+import numpy as np
+from sqlalchemy import Row
+
 from src.repositories.player_repository_protocol import PlayerRepositoryProtocol
 from src.domain.player import Player
-from src.domain.game import Game, WinState
+from src.domain.game import Game
 from src.domain.violation import Violation
+from src.services.cache import invalidates, leaderboard_cache, standings_cache
+from src.services.rating_engine import (
+    WHITE_SCORES,
+    RatingEngine,
+    get_rating_engine,
+    replay_games,
+)
+
+VIOLATION_RATING_CHANGE = -100
 
 
 class PlayerService:
-    def __init__(self, repo: PlayerRepositoryProtocol):
+    def __init__(self, repo: PlayerRepositoryProtocol, rating_engine: RatingEngine | None = None):
         self.repo = repo
+        self.rating_engine = rating_engine or get_rating_engine()
 
     def add(self, player: Player) -> str:
         if not isinstance(player, Player):
             raise ValueError(f"Expected type (Player), but received ({type(player)})")
         return self.repo.add(player)
 
+    @invalidates(leaderboard_cache, standings_cache)
     def replace(self, player_id: str, player: Player) -> str:
         if not (isinstance(player_id, str) or isinstance(player, Player)):
             raise ValueError(
@@ -23,6 +39,14 @@ class PlayerService:
     def get_all(self) -> list[Player]:
         return self.repo.get_all()
 
+    def get_page(
+        self, limit: int, cursor: str | None = None
+    ) -> tuple[list[Player], str | None]:
+        return self.repo.get_page(limit, cursor)
+
+    def get_rows_page(self, limit: int, cursor: str | None = None) -> tuple[list[Row], str | None]:
+        return self.repo.get_rows_page(limit, cursor)
+
     def get_by_first_name(self, first_name: str) -> list[Player]:
         if not isinstance(first_name, str):
             raise ValueError(f"Expected type (str), but received ({type(first_name)})")
@@ -57,6 +81,7 @@ class PlayerService:
             raise ValueError(f"Expected type (str), but received ({type(player_id)})")
         return self.repo.get_by_id(player_id)
 
+    @invalidates(leaderboard_cache, standings_cache)
     def update_first_name_by_id(self, player_id: str, first_name: str) -> Player:
         if not (isinstance(player_id, str) or isinstance(first_name, str)):
             raise ValueError(
@@ -64,6 +89,7 @@ class PlayerService:
             )
         return self.repo.update_first_name_by_id(player_id, first_name)
 
+    @invalidates(leaderboard_cache, standings_cache)
     def update_last_name_by_id(self, player_id: str, last_name: str) -> Player:
         if not (isinstance(player_id, str) or isinstance(last_name, str)):
             raise ValueError(
@@ -71,6 +97,7 @@ class PlayerService:
             )
         return self.repo.update_last_name_by_id(player_id, last_name)
 
+    @invalidates(leaderboard_cache, standings_cache)
     def update_full_name_by_id(
         self, player_id: str, first_name: str, last_name: str
     ) -> Player:
@@ -84,6 +111,7 @@ class PlayerService:
             )
         return self.repo.update_full_name_by_id(player_id, first_name, last_name)
 
+    @invalidates(leaderboard_cache, standings_cache)
     def update_rating_by_id(self, player_id: str, rating: int) -> Player:
         if not (isinstance(player_id, str) or isinstance(rating, int)):
             raise ValueError(
@@ -91,6 +119,7 @@ class PlayerService:
             )
         return self.repo.update_rating_by_id(player_id, rating)
 
+    @invalidates(leaderboard_cache, standings_cache)
     def update_rating_via_increment_by_id(
         self, player_id: str, rating_increment: int
     ) -> Player:
@@ -100,43 +129,58 @@ class PlayerService:
             )
         return self.repo.update_rating_via_increment_by_id(player_id, rating_increment)
 
-    def update_players_on_game_insert(self, game: Game):
-        if not (isinstance(game, Game)):
-            raise ValueError(f"Expected type (Game), but received {type(Game)})")
-        loss_change = -9
-        win_change = 10
-        draw_change = 1
-        match game.result:
-            case WinState.WHITE_WIN:
-                self.repo.update_rating_via_increment_by_id(
-                    game.player_white_id, win_change
-                )
-                self.repo.update_rating_via_increment_by_id(
-                    game.player_black_id, loss_change
-                )
-            case WinState.BLACK_WIN:
-                self.repo.update_rating_via_increment_by_id(
-                    game.player_white_id, loss_change
-                )
-                self.repo.update_rating_via_increment_by_id(
-                    game.player_black_id, win_change
-                )
-            case WinState.DRAW:
-                self.repo.update_rating_via_increment_by_id(
-                    game.player_white_id, draw_change
-                )
-                self.repo.update_rating_via_increment_by_id(
-                    game.player_black_id, draw_change
-                )
-
+    @invalidates(leaderboard_cache, standings_cache)
     def update_players_on_violation_insert(self, violation: Violation):
         if not (isinstance(violation, Violation)):
             raise ValueError(f"Expected type (Game), but received {type(Game)}")
-        violation_change = -100
         self.repo.update_rating_via_increment_by_id(
-            violation.player_id, violation_change
+            violation.player_id, VIOLATION_RATING_CHANGE
         )
 
+    @invalidates(leaderboard_cache, standings_cache)
+    def recompute_ratings(self, initial_rating: int = 1500) -> dict:
+        """Rebuild every rating by replaying all decided games in order.
+
+        Everyone starts at ``initial_rating``; games are replayed
+        chronologically through the rating engine on arrays indexed by
+        player, then each violation penalty is applied once on top.
+        """
+        if not isinstance(initial_rating, int):
+            raise ValueError(f"Expected type (int), but received ({type(initial_rating)})")
+        started = time.perf_counter()
+
+        player_ids = self.repo.get_all_ids()
+        index = {player_id: i for i, player_id in enumerate(player_ids)}
+        white_parts, black_parts, score_parts = [], [], []
+        for batch in self.repo.stream_rated_games():
+            white_parts.append(np.fromiter((index[row[0]] for row in batch), np.int64, len(batch)))
+            black_parts.append(np.fromiter((index[row[1]] for row in batch), np.int64, len(batch)))
+            score_parts.append(
+                np.fromiter((WHITE_SCORES[row[2]] for row in batch), np.float64, len(batch))
+            )
+        white_idx = np.concatenate(white_parts) if white_parts else np.empty(0, np.int64)
+        black_idx = np.concatenate(black_parts) if black_parts else np.empty(0, np.int64)
+        white_scores = np.concatenate(score_parts) if score_parts else np.empty(0)
+
+        ratings, _ = replay_games(
+            self.rating_engine,
+            np.full(len(player_ids), initial_rating, dtype=np.int64),
+            np.zeros(len(player_ids), dtype=np.int64),
+            white_idx,
+            black_idx,
+            white_scores,
+        )
+        for player_id, violations in self.repo.count_violations_by_player():
+            ratings[index[player_id]] += VIOLATION_RATING_CHANGE * violations
+
+        self.repo.replace_ratings(player_ids, ratings.tolist())
+        return {
+            "players": len(player_ids),
+            "games": len(white_idx),
+            "seconds": round(time.perf_counter() - started, 3),
+        }
+
+    @invalidates(leaderboard_cache, standings_cache)
     def delete_by_id(self, player_id: str) -> Player:
         if not (isinstance(player_id, str)):
             raise ValueError(f"Expected type (str), but received ({type(player_id)})")
@@ -1,20 +1,80 @@
+from collections.abc import Callable
+from uuid import UUID
+
+from sqlalchemy import Row
+
 from src.repositories.relations_repository_protocol import RelationsRepositoryProtocol
 from src.DTO.top_players_stats import PlayerTopStatsResponseRead
+from src.repositories.skill_level_repository_protocol import SkillLevelRepositoryProtocol
+from src.services.cache import TTLCache, invalidates, leaderboard_cache, standings_cache
+from src.services.skill_level_classifier import get_skill_level_classifier
 
 
 class RelationsService:
-    def __init__(self, repo: RelationsRepositoryProtocol):
+    def __init__(
+        self,
+        repo: RelationsRepositoryProtocol,
+        skill_level_repo: SkillLevelRepositoryProtocol | None = None,
+        cache: TTLCache = leaderboard_cache,
+        version: Callable[[], int] | None = None,
+    ):
         self.repo = repo
+        self.skill_level_repo = skill_level_repo
+        self.cache = cache
+        # Reads the leaderboard's database counter, so writes made by other
+        # processes are seen before the cached entry expires
+        self.version = version
 
     def get_player_summary_by_id(self, player_id: str):
         if not isinstance(player_id, str):
             raise ValueError(f"Expected type (str), but received ({type(player_id)})")
-        return self.repo.get_player_summary_by_id(player_id)
+        summary = self.repo.get_player_summary_by_id(player_id)
+        if summary is None:
+            return None
+        title = None
+        if self.skill_level_repo is not None:
+            title = get_skill_level_classifier(self.skill_level_repo).classify(summary.rating)
+        return {**summary._asdict(), "title": title}
+
+    def get_top_players(self) -> list[PlayerTopStatsResponseRead]:
+        # Cached as DTOs so no ORM instance outlives the session that loaded it
+        return self.cache.get_or_load(
+            "top_players",
+            lambda: [
+                PlayerTopStatsResponseRead.model_validate(player)
+                for player in self.repo.get_top_players()
+            ],
+            self._current_version(),
+        )
+
+    def get_top_players_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        offset: int = 0,
+        skill_level: str | None = None,
+    ) -> tuple[list[PlayerTopStatsResponseRead], str | None]:
+        def load():
+            rows, next_cursor = self.repo.get_top_players_page(limit, cursor, offset, skill_level)
+            return [PlayerTopStatsResponseRead.model_validate(row) for row in rows], next_cursor
 
-    def get_top_players(self):
-        return self.repo.get_top_players()
+        return self.cache.get_or_load(
+            ("top_players", limit, cursor, offset, skill_level), load, self._current_version()
+        )
+
+    def _current_version(self) -> int | None:
+        return self.version() if self.version is not None else None
+
+    @invalidates(leaderboard_cache, standings_cache)
+    def rebuild_player_stats(self) -> int:
+        return self.repo.rebuild_player_stats()
 
     def get_player_match_history(self, player_id: str):
         if not isinstance(player_id, str):
             raise ValueError(f"Expected type (str), but received ({type(player_id)})")
         return self.repo.get_player_match_history(player_id)
+
+    def get_player_match_history_page(
+        self, player_id: UUID, limit: int, cursor: str | None = None
+    ) -> tuple[list[Row], str | None]:
+        return self.repo.get_player_match_history_page(player_id, limit, cursor)
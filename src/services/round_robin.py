@@ -0,0 +1,39 @@
+import numpy as np
+
+
+def berger_schedule(n: int, double: bool = False) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Every game of an all-play-all between ``n`` players, from the Berger tables.
+
+    Returns parallel arrays of round number (1-based), white and black
+    (0-based pairing numbers), ordered by round and board. With an odd
+    ``n`` a phantom last player is added and its games, the byes, are
+    left out. ``double`` appends a second cycle with every color swapped.
+    """
+    if n < 2:
+        raise ValueError("At least two players are required for a round-robin.")
+    size = n + n % 2
+    rounds = size - 1
+    half = size // 2
+
+    # Round k opens with player f = k * size/2 (mod size-1) against the
+    # fixed last player; board j then pairs f + j (white) with f - j
+    first = (np.arange(rounds) * half) % rounds
+    boards = np.arange(1, half)
+    white = np.empty((rounds, half), dtype=np.int64)
+    black = np.empty((rounds, half), dtype=np.int64)
+    white[:, 1:] = (first[:, None] + boards) % rounds
+    black[:, 1:] = (first[:, None] - boards) % rounds
+    # The fixed player alternates: black in odd rounds, white in even ones
+    odd_round = np.arange(rounds) % 2 == 0
+    white[:, 0] = np.where(odd_round, first, rounds)
+    black[:, 0] = np.where(odd_round, rounds, first)
+    round_numbers = np.repeat(np.arange(1, rounds + 1), half)
+
+    white, black = white.ravel(), black.ravel()
+    if n % 2:
+        real = (white < n) & (black < n)
+        round_numbers, white, black = round_numbers[real], white[real], black[real]
+    if double:
+        round_numbers = np.concatenate([round_numbers, round_numbers + rounds])
+        white, black = np.concatenate([white, black]), np.concatenate([black, white])
+    return round_numbers, white, black
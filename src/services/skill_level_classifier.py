@@ -0,0 +1,47 @@
+from bisect import bisect_right
+from collections.abc import Iterable
+
+from src.domain.skill_level import SkillLevel
+from src.repositories.skill_level_repository_protocol import SkillLevelRepositoryProtocol
+from src.services.cache import skill_level_cache
+
+
+class SkillLevelClassifier:
+    """Maps ratings to skill-level titles with a bisect over sorted lower bounds.
+
+    Built from plain (title, lower, upper) tuples so it can be shared
+    between sessions. A rating outside every level classifies as ``None``;
+    where levels overlap, the one with the highest lower bound wins.
+    """
+
+    def __init__(self, levels: Iterable[tuple[str, int, int]]):
+        ordered = sorted(levels, key=lambda level: (level[1], level[2]))
+        self.titles = [title for title, _, _ in ordered]
+        self.lower_bounds = [lower for _, lower, _ in ordered]
+        self.upper_bounds = [upper for _, _, upper in ordered]
+
+    @classmethod
+    def from_levels(cls, levels: Iterable[SkillLevel]) -> "SkillLevelClassifier":
+        return cls(
+            (level.title, level.rating_lower_bound, level.rating_upper_bound)
+            for level in levels
+        )
+
+    def classify(self, rating: int | None) -> str | None:
+        if rating is None:
+            return None
+        index = bisect_right(self.lower_bounds, rating) - 1
+        # Only overlapping levels make this walk back more than once
+        while index >= 0 and self.upper_bounds[index] < rating:
+            index -= 1
+        return self.titles[index] if index >= 0 else None
+
+    def classify_many(self, ratings: Iterable[int | None]) -> list[str | None]:
+        return [self.classify(rating) for rating in ratings]
+
+
+def get_skill_level_classifier(repo: SkillLevelRepositoryProtocol) -> SkillLevelClassifier:
+    """The process-wide classifier, rebuilt from ``repo`` after invalidation or TTL."""
+    return skill_level_cache.get_or_load(
+        "classifier", lambda: SkillLevelClassifier.from_levels(repo.get_all_skill_levels())
+    )
@@ -1,7 +1,14 @@
+from uuid import UUID
+
 from sqlalchemy.exc import IntegrityError
+from src.domain.exceptions import ValidationError
 from src.domain.skill_level import SkillLevel
 from src.DTO.skill_level_dto import SkillLevelCreate, SkillLevelUpdate
 from src.repositories.skill_level_repository_protocol import SkillLevelRepositoryProtocol
+from src.services.cache import invalidates, leaderboard_cache, skill_level_cache
+from src.services.skill_level_classifier import get_skill_level_classifier
+
+MAX_CLASSIFY_ITEMS = 10_000
 
 class SkillLevelService:
     def __init__(self,
@@ -22,6 +29,8 @@ class SkillLevelService:
         
         return skill_level
     
+    # Level edits move rating boundaries and the leaderboard's skill filter
+    @invalidates(skill_level_cache, leaderboard_cache)
     def add_skill_level(self, payload: SkillLevelCreate) -> str:
         self._validate_bounds(payload.rating_lower_bound, payload.rating_upper_bound)
 
@@ -40,6 +49,7 @@ class SkillLevelService:
         except IntegrityError as e:
              raise Exception("Could not create skill level due to a database constraint.") from e
 
+    @invalidates(skill_level_cache, leaderboard_cache)
     def update_skill_level(self, title: str, payload: SkillLevelUpdate) -> SkillLevel:
         existing_skill = self.skill_level_repo.get_skill_level_by_title(title)
         if not existing_skill:
@@ -69,6 +79,7 @@ class SkillLevelService:
         except IntegrityError as e:
             raise Exception("Could not update skill level due to a database constraint.") from e
     
+    @invalidates(skill_level_cache, leaderboard_cache)
     def delete_skill_level(self, title: str) -> None:
         existing_skill = self.skill_level_repo.get_skill_level_by_title(title)
         if not existing_skill:
@@ -93,13 +104,37 @@ class SkillLevelService:
         if not isinstance(player_id, str):
             raise ValueError("player_id must be a string")
 
-        result = self.repo.lookup_skill_level_by_player_id(player_id)
+        rows = self.skill_level_repo.get_player_ratings([player_id])
+        title = get_skill_level_classifier(self.skill_level_repo).classify(rows[0].rating) if rows else None
 
-        if not result:
+        if not title:
             return {"message": "Skill level not found for player"}
 
         return {
-            "player_id": result.player_id,
-            "player_name": result.first_name,
-            "skill_level": result.skill_level
+            "player_id": rows[0].player_id,
+            "player_name": rows[0].first_name,
+            "skill_level": title
+        }
+
+    def classify(self, player_ids: list[UUID], ratings: list[int]) -> dict:
+        """Skill-level titles for many players and/or raw ratings in one call."""
+        if len(player_ids) + len(ratings) > MAX_CLASSIFY_ITEMS:
+            raise ValidationError(f"At most {MAX_CLASSIFY_ITEMS} players and ratings can be classified at once.")
+
+        classifier = get_skill_level_classifier(self.skill_level_repo)
+        found = {
+            row.player_id: row.rating
+            for row in self.skill_level_repo.get_player_ratings(set(player_ids))
+        }
+        return {
+            "players": [
+                {"player_id": player_id, "rating": found[player_id], "title": classifier.classify(found[player_id])}
+                for player_id in player_ids
+                if player_id in found
+            ],
+            "ratings": [
+                {"rating": rating, "title": title}
+                for rating, title in zip(ratings, classifier.classify_many(ratings))
+            ],
+            "unknown_player_ids": [player_id for player_id in player_ids if player_id not in found],
         }
\ No newline at end of file
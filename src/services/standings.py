@@ -0,0 +1,86 @@
+from collections.abc import Sequence
+from itertools import chain
+
+import numpy as np
+
+
+def compute_standings(opponents: Sequence[Sequence[int]], scores: Sequence[Sequence[int]]) -> list[dict]:
+    """Rank a tournament's players from each player's list of games.
+
+    Player ``i`` met ``opponents[i][k]`` (a player index, -1 for a bye)
+    and scored ``scores[i][k]`` half-points in that game: 2 for a win or
+    a bye, 1 for a draw, 0 for a loss and -1 while it is undecided, which
+    counts for nothing. Players are ordered by points, Buchholz, Buchholz
+    Cut-1, Sonneborn-Berger, wins and direct encounter; players level on
+    all of them share a rank and keep their input order. Each standing
+    carries the player's ``index``.
+
+    Buchholz sums the final scores of the opponents actually met (byes add
+    nothing), Cut-1 drops the weakest of them, and Sonneborn-Berger weighs
+    each opponent's score by the result against them. Direct encounter is
+    the score made against the other players still level on everything
+    before it. Wins include byes, as the tournament participants list does.
+    """
+    n = len(opponents)
+    if not n:
+        return []
+    # Flatten to one entry per player per game; points are tallied in
+    # half-points so ties compare exactly
+    games = np.fromiter(map(len, opponents), dtype=np.int64, count=n)
+    player = np.repeat(np.arange(n), games)
+    total = int(games.sum())
+    opponent = np.fromiter(chain.from_iterable(opponents), dtype=np.int64, count=total)
+    score = np.fromiter(chain.from_iterable(scores), dtype=np.int64, count=total)
+    decided = score >= 0
+    score = np.maximum(score, 0)
+
+    points = np.bincount(player, weights=score, minlength=n).astype(np.int64)
+    wins = np.bincount(player[score == 2], minlength=n)
+    draws = np.bincount(player[score == 1], minlength=n)
+    losses = np.bincount(player[decided & (score == 0)], minlength=n)
+
+    # Decided games against a real opponent feed the opponent-based tie-breaks
+    met = decided & (opponent >= 0)
+    met_player, met_score = player[met], score[met]
+    opponent_points = points[opponent[met]]
+    buchholz = np.bincount(met_player, weights=opponent_points, minlength=n).astype(np.int64)
+    weakest = np.full(n, np.iinfo(np.int64).max)
+    np.minimum.at(weakest, met_player, opponent_points)
+    buchholz_cut1 = np.where(np.bincount(met_player, minlength=n) > 0, buchholz - weakest, 0)
+    # Half-points times half-points: quarter-points
+    sonneborn_berger = np.bincount(
+        met_player, weights=met_score * opponent_points, minlength=n
+    ).astype(np.int64)
+
+    preceding = np.stack([points, buchholz, buchholz_cut1, sonneborn_berger, wins], axis=1)
+    _, level = np.unique(preceding, axis=0, return_inverse=True)
+    level = level.ravel()
+    among_level = level[met_player] == level[opponent[met]]
+    direct_encounter = np.bincount(
+        met_player[among_level], weights=met_score[among_level], minlength=n
+    ).astype(np.int64)
+
+    keys = np.column_stack([preceding, direct_encounter])
+    # lexsort takes its primary key last; the index keeps input order on ties
+    order = np.lexsort((np.arange(n), *(-keys[:, k] for k in reversed(range(keys.shape[1])))))
+    ranked_keys = keys[order]
+    new_rank = np.ones(n, dtype=bool)
+    new_rank[1:] = (ranked_keys[1:] != ranked_keys[:-1]).any(axis=1)
+    rank = np.maximum.accumulate(np.where(new_rank, np.arange(1, n + 1), 0))
+
+    return [
+        {
+            "rank": int(rank[position]),
+            "index": i,
+            "games_played": int(wins[i] + draws[i] + losses[i]),
+            "wins": int(wins[i]),
+            "draws": int(draws[i]),
+            "losses": int(losses[i]),
+            "points": float(points[i]) / 2,
+            "buchholz": float(buchholz[i]) / 2,
+            "buchholz_cut1": float(buchholz_cut1[i]) / 2,
+            "sonneborn_berger": float(sonneborn_berger[i]) / 4,
+            "direct_encounter": float(direct_encounter[i]) / 2,
+        }
+        for position, i in enumerate(order.tolist())
+    ]
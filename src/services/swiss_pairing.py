@@ -0,0 +1,214 @@
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from itertools import chain, groupby
+from typing import Any
+
+import numpy as np
+
+from src.domain.game import WinState
+
+# Points are kept in half-points so score groups compare exactly
+_HALF_POINTS = {
+    WinState.WHITE_WIN: (2, 0),
+    WinState.BLACK_WIN: (0, 2),
+    WinState.DRAW: (1, 1),
+}
+
+
+@dataclass
+class SwissField:
+    """Per-player pairing state as compact arrays, indexed like the entrants.
+
+    ``color_balance`` is whites minus blacks; ``color_streak`` is the signed
+    run of the last color played (+2: white twice in a row, -1: black once).
+    ``played[a, b]`` marks players who already met.
+    """
+
+    ratings: np.ndarray
+    points: np.ndarray
+    color_balance: np.ndarray
+    color_streak: np.ndarray
+    had_bye: np.ndarray
+    played: np.ndarray
+
+    @classmethod
+    def from_games(
+        cls,
+        player_ids: Sequence[Any],
+        ratings: Sequence[int],
+        games: Iterable[tuple[Any, Any, WinState | None]],
+    ) -> "SwissField":
+        """Build the field from ``(white_id, black_id, result)`` in round order.
+
+        A game with only one player is a bye worth a win. Players missing
+        from ``player_ids`` (withdrawn) are skipped, but their opponents
+        keep the points and colors of those games.
+        """
+        n = len(player_ids)
+        index = {player_id: i for i, player_id in enumerate(player_ids)}
+        field = cls(
+            ratings=np.asarray(ratings, dtype=np.int32),
+            points=np.zeros(n, dtype=np.int16),
+            color_balance=np.zeros(n, dtype=np.int16),
+            color_streak=np.zeros(n, dtype=np.int16),
+            had_bye=np.zeros(n, dtype=bool),
+            played=np.zeros((n, n), dtype=bool),
+        )
+        for white_id, black_id, result in games:
+            white, black = index.get(white_id), index.get(black_id)
+            if white_id is None or black_id is None:
+                player = white if white_id is not None else black
+                if player is not None:
+                    field.had_bye[player] = True
+                    field.points[player] += 2
+                continue
+            white_points, black_points = _HALF_POINTS.get(result, (0, 0))
+            for player, points, color in ((white, white_points, 1), (black, black_points, -1)):
+                if player is None:
+                    continue
+                field.points[player] += points
+                field.color_balance[player] += color
+                streak = field.color_streak[player]
+                field.color_streak[player] = streak + color if streak * color > 0 else color
+            if white is not None and black is not None:
+                field.played[white, black] = field.played[black, white] = True
+        return field
+
+
+@dataclass
+class SwissPairing:
+    """``(white, black)`` entrant indices by board, and who sits out."""
+
+    pairs: list[tuple[int, int]]
+    bye: int | None
+
+
+def pair_swiss_round(field: SwissField) -> SwissPairing:
+    """Pair the next round: score groups top-down, Dutch halves within each.
+
+    The top half of a score group meets the bottom half in order; players
+    who can't be paired inside their group float down to the next one.
+    Rematches are never made and a player who is due the same color a
+    third time running (or whose balance would exceed two) doesn't get it;
+    the color rule alone is relaxed when nothing else works. With an odd
+    field the lowest-ranked player without a bye gets one. Raises
+    ``ValueError`` when no pairing avoids a rematch.
+    """
+    n = len(field.ratings)
+    if n < 2:
+        raise ValueError("At least two players are required to pair a round.")
+
+    # Rank: points, then rating, then entry order
+    ranked = np.lexsort((np.arange(n), -field.ratings.astype(np.int64), -field.points)).tolist()
+    points = field.points.tolist()
+    balance = field.color_balance.tolist()
+    streak = field.color_streak.tolist()
+    must_white = ((field.color_balance <= -2) | (field.color_streak <= -2)).tolist()
+    must_black = ((field.color_balance >= 2) | (field.color_streak >= 2)).tolist()
+    played = field.played
+
+    def allowed(a: int, b: int) -> bool:
+        return not played[a, b]
+
+    def color_compatible(a: int, b: int) -> bool:
+        return allowed(a, b) and not (
+            (must_white[a] and must_white[b]) or (must_black[a] and must_black[b])
+        )
+
+    bye = None
+    if n % 2:
+        bye = next((p for p in reversed(ranked) if not field.had_bye[p]), ranked[-1])
+        ranked.remove(bye)
+
+    pairs: list[tuple[int, int]] = []
+    floaters: list[int] = []
+    for _, group in groupby(ranked, key=points.__getitem__):
+        floaters = _pair_group(floaters + list(group), color_compatible, pairs)
+    for compatible in (color_compatible, allowed):
+        if not floaters:
+            break
+        floaters = _pair_by_swapping(floaters, compatible, pairs)
+    if floaters:
+        raise ValueError(f"No pairing avoids a rematch for {len(floaters)} players.")
+
+    rank = {player: position for position, player in enumerate(ranked)}
+    pairs.sort(key=lambda pair: min(rank[pair[0]], rank[pair[1]]))
+
+    def colors(board: int, a: int, b: int) -> tuple[int, int]:
+        if rank[b] < rank[a]:
+            a, b = b, a
+        if must_white[a] or must_black[b]:
+            return a, b
+        if must_white[b] or must_black[a]:
+            return b, a
+        if balance[a] != balance[b]:
+            return (a, b) if balance[a] < balance[b] else (b, a)
+        if streak[a] != streak[b]:
+            # Whoever last had black (or has the longer black run) takes white
+            return (a, b) if streak[a] < streak[b] else (b, a)
+        return (a, b) if board % 2 == 0 else (b, a)
+
+    return SwissPairing([colors(board, a, b) for board, (a, b) in enumerate(pairs)], bye)
+
+
+def _pair_group(
+    group: list[int], compatible: Callable[[int, int], bool], pairs: list[tuple[int, int]]
+) -> list[int]:
+    """Pair one score group into ``pairs``; returns the players that float down."""
+    half = len(group) // 2
+    top, bottom = group[:half], group[half:]
+    free = dict.fromkeys(group)
+    for i, player in enumerate(top):
+        if player not in free:
+            continue
+        for candidate in chain(bottom[i:], bottom[:i], top[i + 1:]):
+            if candidate in free and compatible(player, candidate):
+                del free[player], free[candidate]
+                pairs.append((player, candidate))
+                break
+
+    floaters = []
+    remaining = list(free)
+    while remaining:
+        player = remaining.pop(0)
+        partner = next((c for c in remaining if compatible(player, c)), None)
+        if partner is None:
+            floaters.append(player)
+        else:
+            remaining.remove(partner)
+            pairs.append((player, partner))
+    return floaters
+
+
+def _pair_by_swapping(
+    unpaired: list[int], compatible: Callable[[int, int], bool], pairs: list[tuple[int, int]]
+) -> list[int]:
+    """Pair leftovers directly or by splitting an existing pair, lowest boards first."""
+    stuck = []
+    remaining = list(unpaired)
+    while remaining:
+        player = remaining.pop(0)
+        partner = next((c for c in remaining if compatible(player, c)), None)
+        if partner is not None:
+            remaining.remove(partner)
+            pairs.append((player, partner))
+            continue
+        swapped = False
+        for k in range(len(pairs) - 1, -1, -1):
+            a, b = pairs[k]
+            for other in remaining:
+                if compatible(a, player) and compatible(b, other):
+                    pairs[k], new_pair = (a, player), (b, other)
+                elif compatible(b, player) and compatible(a, other):
+                    pairs[k], new_pair = (b, player), (a, other)
+                else:
+                    continue
+                remaining.remove(other)
+                pairs.append(new_pair)
+                swapped = True
+                break
+            if swapped:
+                break
+        if not swapped:
+            stuck.append(player)
+    return stuck
@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from uuid import UUID
 from sqlalchemy.exc import IntegrityError
 from src.domain.exceptions import ValidationError
@@ -6,8 +7,11 @@ from src.DTO.tournament_dto import (
     TournamentCreate,
     TournamentUpdate,
     TournamentParticipantRead,
+    TournamentStandingRead,
 )
 from src.repositories.tournament_repository_protocol import TournamentRepositoryProtocol
+from src.services.cache import TTLCache, invalidates, standings_cache
+from src.services.standings import compute_standings
 
 
 def _map_participants(players) -> list[TournamentParticipantRead]:
@@ -27,16 +31,41 @@ def _map_participants(players) -> list[TournamentParticipantRead]:
     return participant_list
 
 
+def _map_standings(rows, standings: list[dict]) -> list[TournamentStandingRead]:
+    standing_list: list[TournamentStandingRead] = []
+    for standing in standings:
+        player = rows[standing.pop("index")]
+        standing_list.append(
+            TournamentStandingRead(
+                player_id=player.player_id,
+                first_name=player.first_name,
+                last_name=player.last_name,
+                rating=player.rating,
+                **standing,
+            )
+        )
+    return standing_list
+
+
 class TournamentService:
     def __init__(self,
                  db,
-                 tournament_repo: TournamentRepositoryProtocol
+                 tournament_repo: TournamentRepositoryProtocol,
+                 cache: TTLCache = standings_cache,
+                 version: Callable[[], int] | None = None,
         ):
         self.db = db
         self.tournament_repo = tournament_repo
+        self.cache = cache
+        # Reads the standings' database counter, which every game write moves,
+        # so other workers' writes are seen before the cached entry expires
+        self.version = version
 
     def get_all_tournaments(self) -> list[Tournament]:
         return self.tournament_repo.get_all_tournaments()
+
+    def get_tournaments_page(self, limit: int, cursor: str | None = None) -> tuple[list[Tournament], str | None]:
+        return self.tournament_repo.get_tournaments_page(limit, cursor)
     
     def get_tournament_by_id(self, tournament_id: UUID) -> Tournament:
         tournament = self.tournament_repo.get_tournament_by_id(tournament_id)
@@ -72,6 +101,7 @@ class TournamentService:
             self.db.rollback()
             raise Exception("Error updating tournament: invalid tournament data.") from e
         
+    @invalidates(standings_cache)
     def delete_tournament(self, tournament_id: UUID) -> None:
         try:
             tournament = self.tournament_repo.get_tournament_by_id(tournament_id)
@@ -103,3 +133,18 @@ class TournamentService:
         if not players:
             raise ValueError(f"No participants found for tournament '{name}'.")
         return _map_participants(players)
+
+    def get_standings(self, tournament_id: UUID) -> list[TournamentStandingRead]:
+        tournament = self.tournament_repo.get_tournament_by_id(tournament_id)
+        if not tournament:
+            raise ValueError(f"Tournament with id {tournament_id} not found.")
+
+        version = self.version() if self.version is not None else None
+
+        def load():
+            rows = self.tournament_repo.get_tournament_results(tournament_id)
+            return _map_standings(
+                rows, compute_standings([row.opponents for row in rows], [row.scores for row in rows])
+            )
+
+        return self.cache.get_or_load(("standings", tournament_id), load, version)
@@ -13,6 +13,9 @@ class ViolationService:
     def get_all(self):
         return self.repo.get_all()
 
+    def get_page(self, limit: int, cursor: str | None = None):
+        return self.repo.get_page(limit, cursor)
+
     def get_by_id(self, violation_id: UUID):
         v = self.repo.get_by_id(violation_id)
         if not v:
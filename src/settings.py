@@ -9,10 +9,59 @@ class Settings(BaseModel):
     DATABASE_URL: str
     ENV: str = "development"
     DEBUG: bool = False
+    # Serve the DB-bound routers from the AsyncSession stack instead of the threadpool
+    DB_ASYNC: bool = False
+
+    # Connection pool (applies to both the sync and the async engine)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = -1
+    DB_POOL_PRE_PING: bool = False
+
+    # Rating engine used when results are recorded: "fixed" (the original
+    # +10 / -9 / +1 rule) or "elo"
+    RATING_ENGINE: str = "fixed"
+
+    # Seconds a cached leaderboard is served before it is rebuilt (0 disables)
+    LEADERBOARD_CACHE_TTL: float = 30.0
+    # Upper bound on how long another worker's skill-level edits go unseen
+    SKILL_LEVEL_CACHE_TTL: float = 300.0
+    # Seconds cached tournament standings are served; a committed game write, from any process, drops them sooner
+    STANDINGS_CACHE_TTL: float = 300.0
+    # Tag /tournaments, /players/search/all and the leaderboard with ETags and answer 304s
+    ETAGS: bool = True
+    # Serve /games/all and /players/search/all rows with orjson, skipping response-model validation
+    FAST_JSON_LISTS: bool = False
+
+    # Per-request SQL profiler; all three can be changed at runtime via PUT /database/profiler
+    SQL_PROFILER: bool = False
+    # Statements at least this slow go to the slow-query log
+    SQL_SLOW_QUERY_MS: float = 200.0
+    # A request executing one statement shape this many times is reported as a probable N+1
+    SQL_N_PLUS_ONE_THRESHOLD: int = 10
+    # File the slow-query log is written to (unset: the regular log)
+    SQL_SLOW_QUERY_LOG: str | None = None
 
 
 settings = Settings(
     DATABASE_URL=os.getenv("DATABASE_URL"),
     ENV=os.getenv("ENV", "development"),
     DEBUG=os.getenv("DEBUG", "false").lower() == "true",
-)
\ No newline at end of file
+    DB_ASYNC=os.getenv("DB_ASYNC", "false").lower() == "true",
+    DB_POOL_SIZE=int(os.getenv("DB_POOL_SIZE", "5")),
+    DB_MAX_OVERFLOW=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+    DB_POOL_TIMEOUT=float(os.getenv("DB_POOL_TIMEOUT", "30")),
+    DB_POOL_RECYCLE=int(os.getenv("DB_POOL_RECYCLE", "-1")),
+    DB_POOL_PRE_PING=os.getenv("DB_POOL_PRE_PING", "false").lower() == "true",
+    RATING_ENGINE=os.getenv("RATING_ENGINE", "fixed").lower(),
+    LEADERBOARD_CACHE_TTL=float(os.getenv("LEADERBOARD_CACHE_TTL", "30")),
+    SKILL_LEVEL_CACHE_TTL=float(os.getenv("SKILL_LEVEL_CACHE_TTL", "300")),
+    STANDINGS_CACHE_TTL=float(os.getenv("STANDINGS_CACHE_TTL", "300")),
+    ETAGS=os.getenv("ETAGS", "true").lower() == "true",
+    FAST_JSON_LISTS=os.getenv("FAST_JSON_LISTS", "false").lower() == "true",
+    SQL_PROFILER=os.getenv("SQL_PROFILER", "false").lower() == "true",
+    SQL_SLOW_QUERY_MS=float(os.getenv("SQL_SLOW_QUERY_MS", "200")),
+    SQL_N_PLUS_ONE_THRESHOLD=int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", "10")),
+    SQL_SLOW_QUERY_LOG=os.getenv("SQL_SLOW_QUERY_LOG") or None,
+)
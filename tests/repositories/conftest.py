@@ -0,0 +1,75 @@
+import os
+import uuid
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+import src.domain  # noqa: F401  (registers every table, and its triggers, on Base.metadata)
+from src.base import Base
+from src.domain.player import Player
+from src.domain.tournament import Tournament
+
+# Repository tests run against a real PostgreSQL database
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+requires_database = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="set TEST_DATABASE_URL to a PostgreSQL database"
+)
+
+
+@pytest.fixture
+def schema_engine():
+    """An engine whose connections see only a fresh, empty schema of their own."""
+    schema = f"test_{uuid.uuid4().hex}"
+    admin = create_engine(TEST_DATABASE_URL)
+    with admin.begin() as connection:
+        connection.execute(text(f"CREATE SCHEMA {schema}"))
+    engine = create_engine(
+        TEST_DATABASE_URL, connect_args={"options": f"-csearch_path={schema}"}
+    )
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+    with admin.begin() as connection:
+        connection.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+    admin.dispose()
+
+
+@pytest.fixture
+def session_factory(schema_engine):
+    return sessionmaker(bind=schema_engine, autoflush=False)
+
+
+@pytest.fixture
+def session(session_factory):
+    with session_factory() as session:
+        yield session
+
+
+@pytest.fixture
+def tournament(session):
+    tournament = Tournament(
+        name=f"test-{uuid.uuid4()}",
+        start_date=date(2026, 1, 1),
+        end_date=date(2026, 1, 2),
+        location="Test",
+    )
+    session.add(tournament)
+    session.commit()
+    return tournament
+
+
+@pytest.fixture
+def make_players(session):
+    def make(*ratings):
+        players = [
+            Player(first_name="Test", last_name=f"Player {i}", rating=rating)
+            for i, rating in enumerate(ratings)
+        ]
+        session.add_all(players)
+        session.commit()
+        return players
+
+    return make
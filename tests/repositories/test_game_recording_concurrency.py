@@ -0,0 +1,109 @@
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, delete
+from sqlalchemy.orm import sessionmaker
+
+from src.base import Base
+from src.domain.game import Game, WinState
+from src.domain.player import Player
+from src.domain.tournament import Tournament
+from src.repositories.game_repository import GameRepository
+from src.services.game_service import GameService
+from src.services.rating_engine import FixedRatingEngine, rating_changes
+
+# Stress test against a real PostgreSQL database (it only cleans up its own rows)
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="set TEST_DATABASE_URL to a PostgreSQL database"
+)
+
+WORKERS = 16
+GAMES = 400
+START_RATING = 1500
+# Fixed changes keep the expected ratings independent of commit order
+ENGINE = FixedRatingEngine()
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(TEST_DATABASE_URL, pool_size=WORKERS, max_overflow=0)
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine, autoflush=False)
+    engine.dispose()
+
+
+@pytest.fixture
+def fixture_rows(session_factory):
+    with session_factory() as session:
+        tournament = Tournament(
+            name=f"stress-{uuid.uuid4()}",
+            start_date=date(2026, 1, 1),
+            end_date=date(2026, 1, 2),
+            location="Test",
+        )
+        first = Player(first_name="Stress", last_name="One", rating=START_RATING)
+        second = Player(first_name="Stress", last_name="Two", rating=START_RATING)
+        session.add_all([tournament, first, second])
+        session.commit()
+        ids = (tournament.tournament_id, first.player_id, second.player_id)
+
+    yield ids
+
+    tournament_id, first_id, second_id = ids
+    with session_factory() as session:
+        session.execute(delete(Game).where(Game.tournament_id == tournament_id))
+        session.execute(delete(Player).where(Player.player_id.in_([first_id, second_id])))
+        session.execute(delete(Tournament).where(Tournament.tournament_id == tournament_id))
+        session.commit()
+
+
+def test_concurrent_recording_loses_no_rating_updates(session_factory, fixture_rows):
+    tournament_id, first_id, second_id = fixture_rows
+    results = [WinState.WHITE_WIN, WinState.BLACK_WIN, WinState.DRAW]
+
+    def game_for(index: int) -> tuple[uuid.UUID, uuid.UUID, WinState]:
+        # Alternate colours so each player both gains and loses as white and as
+        # black. The lock order doesn't depend on colour: the rating UPDATE
+        # locks both rows in one statement, and engines that read ratings
+        # first lock them in player_id order (get_rating_inputs).
+        white, black = (first_id, second_id) if index % 2 == 0 else (second_id, first_id)
+        return white, black, results[index % len(results)]
+
+    def record(index: int) -> None:
+        white, black, result = game_for(index)
+        with session_factory() as session:
+            GameService(GameRepository(session), ENGINE).add_game_with_ratings(
+                Game(
+                    tournament_id=tournament_id,
+                    player_white_id=white,
+                    player_black_id=black,
+                    result=result,
+                )
+            )
+
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        list(pool.map(record, range(GAMES)))
+
+    expected = {first_id: START_RATING, second_id: START_RATING}
+    for index in range(GAMES):
+        white, black, result = game_for(index)
+        white_change, black_change = rating_changes(ENGINE, result)
+        expected[white] += white_change
+        expected[black] += black_change
+
+    with session_factory() as session:
+        ratings = {
+            player.player_id: player.rating
+            for player in session.query(Player).filter(
+                Player.player_id.in_([first_id, second_id])
+            )
+        }
+        games = session.query(Game).filter(Game.tournament_id == tournament_id).count()
+
+    assert games == GAMES
+    assert ratings == expected
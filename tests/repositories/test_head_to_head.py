@@ -0,0 +1,85 @@
+from src.domain.game import Game, WinState
+from src.repositories.game_repository import GameRepository
+from tests.repositories.conftest import requires_database
+
+pytestmark = requires_database
+
+
+def add(repo, tournament, white, black, result):
+    game = Game(
+        tournament_id=tournament.tournament_id,
+        player_white_id=white.player_id,
+        player_black_id=black.player_id,
+        result=result,
+    )
+    repo.add_game(game)
+    return game.game_id
+
+
+def low_high(x, y):
+    return min(x.player_id, y.player_id), max(x.player_id, y.player_id)
+
+
+def record(row):
+    return (row.player1_id, row.player2_id, row.games_played, row.wins, row.losses, row.draws)
+
+
+def test_pairs_are_seen_from_the_first_players_side(session, tournament, make_players):
+    a, b, c = make_players(1500, 1500, 1500)
+    repo = GameRepository(session)
+    add(repo, tournament, a, b, WinState.WHITE_WIN)
+    add(repo, tournament, b, a, WinState.WHITE_WIN)
+    add(repo, tournament, b, a, WinState.BLACK_WIN)
+    add(repo, tournament, a, b, WinState.DRAW)
+
+    rows = repo.get_head_to_head(
+        [(a.player_id, b.player_id), (b.player_id, a.player_id), (a.player_id, c.player_id)]
+    )
+
+    # Request order is kept, and pairs that never met come back as zeros
+    assert [record(row) for row in rows] == [
+        (a.player_id, b.player_id, 4, 2, 1, 1),
+        (b.player_id, a.player_id, 4, 1, 2, 1),
+        (a.player_id, c.player_id, 0, 0, 0, 0),
+    ]
+    assert repo.get_head_to_head([]) == []
+
+
+def test_aggregate_follows_result_changes_and_deletes(session, tournament, make_players):
+    a, b = make_players(1500, 1500)
+    repo = GameRepository(session)
+    first = add(repo, tournament, a, b, WinState.WHITE_WIN)
+    second = add(repo, tournament, b, a, None)
+
+    def a_vs_b():
+        [row] = repo.get_head_to_head([(a.player_id, b.player_id)])
+        return row.games_played, row.wins, row.losses, row.draws
+
+    assert a_vs_b() == (2, 1, 0, 0)
+    repo.update_game_result(second, WinState.WHITE_WIN)
+    assert a_vs_b() == (2, 1, 1, 0)
+    repo.update_game_result(first, WinState.DRAW)
+    assert a_vs_b() == (2, 0, 1, 1)
+    repo.delete_game_by_id(second)
+    assert a_vs_b() == (1, 0, 0, 1)
+
+
+def test_matrix_lists_only_pairs_that_met(session, tournament, make_players):
+    a, b, c, d = make_players(1500, 1500, 1500, 1500)
+    repo = GameRepository(session)
+    add(repo, tournament, a, b, WinState.WHITE_WIN)
+    add(repo, tournament, c, a, WinState.DRAW)
+    gone = add(repo, tournament, b, c, WinState.BLACK_WIN)
+    add(repo, tournament, c, d, WinState.WHITE_WIN)
+    repo.delete_game_by_id(gone)
+
+    rows = repo.get_head_to_head_matrix([a.player_id, b.player_id, c.player_id])
+
+    pairs = {(row.player1_id, row.player2_id): row for row in rows}
+    # b and c's only game was deleted, and d wasn't asked for
+    assert set(pairs) == {low_high(a, b), low_high(a, c)}
+    assert [row.player1_id for row in rows] == sorted(row.player1_id for row in rows)
+    ab = pairs[low_high(a, b)]
+    assert (ab.wins, ab.losses) == ((1, 0) if a.player_id < b.player_id else (0, 1))
+    assert pairs[low_high(a, c)].draws == 1
+    assert repo.get_head_to_head_matrix([]) == []
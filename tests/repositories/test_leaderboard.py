@@ -0,0 +1,71 @@
+import pytest
+
+from src.domain.exceptions import NotFoundError
+from src.domain.game import Game, WinState
+from src.domain.skill_level import SkillLevel
+from src.repositories.game_repository import GameRepository
+from src.repositories.relations_repository import RelationsRepository
+from tests.repositories.conftest import requires_database
+
+pytestmark = requires_database
+
+
+@pytest.fixture
+def players(session, tournament, make_players):
+    low, mid, high, top, idle = make_players(1400, 1500, 1600, 1700, 1800)
+    repo = GameRepository(session)
+    for white, black, result in [
+        (top, low, WinState.WHITE_WIN),
+        (high, mid, WinState.DRAW),
+        (mid, low, WinState.WHITE_WIN),
+    ]:
+        repo.add_game(
+            Game(
+                tournament_id=tournament.tournament_id,
+                player_white_id=white.player_id,
+                player_black_id=black.player_id,
+                result=result,
+            )
+        )
+    session.add(SkillLevel(title="Expert", rating_lower_bound=1550, rating_upper_bound=1800))
+    session.commit()
+    return low, mid, high, top, idle
+
+
+def test_top_players_are_rated_from_player_stats(session, players):
+    low, mid, high, top, _ = players
+
+    rows = RelationsRepository(session).get_top_players()
+
+    # Players without games are left out
+    assert [row.player_id for row in rows] == [p.player_id for p in (top, high, mid, low)]
+    by_id = {row.player_id: row for row in rows}
+    assert by_id[top.player_id].winLoss == 1.0
+    assert by_id[low.player_id].winLoss == 0.0
+    assert by_id[high.player_id].drawPercent == 1.0
+    assert by_id[mid.player_id].drawPercent == 0.5
+    assert by_id[mid.player_id].avgOppRating == 1500.0
+
+
+def test_pages_walk_the_full_leaderboard(session, players):
+    repo = RelationsRepository(session)
+    everyone = [row.player_id for row in repo.get_top_players()]
+
+    first, cursor = repo.get_top_players_page(3)
+    second, last_cursor = repo.get_top_players_page(3, cursor)
+    assert [row.player_id for row in first + second] == everyone
+    assert last_cursor is None
+
+    skipped, _ = repo.get_top_players_page(2, offset=1)
+    assert [row.player_id for row in skipped] == everyone[1:3]
+
+
+def test_skill_level_filter(session, players):
+    _, _, high, top, _ = players
+    repo = RelationsRepository(session)
+
+    rows, _ = repo.get_top_players_page(10, skill_level="Expert")
+    assert [row.player_id for row in rows] == [top.player_id, high.player_id]
+
+    with pytest.raises(NotFoundError):
+        repo.get_top_players_page(10, skill_level="Grandmaster")
@@ -0,0 +1,61 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.domain.exceptions import ConflictError
+from src.domain.game import Game
+from src.repositories.game_repository import GameRepository
+from src.services.game_service import GameService
+from src.services.rating_engine import FixedRatingEngine
+from tests.repositories.conftest import requires_database
+
+pytestmark = requires_database
+
+CALLERS = 8
+
+
+def race(session_factory, generate):
+    """Run ``generate(service)`` from CALLERS threads at once; returns (successes, conflicts)."""
+
+    def call(_):
+        with session_factory() as session:
+            try:
+                return generate(GameService(GameRepository(session), FixedRatingEngine()))
+            except ConflictError:
+                return None
+
+    with ThreadPoolExecutor(max_workers=CALLERS) as pool:
+        outcomes = list(pool.map(call, range(CALLERS)))
+    successes = [outcome for outcome in outcomes if outcome is not None]
+    return successes, len(outcomes) - len(successes)
+
+
+@pytest.fixture
+def entrants(make_players):
+    return [player.player_id for player in make_players(1500, 1600, 1700, 1800, 1900)]
+
+
+def test_concurrent_swiss_pairing_creates_one_round(session, session_factory, tournament, entrants):
+    successes, conflicts = race(
+        session_factory,
+        lambda service: service.generate_swiss_round(tournament.tournament_id, entrants),
+    )
+
+    assert len(successes) == 1
+    assert conflicts == CALLERS - 1
+    games = session.query(Game).filter(Game.tournament_id == tournament.tournament_id).all()
+    # Two games and a bye for five entrants
+    assert len(games) == 3
+    assert {game.round_number for game in games} == {1}
+
+
+def test_concurrent_round_robin_schedules_once(session, session_factory, tournament, entrants):
+    successes, conflicts = race(
+        session_factory,
+        lambda service: service.generate_round_robin(tournament.tournament_id, entrants),
+    )
+
+    assert len(successes) == 1
+    assert conflicts == CALLERS - 1
+    games = session.query(Game).filter(Game.tournament_id == tournament.tournament_id).count()
+    assert games == 10
@@ -0,0 +1,77 @@
+from sqlalchemy import text
+
+from src.domain.game import Game, WinState
+from src.repositories.game_repository import GameRepository
+from src.repositories.player_stats import rebuild_player_stats
+from tests.repositories.conftest import requires_database
+
+pytestmark = requires_database
+
+
+def aggregates(session):
+    # Rows taken back to zero by uncount_games are left in place; a rebuild drops them
+    stats = session.execute(
+        text(
+            "SELECT player_id, tournament_id, games_played, wins, losses, draws, "
+            "opponent_rating_sum, opponent_rating_count FROM player_stats "
+            "WHERE games_played <> 0 ORDER BY 1, 2"
+        )
+    ).all()
+    pairs = session.execute(
+        text("SELECT * FROM head_to_head WHERE games_played <> 0 ORDER BY 1, 2")
+    ).all()
+    return stats, pairs
+
+
+def assert_matches_rebuild(session):
+    maintained = aggregates(session)
+    rebuild_player_stats(session)
+    session.commit()
+    assert aggregates(session) == maintained
+    return maintained
+
+
+def test_maintained_aggregates_match_a_rebuild(session, tournament, make_players):
+    a, b, c = make_players(1500, 1600, 1700)
+    repo = GameRepository(session)
+    tid = tournament.tournament_id
+
+    scheduled = repo.add_scheduled_games(
+        tid, [1, 1], [a.player_id, c.player_id], [b.player_id, None], [None, WinState.WHITE_WIN]
+    )
+    repo.record_game_with_ratings(
+        Game(tournament_id=tid, player_white_id=c.player_id, player_black_id=a.player_id,
+             result=WinState.DRAW),
+        1, 1,
+    )
+    assert_matches_rebuild(session)
+
+    repo.update_game_result(scheduled[0], WinState.BLACK_WIN)
+    stats, pairs = assert_matches_rebuild(session)
+    by_player = {row.player_id: row for row in stats}
+    assert (by_player[b.player_id].wins, by_player[b.player_id].games_played) == (1, 1)
+    # Opponent ratings are the ones from before each game
+    assert by_player[a.player_id].opponent_rating_sum == 1600 + 1700
+    assert len(pairs) == 2
+
+    repo.update_game_result(scheduled[0], WinState.DRAW)
+    assert_matches_rebuild(session)
+
+    repo.delete_game_by_id(scheduled[0])
+    stats, pairs = assert_matches_rebuild(session)
+    assert {row.player_id for row in stats} == {a.player_id, c.player_id}
+    assert len(pairs) == 1
+
+
+def test_byes_are_not_counted_as_games(session, tournament, make_players):
+    (a,) = make_players(1500)
+    repo = GameRepository(session)
+
+    (bye,) = repo.add_scheduled_games(
+        tournament.tournament_id, [1], [a.player_id], [None], [WinState.WHITE_WIN]
+    )
+    assert aggregates(session) == ([], [])
+
+    repo.delete_game_by_id(bye)
+    assert aggregates(session) == ([], [])
+    assert_matches_rebuild(session)
@@ -0,0 +1,144 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from src.domain.exceptions import NotFoundError
+from src.domain.game import Game, WinState
+from src.repositories.game_repository import GameRepository
+from src.repositories.relations_repository import RelationsRepository
+from src.services.game_service import GameService
+from src.services.rating_engine import FixedRatingEngine
+from tests.repositories.conftest import requires_database
+
+pytestmark = requires_database
+
+
+def played(day):
+    return datetime(2026, 1, day, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def games(session, tournament, make_players):
+    """a beats b as white, draws b as black, beats c as black; a vs b is still to play."""
+    a, b, c = make_players(1500, 1600, 1700)
+    repo = GameRepository(session)
+    tid = tournament.tournament_id
+    for white, black, result, day in [
+        (a, b, WinState.WHITE_WIN, 1),
+        (b, a, WinState.DRAW, 2),
+        (c, a, WinState.BLACK_WIN, 3),
+        (a, b, None, None),
+    ]:
+        repo.add_game(
+            Game(
+                tournament_id=tid,
+                player_white_id=white.player_id,
+                player_black_id=black.player_id,
+                result=result,
+                played_at=day and played(day),
+            )
+        )
+    return a, b, c
+
+
+def test_player_summary_counts_both_colours(session, games):
+    a, _, c = games
+    repo = RelationsRepository(session)
+
+    summary = repo.get_player_summary_by_id(a.player_id)
+    assert summary.total_games == 4
+    assert float(summary.win_rate) == pytest.approx(62.5)
+
+    summary = repo.get_player_summary_by_id(c.player_id)
+    assert (summary.total_games, float(summary.win_rate)) == (1, 0.0)
+
+
+def test_match_history_lists_every_game_of_the_player(session, games):
+    a, b, c = games
+    repo = RelationsRepository(session)
+
+    history = repo.get_player_match_history(a.player_id)
+    assert history.player_id == a.player_id
+    assert len(history.match_history) == 4
+    assert len(repo.get_player_match_history(c.player_id).match_history) == 1
+    assert repo.get_player_match_history(uuid.uuid4()) is None
+
+
+def test_match_history_page_is_newest_first_from_the_players_side(session, games):
+    a, b, c = games
+    repo = RelationsRepository(session)
+
+    first, cursor = repo.get_player_match_history_page(a.player_id, 2)
+    rest, last_cursor = repo.get_player_match_history_page(a.player_id, 2, cursor)
+
+    rows = first + rest
+    assert [(r.color, r.outcome, r.opponent_id) for r in rows] == [
+        ("BLACK", "WIN", c.player_id),
+        ("BLACK", "DRAW", b.player_id),
+        ("WHITE", "WIN", b.player_id),
+        # The undated game comes last
+        ("WHITE", None, b.player_id),
+    ]
+    assert rows[0].opponent_first_name == c.first_name
+    assert rows[0].opponent_rating == 1700
+    assert last_cursor is None
+
+
+def test_undated_games_follow_the_dated_ones_across_pages(session, tournament, make_players):
+    a, b = make_players(1500, 1600)
+    repo = GameRepository(session)
+    for result, day in [
+        (WinState.WHITE_WIN, None),
+        (WinState.DRAW, 2),
+        (WinState.BLACK_WIN, None),
+        (WinState.WHITE_WIN, 1),
+    ]:
+        repo.add_game(
+            Game(
+                tournament_id=tournament.tournament_id,
+                player_white_id=a.player_id,
+                player_black_id=b.player_id,
+                result=result,
+                played_at=day and played(day),
+            )
+        )
+
+    rows, cursor = [], None
+    while True:
+        page, cursor = RelationsRepository(session).get_player_match_history_page(a.player_id, 1, cursor)
+        rows += page
+        if cursor is None:
+            break
+
+    assert [r.played_at for r in rows[:2]] == [played(2), played(1)]
+    undated = rows[2:]
+    assert [r.played_at for r in undated] == [None, None]
+    assert sorted(r.outcome for r in undated) == ["LOSS", "WIN"]
+    assert [r.game_id for r in undated] == sorted((r.game_id for r in undated), reverse=True)
+    # Same games as the unpaged history
+    history = RelationsRepository(session).get_player_match_history(str(a.player_id))
+    assert {r.game_id for r in rows} == {g.game_id for g in history.match_history}
+
+
+def test_match_history_page_of_unknown_player(session, games):
+    with pytest.raises(NotFoundError):
+        RelationsRepository(session).get_player_match_history_page(uuid.uuid4(), 10)
+
+
+def test_decided_scheduled_game_joins_the_history(session, tournament, make_players):
+    a, b = make_players(1500, 1600)
+    repo = RelationsRepository(session)
+    [game_id] = GameRepository(session).add_scheduled_games(
+        tournament.tournament_id, [1], [a.player_id], [b.player_id], [None]
+    )
+    [scheduled], _ = repo.get_player_match_history_page(a.player_id, 10)
+    assert (scheduled.game_id, scheduled.outcome, scheduled.played_at) == (game_id, None, None)
+
+    GameService(GameRepository(session), FixedRatingEngine()).update_game_result(
+        str(game_id), WinState.BLACK_WIN
+    )
+
+    rows, _ = repo.get_player_match_history_page(a.player_id, 10)
+    assert [(r.game_id, r.outcome) for r in rows] == [(game_id, "LOSS")]
+    assert rows[0].played_at is not None
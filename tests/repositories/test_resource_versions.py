@@ -0,0 +1,221 @@
+import time
+from datetime import date
+
+from sqlalchemy import create_engine, text
+
+from src.domain.game import Game, WinState
+from src.domain.player import Player
+from src.domain.skill_level import SkillLevel
+from src.domain.tournament import Tournament
+from src.repositories.game_repository import GameRepository
+from src.repositories.relations_repository import RelationsRepository
+from src.services.cache import (
+    ResourceVersion,
+    TTLCache,
+    leaderboard_version,
+    players_version,
+    standings_version,
+    tournaments_version,
+)
+from src.repositories.tournament_repository import TournamentRepository
+from src.services.relations_service import RelationsService
+from src.services.tournament_service import TournamentService
+from tests.repositories.conftest import TEST_DATABASE_URL, requires_database
+
+pytestmark = requires_database
+
+VERSIONS = (
+    tournaments_version,
+    players_version,
+    leaderboard_version,
+    standings_version,
+)
+
+
+def etags(session):
+    tags = {version.name: version.etag(session) for version in VERSIONS}
+    session.rollback()
+    return tags
+
+
+def test_writes_move_only_the_resources_read_from_their_table(session_factory, session):
+    before = etags(session)
+
+    with session_factory() as writer:
+        writer.add(Player(first_name="New", last_name="Player", rating=1500))
+        writer.commit()
+    after_player = etags(session)
+    assert after_player["tournaments"] == before["tournaments"]
+    assert after_player["players"] != before["players"]
+    assert after_player["leaderboard"] != before["leaderboard"]
+    assert after_player["standings"] != before["standings"]
+
+    with session_factory() as writer:
+        writer.add(
+            SkillLevel(title="Novice", rating_lower_bound=0, rating_upper_bound=1000)
+        )
+        writer.commit()
+    after_level = etags(session)
+    assert after_level["players"] == after_player["players"]
+    assert after_level["leaderboard"] != after_player["leaderboard"]
+    assert after_level["standings"] == after_player["standings"]
+
+    with session_factory() as writer:
+        tournament = Tournament(
+            name="Open",
+            start_date=date(2026, 1, 1),
+            end_date=date(2026, 1, 2),
+            location="Here",
+        )
+        writer.add(tournament)
+        writer.commit()
+        after_tournament = etags(session)
+        assert after_tournament["tournaments"] != after_level["tournaments"]
+        assert after_tournament["standings"] == after_level["standings"]
+
+        writer.add(Game(tournament_id=tournament.tournament_id))
+        writer.commit()
+    after_game = etags(session)
+    assert after_game["standings"] != after_tournament["standings"]
+    assert {k: v for k, v in after_game.items() if k != "standings"} == {
+        k: v for k, v in after_tournament.items() if k != "standings"
+    }
+
+
+def test_uncommitted_and_rolled_back_writes_keep_the_tag(session_factory, session):
+    before = etags(session)
+    with session_factory() as writer:
+        writer.add(Player(first_name="Never", last_name="Saved", rating=1500))
+        writer.flush()
+        # Another worker can't see the write yet, so the tag must not move
+        assert etags(session) == before
+        writer.rollback()
+    assert etags(session) == before
+
+
+def test_every_backend_adds_to_the_same_counter(session_factory, session):
+    def players_counter():
+        counter = players_version.current(session)
+        session.rollback()
+        return counter
+
+    before = players_counter()
+    writers = [session_factory() for _ in range(3)]
+    for i, writer in enumerate(writers):
+        writer.add(Player(first_name="Concurrent", last_name=str(i), rating=1500))
+        writer.flush()
+    for writer in writers:
+        writer.commit()
+        writer.close()
+    assert players_counter() == before + 3
+
+
+def test_cached_leaderboard_follows_writes_made_by_other_processes(
+    session_factory, session, tournament, make_players
+):
+    white, black = make_players(1500, 1600)
+    GameRepository(session).add_game(
+        Game(
+            tournament_id=tournament.tournament_id,
+            player_white_id=white.player_id,
+            player_black_id=black.player_id,
+            result=WinState.DRAW,
+        )
+    )
+    # Two workers, each with its own cache, as separate processes would have
+    with session_factory() as first, session_factory() as second:
+        services = [
+            RelationsService(
+                RelationsRepository(db),
+                cache=TTLCache("leaderboard", ttl_seconds=60),
+                version=lambda db=db: leaderboard_version.current(db),
+            )
+            for db in (first, second)
+        ]
+        assert [[row.rating for row in s.get_top_players()] for s in services] == [
+            [1600, 1500]
+        ] * 2
+
+        # A write neither worker's @invalidates saw, as from cli.py or psql
+        with session_factory() as writer:
+            writer.get(Player, white.player_id).rating = 1700
+            writer.commit()
+
+        assert [[row.rating for row in s.get_top_players()] for s in services] == [
+            [1700, 1600]
+        ] * 2
+
+
+def test_cached_standings_follow_games_recorded_by_other_processes(
+    session_factory, tournament, make_players
+):
+    white, black = make_players(1500, 1600)
+    with session_factory() as first, session_factory() as second:
+        services = [
+            TournamentService(
+                db,
+                TournamentRepository(db),
+                cache=TTLCache("standings", ttl_seconds=60),
+                version=lambda db=db: standings_version.current(db),
+            )
+            for db in (first, second)
+        ]
+        for service in services:
+            assert all(
+                row.games_played == 0
+                for row in service.get_standings(tournament.tournament_id)
+            )
+
+        # Recorded without either worker's @invalidates running
+        with session_factory() as writer:
+            GameRepository(writer).add_game(
+                Game(
+                    tournament_id=tournament.tournament_id,
+                    player_white_id=white.player_id,
+                    player_black_id=black.player_id,
+                    result=WinState.WHITE_WIN,
+                )
+            )
+
+        for service in services:
+            standings = service.get_standings(tournament.tournament_id)
+            assert [(row.player_id, row.points) for row in standings] == [
+                (white.player_id, 1.0),
+                (black.player_id, 0.0),
+            ]
+
+
+def test_compact_folds_finished_backends_without_moving_any_tag(schema_engine, session):
+    schema = session.execute(text("SELECT current_schema()")).scalar_one()
+    writers = create_engine(
+        TEST_DATABASE_URL, connect_args={"options": f"-csearch_path={schema}"}
+    )
+    for i in range(3):
+        with writers.connect() as conn:
+            pid = conn.execute(text("SELECT pg_backend_pid()")).scalar_one()
+            conn.execute(
+                text(
+                    "INSERT INTO players VALUES (gen_random_uuid(), 'Gone', :n, 1500)"
+                ),
+                {"n": str(i)},
+            )
+            conn.commit()
+            conn.invalidate()  # closes the backend instead of returning it to the pool
+    writers.dispose()
+    before = etags(session)
+    for _ in range(50):
+        if not session.execute(
+            text("SELECT 1 FROM pg_stat_activity WHERE pid = :pid"), {"pid": pid}
+        ).first():
+            break
+        session.rollback()
+        time.sleep(0.05)
+
+    assert ResourceVersion.compact(session) >= 3
+    assert etags(session) == before
+    assert (
+        session.execute(
+            text("SELECT count(*) FROM resource_versions WHERE backend_pid = 0")
+        ).scalar_one()
+        == 3
+    )
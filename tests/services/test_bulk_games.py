@@ -0,0 +1,123 @@
+import uuid
+
+import pytest
+
+from src.domain.exceptions import ValidationError
+from src.domain.game import WinState
+from src.DTO.game import GameCreate
+from src.services import game_service
+from src.services.game_service import GameService
+from src.services.rating_engine import EloRatingEngine, FixedRatingEngine
+
+
+class FakeBulkRepository:
+    def __init__(self, tournaments, players):
+        self.tournaments = set(tournaments)
+        # player_id -> (rating, rated games)
+        self.players = dict(players)
+        self.for_update = None
+        self.inserted = None
+
+    def find_existing_tournament_ids(self, tournament_ids):
+        return self.tournaments & set(tournament_ids)
+
+    def get_rating_inputs(self, player_ids, for_update=False):
+        self.for_update = for_update
+        return {p: self.players[p] for p in player_ids if p in self.players}
+
+    def add_games_bulk(self, rows, rating_changes):
+        self.inserted = (rows, rating_changes)
+        return len(rows)
+
+
+@pytest.fixture
+def ids():
+    return [uuid.uuid4() for _ in range(4)]
+
+
+def game(tournament, white=None, black=None, result=None):
+    return GameCreate(
+        tournament_id=tournament, player_white_id=white, player_black_id=black, result=result
+    )
+
+
+def test_invalid_items_are_reported_by_index_and_skipped(ids):
+    tournament, a, b, c = ids
+    repo = FakeBulkRepository({tournament}, {a: (1500, 0), b: (1500, 0)})
+    items = [
+        game(tournament, a, b, WinState.WHITE_WIN),
+        game(uuid.uuid4(), a, b),
+        game(tournament, a, c),
+        game(tournament, a, a),
+        game(tournament, a, None, WinState.DRAW),
+        game(tournament, a),
+    ]
+
+    result = GameService(repo, FixedRatingEngine()).add_games_bulk(items)
+
+    assert result["inserted"] == 2
+    assert [e["index"] for e in result["errors"]] == [1, 2, 3, 4]
+    assert "not found" in result["errors"][0]["detail"]
+    assert result["errors"][1]["detail"] == f"Player {c} not found."
+    rows, changes = repo.inserted
+    assert [row["game_id"] for row in rows] == result["game_ids"]
+    assert changes == {a: 10, b: -9}
+
+
+def test_atomic_rejects_the_whole_batch(ids):
+    tournament, a, b, _ = ids
+    repo = FakeBulkRepository({tournament}, {a: (1500, 0), b: (1500, 0)})
+    items = [game(tournament, a, b, WinState.WHITE_WIN), game(tournament, a, a)]
+
+    result = GameService(repo, FixedRatingEngine()).add_games_bulk(items, atomic=True)
+
+    assert result["inserted"] == 0
+    assert result["game_ids"] == []
+    assert [e["index"] for e in result["errors"]] == [1]
+    assert repo.inserted is None
+
+
+def test_rating_changes_replay_in_submission_order(ids):
+    tournament, a, b, c = ids
+    start = {a: (1500, 40), b: (1500, 40), c: (1700, 40)}
+    items = [
+        game(tournament, a, b, WinState.WHITE_WIN),
+        game(tournament, c, a, WinState.DRAW),
+        game(tournament, b, c, WinState.BLACK_WIN),
+    ]
+    repo = FakeBulkRepository({tournament}, start)
+    engine = EloRatingEngine()
+
+    GameService(repo, engine).add_games_bulk(items)
+
+    # The same games added one at a time
+    ratings = {p: list(v) for p, v in start.items()}
+    for item in items:
+        white, black = ratings[item.player_white_id], ratings[item.player_black_id]
+        white_change, black_change = game_service.rating_changes(
+            engine, item.result, white[0], black[0], white[1], black[1]
+        )
+        white[0] += white_change
+        black[0] += black_change
+        white[1] += 1
+        black[1] += 1
+    expected = {p: ratings[p][0] - start[p][0] for p in start if ratings[p][0] != start[p][0]}
+    assert repo.inserted[1] == expected
+    assert repo.for_update is True
+
+
+def test_fixed_engine_reads_players_without_locking(ids):
+    tournament, a, b, _ = ids
+    repo = FakeBulkRepository({tournament}, {a: (1500, 0), b: (1500, 0)})
+    GameService(repo, FixedRatingEngine()).add_games_bulk([game(tournament, a, b, WinState.DRAW)])
+    assert repo.for_update is False
+    assert repo.inserted[1] == {a: 1, b: 1}
+
+
+def test_batch_size_is_capped(ids, monkeypatch):
+    tournament = ids[0]
+    monkeypatch.setattr(game_service, "MAX_BULK_GAMES", 2)
+    repo = FakeBulkRepository({tournament}, {})
+    with pytest.raises(ValidationError):
+        GameService(repo, FixedRatingEngine()).add_games_bulk([game(tournament)] * 3)
+    assert repo.inserted is None
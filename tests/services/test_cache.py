@@ -0,0 +1,91 @@
+from src.api.conditional import etag_matches
+from src.services.cache import ResourceVersion, TTLCache, invalidates
+from src.settings import settings
+
+
+def test_hits_after_first_load_until_invalidated():
+    cache = TTLCache("test", ttl_seconds=60)
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return len(loads)
+
+    assert cache.get_or_load("k", loader) == 1
+    assert cache.get_or_load("k", loader) == 1
+    cache.invalidate()
+    assert cache.get_or_load("k", loader) == 2
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["invalidations"]) == (1, 2, 1)
+
+
+def test_load_racing_an_invalidation_is_not_stored():
+    cache = TTLCache("test", ttl_seconds=60)
+
+    def stale_loader():
+        cache.invalidate()  # a write commits while the value is being built
+        return "stale"
+
+    assert cache.get_or_load("k", stale_loader) == "stale"
+    assert cache.get_or_load("k", lambda: "fresh") == "fresh"
+
+
+def test_entry_stored_at_an_older_version_is_reloaded():
+    # Two workers' caches; the second never sees the first one's invalidation
+    caches = [TTLCache("a", ttl_seconds=60), TTLCache("b", ttl_seconds=60)]
+    assert [cache.get_or_load("k", lambda: "v1", version=1) for cache in caches] == ["v1", "v1"]
+    assert caches[1].get_or_load("k", lambda: "unused", version=1) == "v1"
+
+    caches[0].invalidate()
+    assert [cache.get_or_load("k", lambda: "v2", version=2) for cache in caches] == ["v2", "v2"]
+
+
+def test_zero_ttl_disables_caching():
+    cache = TTLCache("test", ttl_seconds=0)
+    cache.get_or_load("k", lambda: 1)
+    cache.get_or_load("k", lambda: 1)
+    assert cache.stats()["hits"] == 0
+
+
+def test_invalidates_decorator_drops_cache_after_write():
+    cache = TTLCache("test", ttl_seconds=60)
+    cache.get_or_load("k", lambda: 1)
+
+    @invalidates(cache)
+    def write():
+        return "done"
+
+    assert write() == "done"
+    assert cache.stats()["entries"] == 0
+
+
+class CounterSession:
+    def __init__(self):
+        self.version = 0
+        self.reads = []
+
+    def scalar(self, statement, params):
+        self.reads.append(params["resource"])
+        return self.version
+
+
+def test_resource_version_etag_follows_the_database_counter(monkeypatch):
+    session = CounterSession()
+    version = ResourceVersion("test")
+    etag = version.etag(session)
+    assert version.etag(session) == etag
+    assert session.reads == ["test", "test"]
+
+    session.version = 3
+    assert version.etag(session) != etag
+
+    monkeypatch.setattr(settings, "ETAGS", False)
+    assert version.etag(session) is None
+
+
+def test_etag_matching():
+    assert etag_matches('"a", W/"b"', '"b"')
+    assert etag_matches("*", '"a"')
+    assert not etag_matches('"a"', '"b"')
+    assert not etag_matches(None, '"a"')
@@ -0,0 +1,56 @@
+import uuid
+
+import pytest
+
+from src.domain.exceptions import ValidationError
+from src.domain.game import WinState
+from src.services.game_service import GameService
+from src.services.rating_engine import EloRatingEngine, FixedRatingEngine
+
+
+class FakeRecordingRepository:
+    def __init__(self, players=None):
+        # player_id -> (rating, rated games)
+        self.players = players or {}
+        self.recorded = []
+
+    def get_rating_inputs(self, player_ids, for_update=False):
+        return {p: self.players[p] for p in player_ids if p in self.players}
+
+    def record_game_with_ratings(self, game, white_change, black_change):
+        self.recorded.append((game, white_change, black_change))
+
+
+def test_record_game_result_applies_rating_changes():
+    repo = FakeRecordingRepository()
+    white, black = uuid.uuid4(), uuid.uuid4()
+
+    game = GameService(repo, FixedRatingEngine()).record_game_result(
+        str(uuid.uuid4()), str(white), str(black), WinState.BLACK_WIN
+    )
+
+    assert repo.recorded == [(game, -9, 10)]
+    assert (game.player_white_id, game.player_black_id) == (white, black)
+    assert game.played_at is not None
+
+
+def test_record_game_result_reads_ratings_for_elo():
+    white, black = uuid.uuid4(), uuid.uuid4()
+    repo = FakeRecordingRepository({white: (1500, 50), black: (1500, 50)})
+
+    GameService(repo, EloRatingEngine()).record_game_result(
+        str(uuid.uuid4()), str(white), str(black), WinState.WHITE_WIN
+    )
+
+    assert [(w, b) for _, w, b in repo.recorded] == [(10, -10)]
+
+
+def test_record_game_result_rejects_bad_players():
+    repo = FakeRecordingRepository()
+    service = GameService(repo, FixedRatingEngine())
+    same = str(uuid.uuid4())
+    with pytest.raises(ValidationError):
+        service.record_game_result(str(uuid.uuid4()), same, same, WinState.DRAW)
+    with pytest.raises(ValidationError):
+        service.record_game_result(str(uuid.uuid4()), "not-a-uuid", same, WinState.DRAW)
+    assert repo.recorded == []
@@ -0,0 +1,53 @@
+import pytest
+
+from src.domain.game import WinState
+from src.services.knockout_bracket import next_round, seed_first_round, seed_order
+
+
+def test_seed_order_keeps_top_seeds_apart():
+    assert seed_order(8).tolist() == [1, 8, 4, 5, 2, 7, 3, 6]
+    order = seed_order(1 << 16)
+    # Seed s meets seed N + 1 - s in the first round
+    assert ((order[0::2] + order[1::2]) == (1 << 16) + 1).all()
+
+
+def test_top_seeds_get_the_byes():
+    # Entrant index 4 has the best rating, then 3, 2, 1, 0
+    white, black = seed_first_round([1500, 1600, 1700, 1800, 1900])
+    assert white.tolist() == [4, 1, 3, 2]
+    assert black.tolist() == [-1, 0, -1, -1]
+
+
+def test_every_entrant_is_placed_once():
+    ratings = list(range(1000, 1000 + 45_000))
+    white, black = seed_first_round(ratings)
+    placed = sorted(white.tolist() + [i for i in black.tolist() if i >= 0])
+    assert placed == list(range(len(ratings)))
+    assert (black < 0).sum() == (1 << 16) - len(ratings)
+
+
+def test_needs_two_entrants():
+    with pytest.raises(ValueError):
+        seed_first_round([1500])
+
+
+def test_next_round_pairs_neighbouring_slot_winners():
+    white, black = next_round(
+        ["a", "c", "e", "g"],
+        ["b", None, "f", "h"],
+        [WinState.BLACK_WIN, WinState.WHITE_WIN, WinState.WHITE_WIN, WinState.BLACK_WIN],
+    )
+    assert (white, black) == (["b", "e"], ["c", "h"])
+
+
+@pytest.mark.parametrize(
+    "results",
+    [
+        [WinState.WHITE_WIN, WinState.DRAW],
+        [WinState.WHITE_WIN, None],
+        [WinState.WHITE_WIN],
+    ],
+)
+def test_next_round_needs_a_winner_in_every_slot(results):
+    with pytest.raises(ValueError):
+        next_round(["a", "c"][: len(results)], ["b", "d"][: len(results)], results)
@@ -0,0 +1,31 @@
+from src.db.query_profiler import ProfiledQueryStats, QueryProfiler, fingerprint
+from src.settings import settings
+
+
+def test_fingerprint_redacts_literals_and_collapses_in_lists():
+    statement = (
+        "SELECT * FROM players WHERE last_name = 'O''Brien'\n"
+        "  AND rating > 1500 AND player_id IN (%(player_id_1_1)s, %(player_id_1_2)s)"
+    )
+    assert fingerprint(statement) == (
+        "SELECT * FROM players WHERE last_name = ? AND rating > ? AND player_id IN (...)"
+    )
+
+
+def test_repeated_statement_shape_is_reported_as_n_plus_one(monkeypatch):
+    monkeypatch.setattr(settings, "SQL_N_PLUS_ONE_THRESHOLD", 3)
+    profiler = QueryProfiler()
+    stats = ProfiledQueryStats({"method": "GET"}, slow_seconds=1.0)
+    stats.observe("SELECT * FROM games", 0.001)
+    for size in (1, 2, 3):
+        # Different IN-list lengths are still the same shape
+        placeholders = ", ".join(f"%(id_1_{i})s" for i in range(size))
+        stats.observe(f"SELECT * FROM players WHERE player_id IN ({placeholders})", 0.001)
+
+    profiler.finish("GET", "/games/all", stats)
+
+    snapshot = profiler.snapshot()
+    assert (snapshot["requests_profiled"], snapshot["n_plus_one_requests"]) == (1, 1)
+    [finding] = snapshot["recent_findings"]
+    assert finding["statement"] == "SELECT * FROM players WHERE player_id IN (...)"
+    assert (finding["executions"], finding["request_statements"]) == (3, 4)
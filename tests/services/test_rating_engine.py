@@ -0,0 +1,54 @@
+import numpy as np
+
+from src.domain.game import WinState
+from src.services.rating_engine import (
+    EloRatingEngine,
+    FixedRatingEngine,
+    rating_changes,
+    replay_games,
+)
+
+
+def test_fixed_engine_keeps_original_changes():
+    engine = FixedRatingEngine()
+    assert rating_changes(engine, WinState.WHITE_WIN) == (10, -9)
+    assert rating_changes(engine, WinState.BLACK_WIN) == (-9, 10)
+    assert rating_changes(engine, WinState.DRAW) == (1, 1)
+
+
+def test_elo_equal_players_split_k():
+    engine = EloRatingEngine()
+    assert rating_changes(engine, WinState.WHITE_WIN, 1500, 1500, 50, 50) == (10, -10)
+    assert rating_changes(engine, WinState.DRAW, 1500, 1500, 50, 50) == (0, 0)
+
+
+def test_elo_k_factor_bands():
+    engine = EloRatingEngine()
+    ks = engine.k_factor(np.array([1500, 2400, 2600, 2600]), np.array([5, 40, 40, 10]))
+    assert ks.tolist() == [40, 10, 10, 40]
+
+
+def test_replay_matches_game_by_game():
+    rng = np.random.default_rng(7)
+    players, games = 12, 500
+    white = rng.integers(0, players, games)
+    black = (white + rng.integers(1, players, games)) % players
+    scores = rng.choice([0.0, 0.5, 1.0], games)
+    start = rng.integers(1200, 2600, players)
+    engine = EloRatingEngine()
+
+    ratings, played = replay_games(engine, start, np.zeros(players, np.int64), white, black, scores)
+
+    expected = start.astype(np.int64).copy()
+    expected_played = np.zeros(players, np.int64)
+    for w, b, s in zip(white, black, scores):
+        dw, db = engine.changes(
+            expected[[w]], expected[[b]], expected_played[[w]], expected_played[[b]], np.array([s])
+        )
+        expected[w] += dw[0]
+        expected[b] += db[0]
+        expected_played[w] += 1
+        expected_played[b] += 1
+
+    assert ratings.tolist() == expected.tolist()
+    assert played.tolist() == expected_played.tolist()
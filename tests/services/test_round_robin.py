@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from src.services.round_robin import berger_schedule
+
+
+def rounds_as_text(n):
+    round_numbers, white, black = berger_schedule(n)
+    return [
+        " ".join(f"{w + 1}-{b + 1}" for w, b in zip(white[round_numbers == r], black[round_numbers == r]))
+        for r in range(1, round_numbers.max() + 1)
+    ]
+
+
+def test_matches_the_published_berger_table():
+    assert rounds_as_text(6) == ["1-6 2-5 3-4", "6-4 5-3 1-2", "2-6 3-1 4-5", "6-5 1-4 2-3", "3-6 4-2 5-1"]
+
+
+@pytest.mark.parametrize("n", [2, 7, 10, 101])
+def test_everyone_meets_once_per_cycle_with_balanced_colors(n):
+    round_numbers, white, black = berger_schedule(n, double=True)
+    pairs = list(zip(np.minimum(white, black).tolist(), np.maximum(white, black).tolist()))
+    assert len(pairs) == n * (n - 1)
+    assert len(set(pairs)) == n * (n - 1) // 2
+    for r in np.unique(round_numbers):
+        seated = np.concatenate([white[round_numbers == r], black[round_numbers == r]])
+        assert len(np.unique(seated)) == len(seated)
+    # The second cycle swaps colors, so double round-robins balance exactly
+    assert (np.bincount(white, minlength=n) == np.bincount(black, minlength=n)).all()
+
+
+def test_odd_field_leaves_out_the_byes():
+    round_numbers, white, black = berger_schedule(5)
+    assert round_numbers.max() == 5
+    assert len(white) == 10
+    assert max(white.max(), black.max()) == 4
@@ -0,0 +1,38 @@
+from src.services.skill_level_classifier import SkillLevelClassifier
+
+
+def make_classifier():
+    return SkillLevelClassifier(
+        [
+            ("Master", 2200, 4000),
+            ("Beginner", 0, 1199),
+            ("Advanced", 1800, 2199),
+            ("Intermediate", 1200, 1699),  # 1700..1799 is a gap
+        ]
+    )
+
+
+def test_classifies_inclusive_bounds():
+    classifier = make_classifier()
+    assert classifier.classify(0) == "Beginner"
+    assert classifier.classify(1199) == "Beginner"
+    assert classifier.classify(1200) == "Intermediate"
+    assert classifier.classify(2199) == "Advanced"
+    assert classifier.classify(4000) == "Master"
+
+
+def test_unclassified_ratings_are_none():
+    classifier = make_classifier()
+    assert classifier.classify_many([1750, 4001, -1, None]) == [None, None, None, None]
+
+
+def test_overlapping_levels_prefer_highest_lower_bound():
+    classifier = SkillLevelClassifier([("Wide", 0, 3000), ("Narrow", 1000, 1500)])
+    assert classifier.classify(1200) == "Narrow"
+    # Past Narrow's upper bound the walk falls back to the wide level
+    assert classifier.classify(2000) == "Wide"
+    assert classifier.classify(500) == "Wide"
+
+
+def test_empty_classifier():
+    assert SkillLevelClassifier([]).classify(1500) is None
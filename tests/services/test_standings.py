@@ -0,0 +1,70 @@
+from src.services.standings import compute_standings
+
+_SCORES = {"1-0": (2, 0), "0-1": (0, 2), "1/2": (1, 1), None: (-1, -1)}
+
+
+def standings_for(players, games):
+    """Standings keyed by player name, from ``(white, black, result)`` games."""
+    index = {player: i for i, player in enumerate(players)}
+    opponents = [[] for _ in players]
+    scores = [[] for _ in players]
+    for white, black, result in games:
+        if black is None:
+            opponents[index[white]].append(-1)
+            scores[index[white]].append(2)
+            continue
+        white_score, black_score = _SCORES[result]
+        opponents[index[white]].append(index[black])
+        scores[index[white]].append(white_score)
+        opponents[index[black]].append(index[white])
+        scores[index[black]].append(black_score)
+    standings = compute_standings(opponents, scores)
+    for standing in standings:
+        standing["player"] = players[standing.pop("index")]
+    return standings
+
+
+def by_player(standings):
+    return {standing["player"]: standing for standing in standings}
+
+
+def test_points_buchholz_and_sonneborn_berger():
+    standings = standings_for("abcd", [
+        ("a", "b", "1-0"),
+        ("c", "d", "1/2"),
+        ("a", "c", "1/2"),
+        ("b", "d", "0-1"),
+    ])
+    assert [s["player"] for s in standings] == ["a", "d", "c", "b"]
+    a, c = by_player(standings)["a"], by_player(standings)["c"]
+    assert a["points"] == 1.5 and a["wins"] == 1 and a["draws"] == 1
+    # a met b (0) and c (1)
+    assert a["buchholz"] == 1.0
+    assert a["buchholz_cut1"] == 1.0
+    assert a["sonneborn_berger"] == 0.5
+    # c met d (1.5) and a (1.5), drawing both
+    assert c["buchholz"] == 3.0 and c["buchholz_cut1"] == 1.5
+    assert c["sonneborn_berger"] == 1.5
+
+
+def test_direct_encounter_breaks_remaining_ties_and_level_players_share_rank():
+    standings = standings_for("abcd", [("a", "b", "0-1"), ("c", "d", "1/2")])
+    ranked = [(s["rank"], s["player"]) for s in standings]
+    assert ranked == [(1, "b"), (2, "c"), (2, "d"), (4, "a")]
+    assert by_player(standings)["b"]["direct_encounter"] == 0.0
+
+    # a, c and f are level on everything else; only a and c drew each other
+    standings = standings_for("abcdf", [("a", "c", "1/2"), ("d", "f", "1/2"), ("b", "d", "1-0")])
+    ranked = [(s["rank"], s["player"]) for s in standings]
+    assert ranked == [(1, "b"), (2, "d"), (3, "a"), (3, "c"), (5, "f")]
+    assert by_player(standings)["a"]["direct_encounter"] == 0.5
+
+
+def test_byes_and_undecided_games():
+    standings = by_player(standings_for("abc", [("a", None, None), ("b", "c", None)]))
+    assert standings["a"]["points"] == 1.0 and standings["a"]["buchholz"] == 0.0
+    assert standings["b"]["games_played"] == 0 and standings["b"]["points"] == 0.0
+
+
+def test_no_games():
+    assert compute_standings([], []) == []
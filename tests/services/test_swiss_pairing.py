@@ -0,0 +1,51 @@
+import random
+
+import pytest
+
+from src.domain.game import WinState
+from src.services.swiss_pairing import SwissField, pair_swiss_round
+
+
+def play_rounds(n, rounds, seed=0):
+    rng = random.Random(seed)
+    ids = list(range(n))
+    ratings = [rng.randint(1000, 2600) for _ in ids]
+    games = []
+    for _ in range(rounds):
+        field = SwissField.from_games(ids, ratings, games)
+        pairing = pair_swiss_round(field)
+        for white, black in pairing.pairs:
+            assert not field.played[white, black]
+            games.append((white, black, rng.choice(list(WinState))))
+        if pairing.bye is not None:
+            games.append((pairing.bye, None, WinState.WHITE_WIN))
+        seated = [p for pair in pairing.pairs for p in pair] + [pairing.bye] * (pairing.bye is not None)
+        assert sorted(seated) == ids
+    return SwissField.from_games(ids, ratings, games)
+
+
+def test_first_round_pairs_top_half_against_bottom_half():
+    field = SwissField.from_games(list("abcd"), [2400, 2300, 2200, 2100], [])
+    pairing = pair_swiss_round(field)
+    assert [set(pair) for pair in pairing.pairs] == [{0, 2}, {1, 3}]
+    assert pairing.bye is None
+
+
+def test_no_rematches_and_colors_stay_balanced():
+    field = play_rounds(301, 9)
+    assert abs(field.color_balance).max() <= 2
+    assert abs(field.color_streak).max() <= 2
+    # Odd field: a different player sits out each round
+    assert field.had_bye.sum() == 9
+
+
+def test_small_field_completes_a_full_round_robin():
+    field = play_rounds(6, 5)
+    assert field.played.sum() == 6 * 5
+
+
+def test_exhausted_field_raises():
+    ids = [0, 1]
+    field = SwissField.from_games(ids, [1500, 1500], [(0, 1, WinState.DRAW)])
+    with pytest.raises(ValueError):
+        pair_swiss_round(field)
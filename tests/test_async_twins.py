@@ -0,0 +1,71 @@
+from fastapi import APIRouter, Depends, FastAPI, Response
+from fastapi.testclient import TestClient
+
+from src.api.async_twins import async_twin
+from src.api.pagination import PageParams
+from src.db.dependencies import get_async_db, get_db
+
+
+class FakeAsyncSession:
+    """Hands run_sync a marker in place of the sync session behind an AsyncSession."""
+
+    async def run_sync(self, operation):
+        return operation("sync-session")
+
+
+router = APIRouter(prefix="/items")
+
+
+def get_repository(db=Depends(get_db)):
+    return ("repository", db)
+
+
+def get_service(repo=Depends(get_repository), db=Depends(get_db)):
+    return {"repository": list(repo), "db": db}
+
+
+@router.get("/{item_id}", status_code=202)
+def get_item(item_id: int, page: PageParams = Depends(), svc=Depends(get_service)):
+    return {"item_id": item_id, "limit": page.limit, "service": svc}
+
+
+def tag_response(response: Response, db=Depends(get_db)):
+    response.headers["X-Session"] = db
+
+
+@router.get("/tagged/list", dependencies=[Depends(tag_response)])
+def tagged_items():
+    return []
+
+
+@router.get("/skipped/stream")
+def stream_items(svc=Depends(get_service)):
+    return "sync"
+
+
+def twin_client() -> TestClient:
+    app = FastAPI()
+    app.include_router(async_twin(router, skip={stream_items}))
+    app.dependency_overrides[get_async_db] = FakeAsyncSession
+    app.dependency_overrides[get_db] = lambda: "sync-pool"
+    return TestClient(app)
+
+
+def test_twin_runs_the_sync_handler_with_services_built_on_the_sync_session():
+    resp = twin_client().get("/items/7?limit=3")
+    assert resp.status_code == 202
+    assert resp.json() == {
+        "item_id": 7,
+        "limit": 3,
+        "service": {"repository": ["repository", "sync-session"], "db": "sync-session"},
+    }
+
+
+def test_skipped_handlers_get_no_twin():
+    assert twin_client().get("/items/skipped/stream").status_code == 404
+
+
+def test_route_dependencies_on_get_db_run_on_the_async_session():
+    resp = twin_client().get("/items/tagged/list")
+    assert resp.status_code == 200
+    assert resp.headers["X-Session"] == "sync-session"
@@ -0,0 +1,65 @@
+import pytest
+
+from benchmarks.endpoints import MIN_REGRESSION_MS, main, regressions
+
+
+def result(p50_ms=10.0, throughput_rps=100.0, peak_rss_mb=200.0, errors=None):
+    return {
+        "p50_ms": p50_ms,
+        "p95_ms": p50_ms,
+        "p99_ms": p50_ms,
+        "throughput_rps": throughput_rps,
+        "peak_rss_mb": peak_rss_mb,
+        "errors": errors or {},
+    }
+
+
+def report(**cases):
+    return {"datasets": {"1000": cases}}
+
+
+def test_regressions_flag_only_changes_beyond_the_threshold():
+    baseline = report(a=result(), b=result(), c=result(), d=result())
+    current = report(
+        a=result(p50_ms=11.0),
+        b=result(p50_ms=12.0),
+        c=result(throughput_rps=80.0, peak_rss_mb=260.0),
+        d=result(errors={"500": 1}),
+    )
+
+    found, unmatched = regressions(baseline, current, threshold=0.15)
+
+    assert unmatched == []
+    assert [line.split(": ", 1)[1] for line in found] == [
+        "p50_ms 10.00 -> 12.00",
+        "p95_ms 10.00 -> 12.00",
+        "p99_ms 10.00 -> 12.00",
+        "throughput_rps 100.0 -> 80.0",
+        "peak_rss_mb 200.0 -> 260.0",
+        "errors {} -> {'500': 1}",
+    ]
+    assert [line.split(":")[0].split()[1] for line in found] == ["b", "b", "b", "c", "c", "d"]
+
+
+def test_regressions_ignore_latency_changes_below_the_noise_floor():
+    # Doubled, but by less than MIN_REGRESSION_MS
+    small = MIN_REGRESSION_MS * 0.8
+    found, _ = regressions(report(a=result(p50_ms=small)), report(a=result(p50_ms=2 * small)), threshold=0.15)
+    assert found == []
+
+    found, _ = regressions(report(a=result(p50_ms=1.0)), report(a=result(p50_ms=1.0 + MIN_REGRESSION_MS)), 0.15)
+    assert len(found) == 3
+
+
+def test_regressions_list_cases_only_one_run_has():
+    found, unmatched = regressions(report(a=result()), report(b=result()), threshold=0.15)
+
+    assert found == []
+    assert unmatched == ["    1000 a: only in the baseline run", "    1000 b: only in the current run"]
+
+
+@pytest.mark.parametrize("option", ["--requests", "--concurrency"])
+def test_run_rejects_fewer_than_one(option, capsys):
+    with pytest.raises(SystemExit):
+        main(["run", option, "0"])
+    assert "must be at least 1" in capsys.readouterr().err
@@ -0,0 +1,235 @@
+import csv
+import io
+import json
+import uuid
+from collections import namedtuple
+from datetime import datetime, timezone
+
+from fastapi.testclient import TestClient
+
+from src.api.game_endpoints import get_game_service
+from src.domain.game import WinState
+from src.main import app
+from src.services.game_service import GameService
+from src.settings import settings
+
+
+class ExportRow:
+    """Stands in for a sqlalchemy Row, which export reads through ``_mapping``."""
+
+    def __init__(self, **values):
+        self._mapping = values
+
+
+def export_row(result=WinState.WHITE_WIN, played_at=datetime(2024, 5, 1, 18, 30), black=True):
+    return ExportRow(
+        game_id=uuid.uuid4(),
+        tournament_id=uuid.uuid4(),
+        player_white_id=uuid.uuid4(),
+        player_black_id=uuid.uuid4() if black else None,
+        result=result,
+        played_at=played_at,
+    )
+
+
+class FakeGameRepository:
+    def __init__(self, batches=()):
+        self.batches = list(batches)
+        self.stream_calls = []
+
+    def stream_games(self, tournament_id, player_id, played_from, played_to):
+        self.stream_calls.append((tournament_id, player_id, played_from, played_to))
+        return iter(self.batches)
+
+
+def client_for(repo):
+    app.dependency_overrides[get_game_service] = lambda: GameService(repo)
+    return TestClient(app)
+
+
+def teardown_function():
+    app.dependency_overrides.clear()
+
+
+def test_export_ndjson_writes_one_plain_object_per_row():
+    rows = [export_row(), export_row(WinState.DRAW, None, black=False)]
+    repo = FakeGameRepository([rows[:1], rows[1:]])
+
+    resp = client_for(repo).get("/games/export")
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/x-ndjson"
+    assert resp.headers["content-disposition"] == 'attachment; filename="games.ndjson"'
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert lines[0] == {
+        "game_id": str(rows[0]._mapping["game_id"]),
+        "tournament_id": str(rows[0]._mapping["tournament_id"]),
+        "player_white_id": str(rows[0]._mapping["player_white_id"]),
+        "player_black_id": str(rows[0]._mapping["player_black_id"]),
+        "result": "WHITE_WIN",
+        "played_at": "2024-05-01T18:30:00",
+    }
+    assert lines[1]["result"] == "DRAW"
+    assert lines[1]["player_black_id"] is None
+    assert lines[1]["played_at"] is None
+
+
+def test_export_csv_has_header_and_blank_nulls():
+    row = export_row(WinState.BLACK_WIN, None, black=False)
+    repo = FakeGameRepository([[row]])
+
+    resp = client_for(repo).get("/games/export", params={"format": "csv"})
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/csv")
+    header, line = list(csv.reader(io.StringIO(resp.text)))
+    assert header == ["game_id", "tournament_id", "player_white_id", "player_black_id", "result", "played_at"]
+    assert line == [
+        str(row._mapping["game_id"]),
+        str(row._mapping["tournament_id"]),
+        str(row._mapping["player_white_id"]),
+        "",
+        "BLACK_WIN",
+        "",
+    ]
+
+
+def test_export_with_no_games_is_empty_or_header_only():
+    assert client_for(FakeGameRepository()).get("/games/export").text == ""
+    csv_text = client_for(FakeGameRepository()).get("/games/export", params={"format": "csv"}).text
+    assert csv_text.splitlines() == ["game_id,tournament_id,player_white_id,player_black_id,result,played_at"]
+
+
+def test_export_passes_filters_and_rejects_inverted_range():
+    repo = FakeGameRepository()
+    client = client_for(repo)
+    tournament_id = uuid.uuid4()
+
+    client.get(
+        "/games/export",
+        params={"tournament_id": str(tournament_id), "played_from": "2024-01-01T00:00:00"},
+    )
+    assert repo.stream_calls == [(tournament_id, None, datetime(2024, 1, 1), None)]
+
+    resp = client.get(
+        "/games/export",
+        params={"played_from": "2024-02-01T00:00:00", "played_to": "2024-01-01T00:00:00"},
+    )
+    assert resp.status_code == 400
+    assert len(repo.stream_calls) == 1
+
+
+class FakeBracketService:
+    def __init__(self):
+        self.calls = []
+
+    def generate_match_bracket(self, tournament_id, player_ids):
+        self.calls.append((tournament_id, player_ids))
+        return {"tournament_id": tournament_id, "games": 1, "byes": 1}
+
+
+def test_get_bracket_seeds_only_the_named_entrants():
+    svc = FakeBracketService()
+    app.dependency_overrides[get_game_service] = lambda: svc
+    client = TestClient(app)
+    tournament_id, entrants = uuid.uuid4(), [uuid.uuid4() for _ in range(3)]
+
+    resp = client.get(
+        f"/games/generate-tournament-bracket/{tournament_id}",
+        params={"player_ids": [str(p) for p in entrants]},
+    )
+
+    assert resp.status_code == 200
+    assert resp.json() == f"Generated 1 games and 1 byes for tournament {tournament_id}"
+    assert svc.calls == [(tournament_id, entrants)]
+    # No silent fallback to every player in the database: point at the POST
+    resp = client.get(f"/games/generate-tournament-bracket/{tournament_id}")
+    assert resp.status_code == 400
+    assert "POST" in resp.json()["detail"]
+    assert len(svc.calls) == 1
+
+
+def test_get_bracket_is_deprecated_in_the_schema():
+    paths = TestClient(app).get("/openapi.json").json()["paths"]
+    route = paths["/games/generate-tournament-bracket/{tournament_id}"]
+    assert route["get"]["deprecated"] is True
+    assert "deprecated" not in route["post"]
+
+
+class CapturingGameService:
+    def __init__(self):
+        self.games = []
+
+    def add_game_with_ratings(self, game):
+        self.games.append(game)
+        return "Added"
+
+
+def test_clients_cannot_claim_a_bracket_slot():
+    svc = CapturingGameService()
+    app.dependency_overrides[get_game_service] = lambda: svc
+
+    resp = TestClient(app).post(
+        "/games/add",
+        json={"tournament_id": str(uuid.uuid4()), "round_number": 1, "slot": 0},
+    )
+
+    assert resp.status_code == 200
+    [game] = svc.games
+    assert (game.round_number, game.slot) == (None, None)
+
+
+# GameRepository._GAME_READ_COLUMNS, in its order
+GameRow = namedtuple(
+    "GameRow",
+    [
+        "tournament_id",
+        "result",
+        "played_at",
+        "player_white_id",
+        "player_black_id",
+        "game_id",
+        "round_number",
+        "slot",
+    ],
+)
+
+
+class FakeListGameService:
+    def __init__(self):
+        tournament_id = uuid.uuid4()
+        self.rows = [
+            GameRow(
+                tournament_id,
+                WinState.WHITE_WIN,
+                datetime(2024, 5, 1, 18, 30, 0, 123456, tzinfo=timezone.utc),
+                uuid.uuid4(),
+                uuid.uuid4(),
+                uuid.uuid4(),
+                1,
+                0,
+            ),
+            GameRow(tournament_id, WinState.DRAW, datetime(2024, 5, 2, 9, 0), uuid.uuid4(), None, uuid.uuid4(), None, None),
+            GameRow(tournament_id, None, None, uuid.uuid4(), uuid.uuid4(), uuid.uuid4(), 2, 1),
+        ]
+
+    def get_games_page(self, limit, cursor=None):
+        return [row._asdict() for row in self.rows[:limit]], None
+
+    def get_game_rows_page(self, limit, cursor=None):
+        return self.rows[:limit], None
+
+
+def test_fast_json_games_match_the_response_model_path(monkeypatch):
+    svc = FakeListGameService()
+    app.dependency_overrides[get_game_service] = lambda: svc
+    client = TestClient(app)
+
+    model = client.get("/games/all")
+    monkeypatch.setattr(settings, "FAST_JSON_LISTS", True)
+    fast = client.get("/games/all")
+
+    assert fast.status_code == 200
+    assert fast.content == model.content
+    assert b'"result":"WHITE_WIN"' in fast.content
+    assert b'"played_at":"2024-05-01T18:30:00.123456Z"' in fast.content
@@ -1,10 +1,16 @@
 import uuid
+from collections import namedtuple
 from fastapi.testclient import TestClient
 
 from src import main as app_module
 from src.main import app
 from src.api.player_endpoints import get_player_service
+from src.db.dependencies import get_db
 from src.domain.exceptions import NotFoundError, ValidationError, ConflictError
+from src.repositories.pagination import DEFAULT_PAGE_SIZE
+from src.settings import settings
+
+PlayerRow = namedtuple("PlayerRow", ["player_id", "first_name", "last_name", "rating"])
 
 
 class FakePlayerService:
@@ -27,6 +33,15 @@ class FakePlayerService:
             }
         ]
 
+    def get_page(self, limit, cursor=None):
+        return self.get_all()[:limit], "next-page" if cursor is None else None
+
+    def get_all_rows(self):
+        return [PlayerRow(**player) for player in self.get_all()]
+
+    def get_rows_page(self, limit, cursor=None):
+        return self.get_all_rows()[:limit], "next-page" if cursor is None else None
+
     def get_by_first_name(self, first_name):
         return self.get_all()
 
@@ -97,8 +112,8 @@ class FakeGamePlayerService:
     def create_game_player(self, db, dto):
         return self.sample
 
-    def get_all_game_players(self, db):
-        return [self.sample]
+    def get_game_players_page(self, db, limit, cursor=None):
+        return [self.sample], None
 
     def delete_game_player(self, db, game_id, player_id):
         # return truthy for success, falsy for not found
@@ -107,8 +122,21 @@ class FakeGamePlayerService:
         return False
 
 
+class VersionSession:
+    """Stands in for the session the ETag dependency reads resource_versions through."""
+
+    version = 0
+
+    def scalar(self, statement, params):
+        return self.version
+
+
+version_session = VersionSession()
+
+
 def setup_player_override(svc):
     app.dependency_overrides[get_player_service] = lambda: svc
+    app.dependency_overrides[get_db] = lambda: version_session
 
 
 def clear_overrides():
@@ -135,6 +163,78 @@ def test_create_player_and_get_all():
     clear_overrides()
 
 
+def test_get_all_paginated_sets_next_cursor_header():
+    svc = FakePlayerService()
+    setup_player_override(svc)
+    client = TestClient(app)
+
+    resp = client.get("/players/search/all?limit=1")
+    assert resp.status_code == 200
+    assert len(resp.json()) == 1
+    assert resp.headers["X-Next-Cursor"] == "next-page"
+
+    resp = client.get("/players/search/all?limit=1&cursor=next-page")
+    assert resp.status_code == 200
+    assert "X-Next-Cursor" not in resp.headers
+
+    resp = client.get("/players/search/all?limit=0")
+    assert resp.status_code == 422
+    clear_overrides()
+
+
+def test_list_without_limit_returns_the_first_default_page():
+    svc = FakePlayerService()
+    pages = []
+    get_page = svc.get_page
+    svc.get_page = lambda limit, cursor=None: pages.append((limit, cursor)) or get_page(limit, cursor)
+    setup_player_override(svc)
+
+    resp = TestClient(app).get("/players/search/all")
+
+    assert resp.status_code == 200
+    assert pages == [(DEFAULT_PAGE_SIZE, None)]
+    assert resp.headers["X-Next-Cursor"] == "next-page"
+    clear_overrides()
+
+
+def test_fast_json_lists_match_the_response_model_path(monkeypatch):
+    svc = FakePlayerService()
+    setup_player_override(svc)
+    client = TestClient(app)
+
+    model = client.get("/players/search/all?limit=1")
+    monkeypatch.setattr(settings, "FAST_JSON_LISTS", True)
+    fast = client.get("/players/search/all?limit=1")
+    assert fast.status_code == 200
+    assert fast.content == model.content
+    assert fast.headers["X-Next-Cursor"] == "next-page"
+    assert fast.headers["ETag"] == model.headers["ETag"]
+    clear_overrides()
+
+
+def test_get_all_answers_304_until_players_change():
+    svc = FakePlayerService()
+    calls = []
+    get_all = svc.get_all
+    svc.get_all = lambda: calls.append(1) or get_all()
+    setup_player_override(svc)
+    client = TestClient(app)
+
+    resp = client.get("/players/search/all")
+    etag = resp.headers["ETag"]
+    resp = client.get("/players/search/all", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.headers["ETag"] == etag
+    assert len(calls) == 1
+
+    # A committed write to players moves the database counter
+    version_session.version += 1
+    resp = client.get("/players/search/all", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.headers["ETag"] != etag
+    clear_overrides()
+
+
 def test_replace_player_returns_id():
     svc = FakePlayerService()
     setup_player_override(svc)
@@ -316,3 +416,16 @@ def test_replace_player_conflict_returns_409():
     clear_overrides()
 
 
+
+
+def test_metrics_count_requests_by_route_template():
+    svc = FakePlayerService()
+    setup_player_override(svc)
+    client = TestClient(app)
+    client.get(f"/players/search/by-id?player_id={svc._id}")
+    client.get("/no/such/route")
+    body = client.get("/metrics").text
+    assert 'http_requests_total{method="GET",route="/players/search/by-id",status="200"}' in body
+    assert 'http_requests_total{method="GET",route="<unmatched>",status="404"}' in body
+    assert 'http_request_db_queries_count{method="GET",route="/players/search/by-id"}' in body
+    clear_overrides()